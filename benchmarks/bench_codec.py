@@ -0,0 +1,72 @@
+"""Telemetri çerçevesi çözme ölçümü: struct (TelemetryParser) ve NumPy (FrameDecoder)
+
+--records çerçevelik bir akış üretilir (--corrupt ile rastgele baytlar bozulur)
+ve farklı okuma boylarında beslenir. Üç yol karşılaştırılır:
+  * struct: TelemetryParser.feed, çerçeve başına unpack ve sağlama toplamı,
+  * numpy dizi: FrameDecoder.decode, tampon başına tek frombuffer (FRAME_DTYPE dizisi),
+  * numpy kayıt: FrameDecoder.feed, okuyucuların kullandığı yol; kısa okumalar
+    struct ile, uzunlar dizi + TelemetryRecord listesine dönüşümle çözülür.
+
+Kullanım: python benchmarks/bench_codec.py [--records 200000] [--chunks 1 8 64 4096] [--corrupt 0]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import numpy as np
+
+from telemetry_codec import FRAME_DTYPE, RECORD_FIELDS, FrameDecoder, encode_frames
+from telemetry_handler import CHANNELS, FRAME_SIZE, TelemetryParser
+
+
+def make_stream(count, corrupt):
+    rng = np.random.default_rng(0)
+    records = np.zeros(count, FRAME_DTYPE[RECORD_FIELDS])
+    records["seq"] = np.arange(count)
+    records["timestamp"] = np.arange(count) / 200
+    for channel in CHANNELS:
+        records[channel] = rng.uniform(-100, 100, count)
+    data = bytearray(encode_frames(records))
+    random.seed(0)
+    for _ in range(corrupt):
+        data[random.randrange(len(data))] ^= 0xFF
+    return bytes(data)
+
+
+def measure(decoder_factory, method, data, chunk_bytes):
+    decoder = decoder_factory()
+    feed = getattr(decoder, method)
+    chunks = [data[i:i + chunk_bytes] for i in range(0, len(data), chunk_bytes)]
+    decoded = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        decoded += len(feed(chunk))
+    return time.perf_counter() - start, decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1, 8, 64, 4096],
+                        help="Okuma başına çerçeve sayısı")
+    parser.add_argument("--corrupt", type=int, default=0, help="Bozulacak bayt sayısı")
+    args = parser.parse_args()
+
+    data = make_stream(args.records, args.corrupt)
+    print(f"{args.records} çerçeve ({len(data) / 1e6:.1f} MB), {args.corrupt} bozuk bayt")
+    paths = (("struct", TelemetryParser, "feed"), ("numpy dizi", FrameDecoder, "decode"),
+             ("numpy kayıt", FrameDecoder, "feed"))
+    for frames in args.chunks:
+        results = []
+        for name, factory, method in paths:
+            elapsed, decoded = measure(factory, method, data, frames * FRAME_SIZE)
+            results.append(f"{name} {elapsed / decoded * 1e6:.2f} µs/kayıt ({decoded / elapsed / 1e3:.0f} k/s)")
+        print(f"okuma başına {frames} çerçeve: " + " · ".join(results))
+
+
+if __name__ == "__main__":
+    main()
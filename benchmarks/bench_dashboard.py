@@ -0,0 +1,367 @@
+"""Panelin uçtan uca ölçümü: offscreen Qt altında gerçek taşımalarla
+
+Araç simülatörü (ui/vehicle_simulator.py) ayrı süreçte başlar; panel
+telemetriyi ve komutları socket:// ile, kamera karelerini MJPEG/HTTP ile
+alır. Her senaryo (telemetri hızı × çözünürlük × sayfa) temiz RSS ve tekil
+nesneler için kendi sürecinde, geçici QSettings ile çalışır; ısınmadan sonra
+--seconds boyunca gerçek olay döngüsünde ölçülür:
+  * widget sınıfı başına paintEvent süresi (QApplication.notify üzerinden),
+  * olay döngüsü gecikmesi (PROBE_MS'lik zamanlayıcının gecikmesi),
+  * kamera başına okunan, GUI almadan ezilen ve GUI'ye ulaşan kareler;
+    beklenen kareye (fps × süre) göre düşen kareler,
+  * telemetri: alınan ve sıra numarası boşluklarından kaybolan kayıtlar,
+  * saniyelik zaman serisi: RSS, döngü gecikmesi, çizim süresi, kare ve kayıt sayıları.
+Sonuçlar, derlemeleri karşılaştırmak için commit ve sürümlerle birlikte
+--output JSON dosyasına yazılır.
+
+Kullanım: python benchmarks/bench_dashboard.py [--rates 200 1000] [--resolutions 640x360 1280x720]
+          [--pages main drone] [--seconds 10] [--output bench_dashboard.json]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+UI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui")
+sys.path.insert(0, UI_DIR)
+
+import numpy as np
+from PySide6.QtCore import QEvent, QObject, QSettings, Qt, QTimer, __version__ as qt_version
+from PySide6.QtWidgets import QApplication, QWidget
+
+PAGES = {"main": 0, "drone": 1}
+PROBE_MS = 5  # Olay döngüsü gecikmesini ölçen zamanlayıcının aralığı
+
+
+def rss_mb():
+    """Sürecin anlık bellek kullanımı (Linux); okunamazsa tepe değer"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentiles(values, scale=1e3):
+    """Süre listesinin (s) ms cinsinden özeti"""
+    if not len(values):
+        return {"count": 0}
+    values = np.asarray(values) * scale
+    return {"count": len(values), "mean": round(float(values.mean()), 3),
+            "p50": round(float(np.percentile(values, 50)), 3),
+            "p99": round(float(np.percentile(values, 99)), 3), "max": round(float(values.max()), 3)}
+
+
+def free_ports(count):
+    sockets = [socket.create_server(("127.0.0.1", 0)) for _ in range(count)]
+    ports = [sock.getsockname()[1] for sock in sockets]
+    for sock in sockets:
+        sock.close()
+    return ports
+
+
+def wait_for_port(port, timeout):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def build_info():
+    """Karşılaştırma için derleme ve ortam bilgisi"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=UI_DIR, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    import cv2
+    return {"commit": commit, "python": platform.python_version(), "qt": qt_version, "opencv": cv2.__version__,
+            "numpy": np.__version__, "platform": platform.platform(), "cpus": os.cpu_count()}
+
+
+class ProfilingApplication(QApplication):
+    """Paint olaylarının teslim süresini alıcının sınıfına göre toplar
+
+    Qt çocuk widget'ları ayrı paint olaylarıyla çizdiği için süreler widget
+    başınadır, iç içe sayılmaz.
+    """
+
+    def __init__(self, argv):
+        super().__init__(argv)
+        self.recording = False
+        self.paint_times = defaultdict(list)
+
+    def notify(self, receiver, event):
+        if not self.recording or event.type() != QEvent.Paint:
+            return super().notify(receiver, event)
+        start = time.perf_counter()
+        result = super().notify(receiver, event)
+        self.paint_times[type(receiver).__name__].append(time.perf_counter() - start)
+        return result
+
+
+class TelemetryCounter:
+    """Okuyucu thread'inde kayıtları ve sıra numarası boşluklarını sayar"""
+
+    def __init__(self):
+        self.records = 0
+        self.lost = 0
+        self.last_seq = None
+
+    def on_records(self, records):
+        if self.last_seq is not None:
+            self.lost += records[-1].seq - self.last_seq - len(records)
+        self.last_seq = records[-1].seq
+        self.records += len(records)
+
+
+class Scenario(QObject):
+    """Isınma, ölçüm ve saniyelik örnekleme; bitince pencereyi kapatır"""
+
+    def __init__(self, app, window, args):
+        super().__init__()
+        self.app = app
+        self.window = window
+        self.args = args
+        self.telemetry = TelemetryCounter()
+        if window.telemetry_reader is not None:
+            window.telemetry_reader.add_sink(self.telemetry.on_records)
+        window.telemetry_bus.updated.connect(self.on_bus_updated)
+        self.bus_updates = 0
+        self.loop_delays = []
+        self.timeline = []
+        self.result = None
+
+        self.probe = QTimer(self)
+        self.probe.setTimerType(Qt.PreciseTimer)
+        self.probe.setInterval(PROBE_MS)
+        self.probe.timeout.connect(self.on_probe)
+        self.sampler = QTimer(self)
+        self.sampler.setInterval(1000)
+        self.sampler.timeout.connect(self.sample)
+
+    def start(self):
+        QTimer.singleShot(int(self.args.warmup * 1000), self.begin)
+
+    def streams(self):
+        from ulgen_ui_test import backend_modules
+        if "camera_handler" not in backend_modules.modules:
+            return {}
+        hub = backend_modules.modules["camera_handler"].CameraHub.instance()
+        return {source: stream for source, stream in hub.streams.items() if stream.active_subscribers}
+
+    def counters(self):
+        frames = {source: (stream.worker.frames, stream.worker.dropped) for source, stream in self.streams().items()}
+        return frames, self.telemetry.records, self.telemetry.lost, self.bus_updates
+
+    def begin(self):
+        self.app.paint_times.clear()
+        self.app.recording = True
+        self.started = self.last_sample_time = time.perf_counter()
+        self.baseline = self.last_sample = self.counters()
+        self.paint_seconds_seen = self.delays_seen = 0  # Önceki örneğe kadar sayılanlar
+        self.last_probe = self.started
+        self.timeline.append({"t": 0.0, "rss_mb": round(rss_mb(), 1)})
+        self.probe.start()
+        self.sampler.start()
+        QTimer.singleShot(int(self.args.seconds * 1000), self.finish)
+
+    def on_probe(self):
+        now = time.perf_counter()
+        self.loop_delays.append(max(0.0, now - self.last_probe - PROBE_MS / 1000))
+        self.last_probe = now
+
+    def on_bus_updated(self, values):
+        self.bus_updates += 1
+
+    def sample(self):
+        now = time.perf_counter()
+        frames, records, lost, updates = counters = self.counters()
+        last_frames, last_records, last_lost, last_updates = self.last_sample
+        paint_total = sum(sum(times) for times in self.app.paint_times.values())
+        window_delays = self.loop_delays[self.delays_seen:]
+        self.delays_seen = len(self.loop_delays)
+        elapsed = now - self.last_sample_time
+        self.timeline.append({
+            "t": round(now - self.started, 3),
+            "rss_mb": round(rss_mb(), 1),
+            "loop_delay_p99_ms": round(float(np.percentile(window_delays, 99)) * 1e3, 3) if window_delays else None,
+            "loop_delay_max_ms": round(max(window_delays) * 1e3, 3) if window_delays else None,
+            "paint_ms": round((paint_total - self.paint_seconds_seen) * 1e3, 3),
+            "frames_per_s": {str(source): round((count - last_frames.get(source, (count, 0))[0]) / elapsed, 1)
+                             for source, (count, _) in frames.items()},
+            "telemetry_per_s": round((records - last_records) / elapsed, 1),
+            "telemetry_lost": lost - last_lost,
+            "bus_updates_per_s": round((updates - last_updates) / elapsed, 1),
+        })
+        self.paint_seconds_seen = paint_total
+        self.last_sample = counters
+        self.last_sample_time = now
+
+    def finish(self):
+        self.probe.stop()
+        self.sampler.stop()
+        self.app.recording = False
+        elapsed = time.perf_counter() - self.started
+        frames, records, lost, updates = self.counters()
+        base_frames, base_records, base_lost, base_updates = self.baseline
+
+        cameras = {}
+        for source, (count, dropped) in frames.items():
+            start_count, start_dropped = base_frames.get(source, (0, 0))
+            captured, overwritten = count - start_count, dropped - start_dropped
+            expected = int(self.args.fps * elapsed)
+            cameras[str(source)] = {"expected": expected, "captured": captured, "overwritten": overwritten,
+                                    "delivered": captured - overwritten,
+                                    "dropped": max(0, expected - (captured - overwritten))}
+
+        paint = {name: dict(percentiles(times), total_ms=round(sum(times) * 1e3, 3))
+                 for name, times in self.app.paint_times.items()}
+        paint = dict(sorted(paint.items(), key=lambda item: -item[1]["total_ms"]))
+        self.result = {
+            "seconds": round(elapsed, 3),
+            "visible_widgets": sum(1 for widget in self.window.findChildren(QWidget) if widget.isVisible()),
+            "paint": paint,
+            "paint_ms_per_s": round(sum(item["total_ms"] for item in paint.values()) / elapsed, 3),
+            "loop_delay_ms": percentiles(self.loop_delays),
+            "cameras": cameras,
+            "frames_dropped": sum(camera["dropped"] for camera in cameras.values()),
+            "telemetry": {"expected": int(self.args.rate * elapsed), "received": records - base_records,
+                          "lost": lost - base_lost, "bus_updates": updates - base_updates},
+            "rss_mb": {"start": self.timeline[0]["rss_mb"], "end": round(rss_mb(), 1),
+                       "max": max(sample["rss_mb"] for sample in self.timeline)},
+            "timeline": self.timeline,
+        }
+        self.window.close()
+        QTimer.singleShot(0, self.app.quit)
+
+
+def run_scenario(args):
+    """Tek senaryo (alt süreç): simülatörü başlatır, paneli ölçer, sonucu dosyaya yazar"""
+    with tempfile.TemporaryDirectory(prefix="ulgen-bench-") as directory:
+        # Kullanıcının ayarları okunmaz ve değiştirilmez; kayıtlar geçici klasöre yazılır
+        QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, directory)
+        QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, directory)
+        settings = QSettings("ULGEN", "Dashboard")
+        settings.setValue("recorder/directory", os.path.join(directory, "flights"))
+        settings.setValue("recorder/enabled", args.recorder)
+        settings.sync()
+
+        telemetry_port, command_port, video_port = free_ports(3)
+        width, height = args.resolution
+        simulator = subprocess.Popen(
+            [sys.executable, os.path.join(UI_DIR, "vehicle_simulator.py"), "--rate", str(args.rate),
+             "--telemetry-port", str(telemetry_port), "--command-port", str(command_port),
+             "--video-port", str(video_port), "--cameras", str(args.cameras), "--fps", str(args.fps),
+             "--resolution", f"{width}x{height}", "--seed", "0"],
+            stdout=subprocess.DEVNULL)
+        try:
+            if not (wait_for_port(telemetry_port, 10) and wait_for_port(video_port, 10)):
+                raise SystemExit("Araç simülatörü başlamadı")
+
+            import video_backend
+            for camera in range(args.cameras):
+                video_backend.CAMERA_URLS[camera] = f"http://127.0.0.1:{video_port}/cam{camera}.mjpg"
+            video_backend.configure_opengl()
+            app = ProfilingApplication(sys.argv[:1])
+            app.setStyle("Fusion")
+            import ulgen_ui_test
+
+            window = ulgen_ui_test.UlgenDashboard(telemetry_port=f"socket://127.0.0.1:{telemetry_port}",
+                                                  command_port=f"socket://127.0.0.1:{command_port}")
+            window.resize(*args.window)
+            window.show()
+            window.stacked_widget.setCurrentIndex(PAGES[args.page])
+            scenario = Scenario(app, window, args)
+            scenario.start()
+            app.exec()
+        finally:
+            simulator.terminate()
+            simulator.wait(5)
+
+    with open(args.child_output, "w") as output:
+        json.dump(scenario.result, output)
+
+
+def size(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", type=float, nargs="+", default=[200, 1000], help="Telemetri hızları (Hz)")
+    parser.add_argument("--resolutions", type=size, nargs="+", default=[(640, 360), (1280, 720)])
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES),
+                        help="main: ana sayfa (kamera 0), drone: göstergeler, grafikler ve kamera 1")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--cameras", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Senaryo başına ölçüm süresi")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Ölçüm öncesi ısınma (s)")
+    parser.add_argument("--window", type=size, default=(1280, 800), help="Pencere boyutu")
+    parser.add_argument("--no-recorder", dest="recorder", action="store_false", help="Uçuş kaydediciyi kapat")
+    parser.add_argument("--output", default="bench_dashboard.json")
+    # Alt süreç argümanları
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+    parser.add_argument("--rate", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("--resolution", type=size, help=argparse.SUPPRESS)
+    parser.add_argument("--page", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_output:
+        run_scenario(args)
+        return
+
+    common = ["--fps", str(args.fps), "--cameras", str(args.cameras), "--seconds", str(args.seconds),
+              "--warmup", str(args.warmup), "--window", "x".join(map(str, args.window))]
+    if not args.recorder:
+        common.append("--no-recorder")
+    results = {"build": build_info(), "settings": {key: getattr(args, key) for key in (
+        "fps", "cameras", "seconds", "warmup", "window", "recorder")}, "scenarios": []}
+    print(f"{'hız':>6} {'çözünürlük':>11} {'sayfa':>6} {'widget':>6} {'döngü p99':>10} {'çizim/s':>9} "
+          f"{'kare':>11} {'kayıt (kayıp)':>17} {'RSS MB':>13}  en pahalı widget")
+    for rate, resolution, page in itertools.product(args.rates, args.resolutions, args.pages):
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as child_output:
+            path = child_output.name
+        try:
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--child-output", path, "--rate", str(rate),
+                            "--resolution", "x".join(map(str, resolution)), "--page", page] + common,
+                           check=True, stdout=subprocess.DEVNULL)
+            with open(path) as child_output:
+                result = json.load(child_output)
+        finally:
+            os.unlink(path)
+        result = dict({"rate": rate, "resolution": list(resolution), "page": page}, **result)
+        results["scenarios"].append(result)
+
+        cameras = result["cameras"].values()
+        delivered = sum(camera["delivered"] for camera in cameras)
+        expected = sum(camera["expected"] for camera in cameras)
+        telemetry = result["telemetry"]
+        top = next(iter(result["paint"].items()), (None, None))
+        top = f"{top[0]} {top[1]['mean']:.2f} ms × {top[1]['count']}" if top[0] else "-"
+        print(f"{rate:>6g} {'x'.join(map(str, resolution)):>11} {page:>6} {result['visible_widgets']:>6} "
+              f"{result['loop_delay_ms'].get('p99', 0):>7.2f} ms {result['paint_ms_per_s']:>6.1f} ms "
+              f"{delivered:>5}/{expected:<5} {telemetry['received']:>6}/{telemetry['expected']:<6}({telemetry['lost']}) "
+              f"{result['rss_mb']['start']:>6.0f}→{result['rss_mb']['end']:<6.0f}  {top}", flush=True)
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2, ensure_ascii=False)
+    print(f"Sonuçlar: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
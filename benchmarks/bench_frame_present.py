@@ -0,0 +1,80 @@
+"""Kare sunum yolu karşılaştırması: eski cvtColor yolu ile FramePresenter
+
+Kullanım: python benchmarks/bench_frame_present.py [--frames 200] [--size 800x450]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import cv2
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from video_engine import FramePresenter, fit_size
+
+RESOLUTIONS = [("720p", 1280, 720), ("1080p", 1920, 1080)]
+
+
+def legacy_present(frame, width, height):
+    """Eski update_frame yolu: cvtColor + fromImage + scaled"""
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    h, w, ch = rgb.shape
+    image = QImage(rgb, w, h, w * ch, QImage.Format_RGB888)
+    pixmap = QPixmap.fromImage(image).scaled(
+        width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # cvtColor çıktısı + tam boy pixmap + ölçeklenmiş pixmap
+    copied = rgb.nbytes + w * h * pixmap.depth() // 8 + pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    return pixmap, copied
+
+
+def measure(fn, frames):
+    """Kare başına ortalama süreyi (µs) ve kopyalanan baytı döndürür"""
+    for frame in frames[:5]:
+        fn(frame)
+    copied = 0
+    start = time.perf_counter()
+    for frame in frames:
+        copied = fn(frame)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(frames) * 1e6, copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--size", default="800x450", help="Widget boyutu (GxY)")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.split("x"))
+
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841 - QPixmap için gerekli
+    presenter = FramePresenter()
+
+    print(f"Widget boyutu: {width}x{height}, {args.frames} kare")
+    print(f"{'çözünürlük':<11}{'yol':<16}{'µs/kare':>10}{'bayt/kare':>14}")
+    for name, w, h in RESOLUTIONS:
+        # Farklı karelerle ölç ki önbellek etkisi sonucu bozmasın
+        frames = [np.random.randint(0, 255, (h, w, 3), dtype=np.uint8) for _ in range(4)]
+        frames = [frames[i % len(frames)] for i in range(args.frames)]
+
+        legacy_us, legacy_bytes = measure(lambda f: legacy_present(f, width, height)[1], frames)
+
+        def present(f):
+            presenter.present(f, width, height)
+            return presenter.bytes_copied
+
+        new_us, new_bytes = measure(present, frames)
+
+        print(f"{name:<11}{'legacy':<16}{legacy_us:>10.0f}{legacy_bytes:>14,}")
+        print(f"{name:<11}{'FramePresenter':<16}{new_us:>10.0f}{new_bytes:>14,}")
+        target = fit_size(w, h, width, height)
+        print(f"{'':<11}hedef {target[0]}x{target[1]}, hızlanma x{legacy_us / new_us:.1f}")
+
+
+if __name__ == "__main__":
+    main()
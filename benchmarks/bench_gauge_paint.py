@@ -0,0 +1,155 @@
+"""Gösterge çizim ölçümü: her seferinde tam çizim ile önbellekli sabit katmanlar
+
+Kullanım: python benchmarks/bench_gauge_paint.py [--paints 500] [--size 300x300]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+from PySide6.QtCore import Qt, QPoint, QRect
+from PySide6.QtGui import QBrush, QColor, QFont, QImage, QPainter, QPen, QRadialGradient
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv[:1])
+
+from ulgen_ui_test import ArtificialHorizon, ClimbIndicator  # noqa: E402 - QApplication gerekli
+
+
+class LegacyHorizon(ArtificialHorizon):
+    """Eski paintEvent: gradyanlar ve çerçeve her çizimde yeniden oluşturulur"""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        center_x, center_y, radius = self.geometry_values()
+
+        painter.save()
+        painter.translate(center_x, center_y)
+        painter.rotate(-self.roll)
+
+        sky_rect = QRect(-radius, -radius - self.pitch * 5, radius * 2, radius * 2)
+        sky_gradient = QRadialGradient(0, 0, radius * 2)
+        sky_gradient.setColorAt(0, QColor(135, 206, 250))
+        sky_gradient.setColorAt(1, QColor(0, 0, 139))
+        painter.setBrush(QBrush(sky_gradient))
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(sky_rect)
+
+        ground_rect = QRect(-radius, 0 - self.pitch * 5, radius * 2, radius * 2)
+        ground_gradient = QRadialGradient(0, 0, radius * 2)
+        ground_gradient.setColorAt(0, QColor(139, 69, 19))
+        ground_gradient.setColorAt(1, QColor(101, 67, 33))
+        painter.setBrush(QBrush(ground_gradient))
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(ground_rect)
+
+        painter.setPen(QPen(Qt.white, 2))
+        painter.drawLine(-radius, -self.pitch * 5, radius, -self.pitch * 5)
+        painter.restore()
+
+        painter.setPen(QPen(Qt.gray, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
+
+        painter.setPen(QPen(Qt.yellow, 2))
+        painter.drawLine(center_x - 20, center_y, center_x + 20, center_y)
+        painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
+        painter.drawLine(center_x - 5, center_y + 10, center_x + 5, center_y + 10)
+
+
+class LegacyClimb(ClimbIndicator):
+    """Eski paintEvent: kadran, çizgiler ve yazılar her çizimde yeniden çizilir"""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        center_x, center_y, radius = self.geometry_values()
+
+        painter.setBrush(QBrush(Qt.black))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
+
+        painter.setPen(QPen(Qt.white, 1))
+        painter.setFont(QFont("Arial", 8))
+        for i in range(9):
+            angle = (i - 4) * 30
+            x1 = center_x + radius * 0.8 * math.sin(math.radians(angle))
+            y1 = center_y - radius * 0.8 * math.cos(math.radians(angle))
+            x2 = center_x + radius * 0.9 * math.sin(math.radians(angle))
+            y2 = center_y - radius * 0.9 * math.cos(math.radians(angle))
+            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+
+            text = str((i - 4) * 2)
+            text_width = painter.fontMetrics().horizontalAdvance(text)
+            text_x = center_x + radius * 0.7 * math.sin(math.radians(angle)) - text_width / 2
+            text_y = center_y - radius * 0.7 * math.cos(math.radians(angle)) + 4
+            painter.drawText(int(text_x), int(text_y), text)
+
+        painter.setFont(QFont("Arial", 8, QFont.Bold))
+        painter.drawText(center_x - 20, center_y - radius * 0.3, "CLIMB")
+        painter.drawText(center_x - 30, center_y - radius * 0.15, "1000 FT PER MINUTE")
+
+        painter.save()
+        angle = max(min(self.climb_rate / 1000.0 * 120, 120), -120)
+        painter.translate(center_x, center_y)
+        painter.rotate(-angle)
+        painter.setPen(QPen(Qt.white, 2))
+        painter.drawLine(0, 0, 0, -radius * 0.8)
+        painter.restore()
+
+        painter.setPen(QPen(Qt.gray, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
+
+
+def measure(widget, update, paints):
+    """Değer güncelleyip widget'ı bir görüntüye çizer, çizim başına µs döndürür"""
+    target = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+    for _ in range(10):
+        update()
+        widget.render(target)
+    start = time.perf_counter()
+    for _ in range(paints):
+        update()
+        widget.render(target)
+    return (time.perf_counter() - start) / paints * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paints", type=int, default=500)
+    parser.add_argument("--size", default="300x300", help="Gösterge boyutu (GxY)")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.split("x"))
+
+    def horizon_update(widget):
+        return lambda: widget.set_attitude(random.uniform(-30, 30), random.uniform(-15, 15))
+
+    def climb_update(widget):
+        return lambda: widget.set_climb_rate(random.uniform(-800, 800))
+
+    cases = [
+        ("ArtificialHorizon", LegacyHorizon, ArtificialHorizon, horizon_update),
+        ("ClimbIndicator", LegacyClimb, ClimbIndicator, climb_update),
+    ]
+
+    print(f"Gösterge boyutu: {width}x{height}, {args.paints} çizim")
+    print(f"{'gösterge':<19}{'eski µs':>10}{'önbellek µs':>13}{'hızlanma':>10}")
+    for name, legacy_cls, cached_cls, make_update in cases:
+        results = []
+        for cls in (legacy_cls, cached_cls):
+            widget = cls()
+            widget.resize(width, height)
+            results.append(measure(widget, make_update(widget), args.paints))
+        legacy_us, cached_us = results
+        print(f"{name:<19}{legacy_us:>10.0f}{cached_us:>13.0f}{'x' + format(legacy_us / cached_us, '.1f'):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Yüksek hızlı telemetri grafiği ölçümü: paintEvent süresi (hedef < 4 ms)
+
+TelemetryHistory'ye 200 Hz'de --samples örnek yazılır ve TelemetryPlot
+offscreen olarak tekrar tekrar çizilir. İki sinyal ölçülür: yavaş değişen
+yükseklik (ince çizgi) ve her piksel sütununu dolduran titreşim (en kötü durum).
+Ortalama veya p99 bütçeyi aşarsa betik 1 ile çıkar; tek tek en kötü kareler
+makinenin zamanlama titreşimini de içerdiğinden sadece raporlanır.
+
+Kullanım: python benchmarks/bench_plot.py [--samples 60000] [--width 1440] [--frames 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from telemetry_handler import TelemetryRecord
+from telemetry_history import TelemetryHistory
+from telemetry_plot import TelemetryPlot
+
+RATE = 200
+BUDGET = 4.0  # ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=60000, help="Penceredeki örnek sayısı")
+    parser.add_argument("--width", type=int, default=1440)
+    parser.add_argument("--height", type=int, default=140)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    history = TelemetryHistory(samples=args.samples)
+    rng = np.random.default_rng(0)
+    t = np.arange(args.samples) / RATE
+    altitude = 80 + 20 * np.sin(t * 0.05)
+    vibration = np.sin(t * 2 * np.pi * 7) * 5 + rng.normal(0, 1, args.samples)
+    records = [TelemetryRecord(i, t[i], altitude[i], 10.0, 80.0, 90.0, vibration[i], 0.0, 0.0)
+               for i in range(args.samples)]
+    for i in range(0, args.samples, 100):
+        history.append_records(records[i:i + 100])
+
+    window = args.samples / RATE
+    failed = False
+    for channel, name in (("altitude", "yükseklik (ince çizgi)"), ("roll", "titreşim (dolu sütunlar)")):
+        plot = TelemetryPlot(history, channel, window=window)
+        plot.resize(args.width, args.height)
+        plot.show()
+        end = time.perf_counter() + 0.2
+        while time.perf_counter() < end:
+            app.processEvents()
+
+        times = []
+        for _ in range(args.frames):
+            plot.repaint()
+            times.append(plot.paint_time)
+        times = np.array(times) * 1e3
+        drawn = f"{len(plot.polygon) // 2} sütunluk görüntü" if plot.raster else f"{len(plot.polygon)} noktalı polyline"
+        p99 = np.percentile(times, 99)
+        print(f"{name}: {args.samples} örnek, {drawn} - paintEvent ortalama "
+              f"{times.mean():.2f} ms, p99 {p99:.2f} ms, en kötü {times.max():.2f} ms")
+        if max(times.mean(), p99) > BUDGET:
+            print(f"HATA: {name} {BUDGET:g} ms bütçesini aşıyor")
+            failed = True
+        plot.hide()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
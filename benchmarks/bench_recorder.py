@@ -0,0 +1,112 @@
+"""Uçuş kaydedici ölçümü: UI yolundaki yazma maliyeti ve kodlayıcı verimi
+
+FlightRecorder.record_telemetry'nin (telemetri okuyucusunun çağırdığı yol,
+bütçe < 1 ms), kayıt thread'inin halkaya yazma süresi ve video
+kaydedicide submit() süresi ölçülür; kodlayıcı thread'inin yazdığı ve
+kuyruk dolu olduğu için atladığı kare sayısı raporlanır. Halka için en kötü
+süre ve bütçeyi aşan yazma sayısı da verilir; aynı kayıtları bellekteki bir
+diziye yazan döngü, makinenin kendi zamanlama titreşimini gösterir.
+
+Kullanım: python benchmarks/bench_recorder.py [--samples 20000] [--rate 1000] [--seconds 10]
+                                             [--video test.avi] [--frames 300]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import cv2
+import numpy as np
+
+from flight_recorder import RECORD_DTYPE, FlightRecorder, TelemetryRing, VideoRecorder
+from telemetry_handler import TelemetryRecord
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) * 1e6
+
+
+def describe_writes(name, times):
+    times = np.array(times) * 1e6
+    return (f"{name}: ortalama {times.mean():.1f} µs, p99 {np.percentile(times, 99):.1f} µs, "
+            f"p99.9 {np.percentile(times, 99.9):.1f} µs, en kötü {times.max():.1f} µs, "
+            f"1 ms'yi aşan {int((times > 1000).sum())} yazma")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=20000, help="Halkaya doğrudan yazılan örnek sayısı")
+    parser.add_argument("--rate", type=int, default=1000, help="record_telemetry çağrı hızı (Hz)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="record_telemetry ölçüm süresi")
+    parser.add_argument("--video", help="Kare kaynağı (boşsa 1280x720 sentetik kareler)")
+    parser.add_argument("--frames", type=int, default=300, help="Video kare sayısı")
+    parser.add_argument("--fps", type=float, default=30.0, help="Karelerin gönderilme hızı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        ring = TelemetryRing(os.path.join(directory, "telemetry.ring"), 10 * 60 * 200)
+        created = time.perf_counter() - start
+        record = TelemetryRecord(0, 0.0, 50.0, 20.0, 90.0, 80.0, 1.0, -1.0, 100.0)
+        times = []
+        for i in range(args.samples):
+            start = time.perf_counter()
+            ring.append_records([record._replace(seq=i)])
+            times.append(time.perf_counter() - start)
+        ring.close()
+
+        memory = np.zeros(args.samples, RECORD_DTYPE)
+        baseline = []
+        for i in range(args.samples):
+            start = time.perf_counter()
+            r = record._replace(seq=i)
+            memory[i:i + 1] = np.array([(0.0, r.timestamp, r.seq) + tuple(r[2:])], dtype=RECORD_DTYPE)
+            baseline.append(time.perf_counter() - start)
+        flight = FlightRecorder(os.path.join(directory, "flights"), minutes=10, record_video=False)
+        # Okuyucu gibi sabit hızda çağrılır; sıkı döngüde kayıt thread'i GIL için sürekli yarışırdı
+        recorded = []
+        samples = int(args.seconds * args.rate)
+        start_all = time.perf_counter()
+        for i in range(samples):
+            start = time.perf_counter()
+            flight.record_telemetry([record._replace(seq=i)])
+            recorded.append(time.perf_counter() - start)
+            time.sleep(max(0.0, start_all + (i + 1) / args.rate - time.perf_counter()))
+        flight.close()
+
+        print(f"Telemetri halkası: {ring.capacity} kayıt, oluşturma (ön sıfırlama dahil) {created * 1e3:.1f} ms")
+        print(describe_writes(f"record_telemetry ({samples} örnek, {args.rate} Hz, bütçe 1000 µs)", recorded))
+        print(describe_writes("Halkaya yazma (kayıt thread'i)", times))
+        print(describe_writes("Aynı döngü bellekteki diziye (makine titreşimi)", baseline))
+        print(f"Kayıt thread'inin yazdığı: {flight.telemetry.count} / {samples}")
+
+        if args.video:
+            cap = cv2.VideoCapture(args.video)
+            frames = [frame for ok, frame in iter(cap.read, (False, None)) if ok][:args.frames]
+        else:
+            rng = np.random.default_rng(0)
+            base = rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+            frames = [np.roll(base, i * 4, axis=1) for i in range(min(args.frames, 30))]
+
+        recorder = VideoRecorder(directory, "cam0", args.fps)
+        submit_times = []
+        interval = 1.0 / args.fps
+        start_all = time.perf_counter()
+        for i in range(args.frames):
+            frame = frames[i % len(frames)]
+            start = time.perf_counter()
+            recorder.submit(frame)
+            submit_times.append(time.perf_counter() - start)
+            time.sleep(max(0.0, start_all + (i + 1) * interval - time.perf_counter()))
+        recorder.close(timeout=30)
+        print(f"Video submit ({args.frames} kare, {args.fps:.0f} fps): ortalama "
+              f"{np.mean(submit_times) * 1e6:.1f} µs, en kötü {max(submit_times) * 1e6:.1f} µs; "
+              f"kodlanan {recorder.written}, kuyruk dolu atlanan {recorder.dropped}")
+
+
+if __name__ == "__main__":
+    main()
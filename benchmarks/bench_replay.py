@@ -0,0 +1,124 @@
+"""Uçuş oynatma ölçümü: indeks, atlama ve video/telemetri eşlemesi
+
+Sentetik bir oturum (200 Hz telemetri, 30 fps MJPG) yazılır ya da
+--session ile verilen kayıt açılır; ardından:
+  * FlightLog'un açılış süresi (halka + kare indeksleri),
+  * rastgele atlamalarda seek() süresi ve ilk karenin gelme süresi,
+  * her hızda teslim edilen kare/kayıt hızı ve kare ile o an yayınlanan
+    telemetri arasındaki en büyük zaman farkı raporlanır.
+
+Kullanım: python benchmarks/bench_replay.py [--seconds 120] [--speeds 1 4 16] [--session DIR]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from flight_recorder import TELEMETRY_FILE, TelemetryRing, VideoRecorder
+from flight_replay import FlightLog, ReplayEngine
+from telemetry_handler import TelemetryBus, TelemetryRecord
+
+TELEMETRY_RATE = 200
+VIDEO_FPS = 30
+
+
+def write_session(directory, seconds):
+    """host_time'ı bilinen sentetik bir oturum yazar; timestamp = host_time"""
+    start = time.time()
+    ring = TelemetryRing(os.path.join(directory, TELEMETRY_FILE), seconds * TELEMETRY_RATE)
+    for i in range(seconds * TELEMETRY_RATE):
+        t = start + i / TELEMETRY_RATE
+        ring.append_records([TelemetryRecord(i, t, 50.0, 20.0, 90.0, 80.0, 1.0, -1.0, 0.0)], host_time=t)
+    ring.close()
+
+    recorder = VideoRecorder(directory, "cam0", VIDEO_FPS, segment_seconds=30)
+    frame = np.zeros((360, 640, 3), np.uint8)
+    for i in range(seconds * VIDEO_FPS):
+        while recorder.queue.full():
+            time.sleep(0.001)
+        recorder.submit(frame, host_time=start + i / VIDEO_FPS)
+    recorder.close(timeout=60)
+
+
+def pump(app, condition, timeout):
+    end = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--session", help="Ölçülecek kayıt klasörü (boşsa sentetik oturum)")
+    parser.add_argument("--seconds", type=int, default=120, help="Sentetik oturumun uzunluğu")
+    parser.add_argument("--speeds", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--duration", type=float, default=3.0, help="Her hızda oynatma süresi (s)")
+    parser.add_argument("--seeks", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as directory:
+        session = args.session
+        if session is None:
+            session = directory
+            write_session(session, args.seconds)
+
+        start = time.perf_counter()
+        log = FlightLog(session)
+        print(f"FlightLog: {len(log.telemetry)} kayıt, {sum(len(c) for c in log.cameras.values())} kare, "
+              f"{log.duration:.0f} s - açılış {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+        bus = TelemetryBus()
+        engine = ReplayEngine(log, bus)
+        latest = {}
+        engine.add_sink(lambda records: latest.update(record=records[-1], count=latest.get("count", 0) + len(records)))
+        frames = []
+
+        def on_frame(frame, source):
+            # Kare teslim edildiğinde yayınlanmış son kaydın kayıt anı ile karenin anı karşılaştırılır
+            record = latest.get("record")
+            error = abs(record.timestamp - engine.frame_times[source]) if record is not None else 0.0
+            frames.append((source, error))
+        engine.frame_ready.connect(on_frame)
+
+        rng = np.random.default_rng(0)
+        seek_times, first_frame = [], []
+        for target in rng.uniform(log.start, log.end, args.seeks):
+            frames.clear()
+            start = time.perf_counter()
+            engine.seek(target)
+            seek_times.append(time.perf_counter() - start)
+            pump(app, lambda: frames, 1.0)
+            first_frame.append(time.perf_counter() - start)
+        print(f"Atlama ({args.seeks}x): seek() ortalama {np.mean(seek_times) * 1e6:.0f} µs, "
+              f"ilk kare ortalama {np.mean(first_frame) * 1e3:.1f} ms, en kötü {max(first_frame) * 1e3:.1f} ms")
+
+        for speed in args.speeds:
+            engine.pause()
+            engine.seek(log.start)
+            pump(app, lambda: False, 0.05)
+            frames.clear()
+            latest["count"] = 0
+            engine.set_speed(speed)
+            start_position = engine.position
+            engine.play()
+            start = time.perf_counter()
+            pump(app, lambda: not engine.playing, args.duration)
+            wall = time.perf_counter() - start
+            engine.pause()
+            errors = [error for source, error in frames if source == engine.sync_source] or [0.0]
+            print(f"{speed:g}x: kayıt zamanı {engine.position - start_position:.1f} s / duvar {wall:.1f} s, "
+                  f"{len(frames) / wall:.0f} kare/s, {latest['count'] / wall:.0f} kayıt/s, "
+                  f"kare-telemetri farkı en fazla {max(errors) * 1e3:.1f} ms")
+        engine.stop()
+
+
+if __name__ == "__main__":
+    main()
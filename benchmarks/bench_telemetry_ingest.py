@@ -0,0 +1,131 @@
+"""Seri telemetri alımı ölçümü: pty üzerinden yüksek hızlı çerçeve akışı
+
+Bir pty çiftinin bir ucuna sabit hızda çerçeve yazılır, diğer ucu
+SerialTelemetryReader ile okunur ve paneldeki gibi TelemetryBus'a verilir.
+Alınan/kaybolan kayıtlar, çerçeveden okuyucuya ve göstergelere
+(TelemetryBus.updated) gecikme ve olay döngüsü gecikmesi raporlanır.
+Göstergeye ulaşan kaydı tanımak için yükseklik kanalı sıra numarasını taşır.
+
+Kullanım: python benchmarks/bench_telemetry_ingest.py [--rate 200] [--duration 5]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import tty
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtWidgets import QApplication
+
+from telemetry_handler import SerialTelemetryReader, TelemetryBus, TelemetryRecord, encode_record
+
+
+def write_frames(fd, rate, duration, stop):
+    """Çerçeveleri zaman damgası perf_counter, yüksekliği sıra numarası olacak şekilde sabit hızda yazar"""
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    seq = 0
+    while not stop.is_set():
+        now = time.perf_counter()
+        if now - start >= duration:
+            break
+        target = start + seq * interval
+        if now < target:
+            time.sleep(target - now)
+        record = TelemetryRecord(seq, time.perf_counter(), float(seq), 20.0, 80.0, 90.0, 1.0, 2.0, 300.0)
+        os.write(fd, encode_record(record))
+        seq += 1
+    return seq
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=int, default=200, help="Çerçeve hızı (Hz)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Süre (s)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+
+    reader = SerialTelemetryReader(os.ttyname(slave), baudrate=921600)
+    bus = TelemetryBus()
+    sent_times = {}  # seq -> gönderim anı (okuyucu thread'inde doldurulur)
+    sink_latencies = []
+    gui_latencies = []
+    updates = [0]
+
+    def on_records(records):
+        now = time.perf_counter()
+        for record in records:
+            sent_times[record.seq] = record.timestamp
+            sink_latencies.append(now - record.timestamp)
+
+    def on_updated(values):
+        now = time.perf_counter()
+        updates[0] += 1
+        sent = sent_times.get(int(values.get("altitude", -1)))
+        if sent is not None:
+            gui_latencies.append(now - sent)
+
+    reader.add_sink(on_records)
+    reader.add_sink(bus.publish_records)
+    bus.updated.connect(on_updated)
+
+    # Olay döngüsü gecikmesi: 5 ms'lik zamanlayıcının ne kadar geciktiği
+    loop_delays = []
+    tick = [time.perf_counter()]
+
+    def on_tick():
+        now = time.perf_counter()
+        loop_delays.append(max(0.0, now - tick[0] - 0.005))
+        tick[0] = now
+
+    timer = QTimer()
+    timer.setTimerType(Qt.PreciseTimer)
+    timer.timeout.connect(on_tick)
+    timer.start(5)
+
+    stop = threading.Event()
+    sent = [0]
+    writer = threading.Thread(
+        target=lambda: sent.__setitem__(0, write_frames(master, args.rate, args.duration, stop)))
+
+    reader.start()
+    QTimer.singleShot(200, writer.start)
+    QTimer.singleShot(int(args.duration * 1000) + 700, app.quit)
+    app.exec()
+
+    stop.set()
+    writer.join()
+    reader.stop()
+    os.close(master)
+    os.close(slave)
+
+    received = len(sink_latencies)
+    print(f"Hız: {args.rate} Hz, süre: {args.duration:.1f} s")
+    print(f"Gönderilen: {sent[0]}, alınan: {received}, kayıp: {sent[0] - received}, "
+          f"sağlama hatası: {reader.parser.errors}")
+    print(f"Gösterge güncellemesi: {updates[0]} ({received / max(1, updates[0]):.1f} kayıt/güncelleme)")
+    print(f"Çerçeve→okuyucu gecikmesi ms: p50 {percentile(sink_latencies, 50) * 1e3:.2f}, "
+          f"p99 {percentile(sink_latencies, 99) * 1e3:.2f}")
+    print(f"Çerçeve→gösterge (TelemetryBus.updated) gecikmesi ms: p50 {percentile(gui_latencies, 50) * 1e3:.2f}, "
+          f"p99 {percentile(gui_latencies, 99) * 1e3:.2f}")
+    print(f"Olay döngüsü gecikmesi ms: p50 {percentile(loop_delays, 50) * 1e3:.2f}, "
+          f"p99 {percentile(loop_delays, 99) * 1e3:.2f}, max {max(loop_delays) * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
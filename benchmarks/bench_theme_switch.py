@@ -0,0 +1,87 @@
+"""Tema ölçümü: panel açılış süresi ve tema değişiminde yeniden cilalama süresi
+
+Panel offscreen oluşturulur, ardından açık/koyu tema arasında geçiş yapılır.
+Stil sayfası taşıyan widget sayısı, derleme, setStyleSheet (yeniden cilalama)
+ve sonraki olay işleme/çizim süreleri raporlanır. Panel geçici QSettings
+ile kurulur ve uçuş kaydı kapalıdır; kullanıcının ayarlarına ve kayıtlarına
+dokunulmaz.
+
+Kullanım: python benchmarks/bench_theme_switch.py [--switches 6]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication, QWidget
+
+from camera_handler import CameraHub
+from style_compiler import compile_stylesheet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=6, help="Tema değişimi sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ulgen-bench-") as directory:
+        QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, directory)
+        QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, directory)
+        settings = QSettings("ULGEN", "Dashboard")
+        settings.setValue("recorder/directory", os.path.join(directory, "flights"))
+        settings.setValue("recorder/enabled", False)
+        settings.sync()
+        measure(args)
+
+
+def measure(args):
+    app = QApplication(sys.argv[:1])
+    app.setStyle("Fusion")
+
+    from ulgen_ui_test import ThemeManager, UlgenDashboard
+
+    start = time.perf_counter()
+    window = UlgenDashboard()
+    window.show()
+    app.processEvents()
+    startup = time.perf_counter() - start
+
+    widgets = window.findChildren(QWidget)
+    styled = sum(1 for widget in widgets if widget.styleSheet())
+    print(f"Açılış: {startup * 1e3:.1f} ms, {len(widgets)} widget, {styled} stil sayfası")
+
+    themes = [ThemeManager.LIGHT, ThemeManager.DARK]
+    compile_times, polish_times, event_times = [], [], []
+    for i in range(args.switches):
+        window.theme_manager.set_theme(themes[i % 2])
+        window.detect_platform()
+
+        t0 = time.perf_counter()
+        compile_stylesheet(window.theme_values)
+        t1 = time.perf_counter()
+        window.apply_theme()
+        t2 = time.perf_counter()
+        app.processEvents()
+        window.repaint()
+        t3 = time.perf_counter()
+
+        compile_times.append(t1 - t0)
+        polish_times.append(t2 - t1)
+        event_times.append(t3 - t2)
+
+    def avg(values):
+        return sum(values) / len(values) * 1e3
+
+    print(f"Tema değişimi ({args.switches} kez, ortalama): derleme {avg(compile_times):.2f} ms, "
+          f"yeniden cilalama {avg(polish_times):.1f} ms, olaylar + çizim {avg(event_times):.1f} ms")
+
+    CameraHub.instance().shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""WebSocket telemetri taşımasının uçtan uca gecikme ölçümü
+
+Aynı süreçte yerel bir TelemetryBroker ve ona WebSocket ile bağlanan bir
+yayıncı çalışır (ayrı thread, kendi asyncio döngüsü). Yayıncı saniyede
+--rate kayıt üretir ve her mesajda --batch kayıt gönderir; kaydın timestamp
+alanı yayın anındaki perf_counter'dır. Panelin kullandığı
+WebSocketTelemetryReader abone olur, kayıtlar paneldeki gibi TelemetryBus'a
+verilir ve iki noktada gecikme ölçülür:
+  * alıcı: okuyucu thread'inde, kayıt çözüldüğü an,
+  * gösterge: GUI thread'inde TelemetryBus.updated anı (yükseklik kanalı
+    kaydın sıra numarasını taşır; ekran tazelemesini beklemek dahil).
+Ayrıca aracının attığı mesajlar ve okuyucuya ulaşmayan kayıtlar raporlanır. --gui-stall ile GUI thread'i her 100 ms'de bir bu kadar
+bekletilir; geri basınç altında kayıpların nerede olduğunu görmek içindir.
+
+Yayından önce hem aracıya hem okuyucuya UTF-8 olmayan bir metin çerçevesi
+gönderilir. İkisi de bunu atlayıp bağlantıyı sürdürmelidir: okuyucu
+çalışmıyorsa ya da aracının atmadığı bir kayıt kaybolduysa betik 1 ile çıkar.
+
+Kullanım: python benchmarks/bench_transport.py [--rate 1000] [--batch 1] [--seconds 5] [--gui-stall 0]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import numpy as np
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from telemetry_handler import TelemetryBus, TelemetryRecord, encode_record
+from telemetry_transport import (OP_TEXT, TELEMETRY_TOPIC, TelemetryBroker, WebSocketTelemetryReader, connect,
+                                 encode_message)
+
+BAD_TEXT = b"\xff\xfe"  # UTF-8 olmayan metin çerçevesi
+
+
+class BrokerThread(threading.Thread):
+    """Aracıyı ve yayıncıyı kendi asyncio döngüsünde çalıştırır"""
+
+    def __init__(self, rate, batch, seconds):
+        super().__init__(daemon=True)
+        self.rate, self.batch, self.seconds = rate, batch, seconds
+        self.broker = TelemetryBroker(port=0)
+        self.ready = threading.Event()
+        self.subscribed = threading.Event()
+        self.sent = 0
+
+    def run(self):
+        asyncio.run(self.main())
+
+    async def main(self):
+        await self.broker.start()
+        self.ready.set()
+        while not self.broker.subscribers or not any(s.filters for s in self.broker.subscribers):
+            await asyncio.sleep(0.01)
+        self.subscribed.set()
+
+        websocket = await connect(f"ws://127.0.0.1:{self.broker.port}")
+        # Bozuk metin çerçeveleri: biri aracıya, biri aracıdan okuyucuya
+        websocket.writer.write(websocket.frame(OP_TEXT, BAD_TEXT))
+        for subscriber in self.broker.subscribers:
+            subscriber.websocket.writer.write(subscriber.websocket.frame(OP_TEXT, BAD_TEXT))
+        start = time.perf_counter()
+        messages = int(self.seconds * self.rate / self.batch)
+        for i in range(messages):
+            # Zamanlama mutlak hedeflere göre; gecikilirse hemen gönderilir
+            delay = start + i * self.batch / self.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            payload = b"".join(
+                encode_record(TelemetryRecord(self.sent + j, time.perf_counter(), float(self.sent + j), 20.0, 90.0, 80.0,
+                                              1.0, -1.0, 0.0)) for j in range(self.batch))
+            await websocket.send(encode_message(TELEMETRY_TOPIC, payload))
+            self.sent += self.batch
+        await asyncio.sleep(0.5)  # Son mesajların ulaşması için
+        await websocket.close()
+        await self.broker.close()
+
+
+class Probe(QObject):
+    """Okuyucunun kayıtlarını TelemetryBus üzerinden GUI thread'inde izleyen alıcı"""
+
+    def __init__(self, reader, stall):
+        super().__init__()
+        self.stall = stall
+        self.sent_times = {}  # seq -> yayın anı (okuyucu thread'inde doldurulur)
+        self.sink_latencies = []
+        self.latencies = []
+        self.bus = TelemetryBus(parent=self)
+        reader.add_sink(self.on_records)
+        reader.add_sink(self.bus.publish_records)
+        self.bus.updated.connect(self.on_updated)
+        if stall:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.block)
+            self.timer.start(100)
+
+    def on_records(self, records):
+        now = time.perf_counter()
+        for record in records:
+            self.sent_times[record.seq] = record.timestamp
+            self.sink_latencies.append(now - record.timestamp)
+
+    def on_updated(self, values):
+        now = time.perf_counter()
+        sent = self.sent_times.get(int(values.get("altitude", -1)))
+        if sent is not None:
+            self.latencies.append(now - sent)
+
+    def block(self):
+        time.sleep(self.stall / 1000)
+
+
+def describe(name, latencies, unit="kayıt"):
+    latencies = np.array(latencies) * 1e3
+    if not len(latencies):
+        return f"{name}: {unit} yok"
+    return (f"{name}: {len(latencies)} {unit} - p50 {np.percentile(latencies, 50):.2f} ms, "
+            f"p99 {np.percentile(latencies, 99):.2f} ms, en kötü {latencies.max():.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=int, default=1000, help="Saniyedeki kayıt sayısı")
+    parser.add_argument("--batch", type=int, default=1, help="Mesaj başına kayıt")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--gui-stall", type=float, default=0.0, help="GUI thread'ini her 100 ms'de bekletme (ms)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    publisher = BrokerThread(args.rate, args.batch, args.seconds)
+    publisher.start()
+    publisher.ready.wait()
+
+    reader = WebSocketTelemetryReader(f"ws://127.0.0.1:{publisher.broker.port}")
+    probe = Probe(reader, args.gui_stall)
+    reader.start()
+    publisher.subscribed.wait(5)
+
+    while publisher.is_alive():
+        app.processEvents()
+        time.sleep(0.0005)
+    app.processEvents()
+    reader_alive = reader.isRunning()
+    reader.stop()
+
+    missing = publisher.sent - len(probe.sink_latencies)
+    print(f"{args.rate} kayıt/s, mesaj başına {args.batch} kayıt, {args.seconds:g} s: "
+          f"{publisher.sent} gönderildi, aracı {publisher.broker.dropped} mesaj attı, "
+          f"okuyucuya ulaşmayan {missing} kayıt")
+    print(describe("Alıcı (okuyucu thread'i)", probe.sink_latencies))
+    print(describe("Gösterge (TelemetryBus.updated)", probe.latencies, "güncelleme"))
+
+    errors = []
+    if not reader_alive:
+        errors.append("okuyucu bozuk metin çerçevesinden sonra durdu")
+    if missing > publisher.broker.dropped * args.batch:
+        errors.append(f"aracının atmadığı {missing - publisher.broker.dropped * args.batch} kayıt kayboldu")
+    for error in errors:
+        print(f"HATA: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Komut yukarı bağlantısı ölçümü: RTT, öncelik ve yeniden deneme
+
+socket:// üzerinden bağlanılan basit bir araç simülasyonu komutları sırayla
+işler (komut başına --vehicle-ms) ve onay gönderir; --loss oranında komutu
+onaysız bırakır. Üç senaryo çalışır:
+  * boşta: aralıklı kalkış komutlarının RTT'si ve send()'in GUI'yi tutma süresi,
+  * yük altında: kuyrukta --bulk parametre komutu varken gönderilen iniş
+    komutunun araca kaçıncı sırada ulaştığı ve onay süresi,
+  * kayıplı bağlantı: yeniden deneme ve başarısız komut sayıları.
+
+Her senaryonun sonucu doğrulanır; beklenen sıra veya sayılar tutmazsa
+HATA satırları yazılır ve betik 1 ile çıkar.
+
+Kullanım: python benchmarks/bench_uplink.py [--vehicle-ms 5] [--bulk 30] [--loss 0.2]
+"""
+import argparse
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject
+
+from command_uplink import ACK_ACCEPTED, COMMAND_NAMES, Ack, CommandParser, CommandUplink, encode_ack
+
+
+class SimulatedVehicle(threading.Thread):
+    """Komutları sırayla işleyip onaylayan TCP araç simülasyonu"""
+
+    def __init__(self, process_seconds, loss):
+        super().__init__(daemon=True)
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.process_seconds = process_seconds
+        self.loss = loss
+        self.received = []  # Araca ulaşan komut adları, geliş sırasıyla
+        self.received_ids = []  # Aynı sırayla komut id'leri (yeniden denemeler dahil)
+        self.applied = set()  # Uygulanan id'ler (yeniden denemeler bir kez uygulanır)
+
+    def run(self):
+        connection, _ = self.server.accept()
+        parser = CommandParser()
+        random.seed(0)
+        while True:
+            data = connection.recv(4096)
+            if not data:
+                return
+            for command in parser.feed(data):
+                time.sleep(self.process_seconds)
+                self.received.append(COMMAND_NAMES[command.code])
+                self.received_ids.append(command.id)
+                if random.random() < self.loss:
+                    continue  # Komut kayboldu, onay gitmez
+                self.applied.add(command.id)
+                connection.sendall(encode_ack(Ack(command.id, ACK_ACCEPTED)))
+
+
+class Results(QObject):
+    """Onayları GUI thread'inde toplar"""
+
+    def __init__(self, uplink):
+        super().__init__()
+        self.acked = {}  # id -> (ad, RTT, varış anı)
+        self.failed = {}
+        self.repeated = []  # Sonucu ikinci kez bildirilen id'ler (onay ve hata toplamda bir kez gelmeli)
+        uplink.command_acked.connect(self.on_acked)
+        uplink.command_failed.connect(self.on_failed)
+
+    def on_acked(self, command_id, name, accepted, rtt):
+        if command_id in self.acked or command_id in self.failed:
+            self.repeated.append(command_id)
+        self.acked[command_id] = (name, rtt, time.perf_counter())
+
+    def on_failed(self, command_id, name, reason):
+        if command_id in self.acked or command_id in self.failed:
+            self.repeated.append(command_id)
+        self.failed[command_id] = (name, reason)
+
+
+def pump(app, condition, timeout):
+    end = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def run_scenario(app, vehicle_ms, loss, body):
+    vehicle = SimulatedVehicle(vehicle_ms / 1000, loss)
+    vehicle.start()
+    uplink = CommandUplink(f"socket://127.0.0.1:{vehicle.port}")
+    results = Results(uplink)
+    uplink.start()
+    pump(app, lambda: uplink.connected, 2.0)
+    body(uplink, results, vehicle)
+    uplink.stop()
+    return uplink, results, vehicle
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicle-ms", type=float, default=5.0, help="Aracın komut başına işlem süresi")
+    parser.add_argument("--commands", type=int, default=50)
+    parser.add_argument("--bulk", type=int, default=30, help="İnişten önce kuyruğa giren parametre komutları")
+    parser.add_argument("--loss", type=float, default=0.2, help="Kayıplı senaryoda komut kaybı oranı")
+    args = parser.parse_args()
+    app = QCoreApplication(sys.argv[:1])
+    errors = []
+
+    def check(condition, message):
+        if not condition:
+            errors.append(message)
+
+    def idle(uplink, results, vehicle):
+        calls = []
+        for _ in range(args.commands):
+            start = time.perf_counter()
+            uplink.send("takeoff")
+            calls.append(time.perf_counter() - start)
+            pump(app, lambda: False, 0.02)
+        pump(app, lambda: len(results.acked) == args.commands, 2.0)
+        rtts = np.array([rtt for _, rtt, _ in results.acked.values() if rtt >= 0]) * 1e3
+        print(f"Boşta: {len(results.acked)}/{args.commands} onay - RTT p50 {np.percentile(rtts, 50):.1f} ms, "
+              f"p99 {np.percentile(rtts, 99):.1f} ms; send() p99 {np.percentile(calls, 99) * 1e6:.0f} µs")
+        check(len(results.acked) == args.commands and not results.failed,
+              f"boşta {args.commands} komuttan {len(results.acked)} onaylandı, {len(results.failed)} başarısız")
+
+    def loaded(uplink, results, vehicle):
+        for _ in range(args.bulk):
+            uplink.send("param", 1.0)
+        pump(app, lambda: False, 3 * args.vehicle_ms / 1000)  # Toplu trafik akmaya başlasın
+        start = time.perf_counter()
+        before = len(vehicle.received)
+        land = uplink.send("land")
+        pump(app, lambda: land in results.acked, 5.0)
+        land_time = (results.acked[land][2] - start) * 1e3 if land in results.acked else float("nan")
+        pump(app, lambda: len(results.acked) + len(results.failed) > args.bulk, 10.0)
+        position = vehicle.received.index("land") + 1
+        print(f"Yük altında: {args.bulk} parametre komutu kuyruktayken iniş araca {position}. sırada ulaştı, "
+              f"onayı {land_time:.1f} ms sonra geldi (FIFO'da ~{(args.bulk + 1) * args.vehicle_ms:.0f} ms)")
+        # İniş sadece zaten yolda olan (en fazla MAX_IN_FLIGHT) komutların arkasında kalabilir
+        limit = before + CommandUplink.MAX_IN_FLIGHT + 1
+        check(land in results.acked, "iniş onaylanmadı")
+        check(position <= limit, f"iniş {position}. sırada ulaştı, en geç {limit}. sırada olmalıydı")
+        check(len(results.acked) == args.bulk + 1 and not results.failed,
+              f"yük altında {args.bulk + 1} komuttan {len(results.acked)} onaylandı, {len(results.failed)} başarısız")
+
+    def lossy(uplink, results, vehicle):
+        for _ in range(args.commands):
+            uplink.send("takeoff")
+            pump(app, lambda: False, 0.01)
+        pump(app, lambda: len(results.acked) + len(results.failed) == args.commands, 10.0)
+        print(f"%{args.loss * 100:.0f} kayıp: {len(results.acked)} onaylandı, {len(results.failed)} başarısız, "
+              f"{uplink.retries} yeniden deneme, araç {len(vehicle.received)} çerçeve aldı, "
+              f"{len(vehicle.applied)} komut uyguladı")
+        sent = {}
+        for command_id in vehicle.received_ids:
+            sent[command_id] = sent.get(command_id, 0) + 1
+        check(len(results.acked) + len(results.failed) == args.commands,
+              f"{args.commands} komuttan {len(results.acked) + len(results.failed)} sonuçlandı")
+        check(set(results.acked) == vehicle.applied, "onaylanan komutlar araçta uygulananlarla aynı değil")
+        check(max(sent.values(), default=0) <= CommandUplink.MAX_ATTEMPTS,
+              f"bir komut {max(sent.values())} kez gönderildi (en fazla {CommandUplink.MAX_ATTEMPTS})")
+        # Yeniden denemeye alınan komut kuyrukta süresi dolup hiç gönderilmeyebilir; fazlası olamaz
+        check(len(vehicle.received_ids) <= args.commands + uplink.retries,
+              f"araç {len(vehicle.received_ids)} çerçeve aldı, en fazla {args.commands} komut + "
+              f"{uplink.retries} yeniden deneme olmalıydı")
+        check(args.loss == 0 or uplink.retries > 0, "kayıplı bağlantıda hiç yeniden deneme olmadı")
+
+    for loss, body in ((0.0, idle), (0.0, loaded), (args.loss, lossy)):
+        _, results, _ = run_scenario(app, args.vehicle_ms, loss, body)
+        check(not results.repeated, f"{len(results.repeated)} komutun sonucu birden çok kez bildirildi")
+
+    for error in errors:
+        print(f"HATA: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,420 @@
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+from PySide6.QtCore import Qt, QCoreApplication, QObject, QThread, Signal
+
+from video_backend import camera_address
+
+# Kameradan istenen çözünürlük, kare hızı ve sıkıştırma biçimi
+CaptureProfile = namedtuple("CaptureProfile", ["width", "height", "fps", "fourcc"])
+
+# Büyükten küçüğe profil merdiveni - denetleyici bu basamaklarda iner/çıkar
+PROFILE_LADDER = [
+    CaptureProfile(1920, 1080, 30, "MJPG"),
+    CaptureProfile(1280, 720, 30, "MJPG"),
+    CaptureProfile(960, 540, 30, "MJPG"),
+    CaptureProfile(640, 480, 30, "MJPG"),
+    CaptureProfile(640, 360, 15, "MJPG"),
+    CaptureProfile(320, 240, 15, "MJPG"),
+]
+
+DEFAULT_PROFILE_INDEX = 1  # Widget boyutu bilinmeden önce 720p
+
+# OpenCV günlük seviyesi süreç genelidir; birden çok işçi aynı anda yeniden
+# deneyebildiği için susturma sayaçla yapılır
+_cv_log = getattr(getattr(cv2, "utils", None), "logging", None)
+_quiet_lock = threading.Lock()
+_quiet_count = 0
+_saved_log_level = None
+
+
+def _open_quietly(address):
+    """Kaynağı OpenCV uyarılarını susturarak açar
+
+    Olmayan bir kamerayı her yeniden denemede OpenCV konsola uyarı basar;
+    ilk deneme dışındaki açılışlar bu fonksiyonla yapılır.
+    """
+    global _quiet_count, _saved_log_level
+    if _cv_log is None:
+        return cv2.VideoCapture(address)
+    with _quiet_lock:
+        if _quiet_count == 0:
+            _saved_log_level = _cv_log.getLogLevel()
+            _cv_log.setLogLevel(_cv_log.LOG_LEVEL_SILENT)
+        _quiet_count += 1
+    try:
+        return cv2.VideoCapture(address)
+    finally:
+        with _quiet_lock:
+            _quiet_count -= 1
+            if _quiet_count == 0:
+                _cv_log.setLogLevel(_saved_log_level)
+
+
+def apply_profile(cap, profile):
+    """Profili kameraya uygular ve kameranın gerçekte verdiği değerleri döndürür"""
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+    cap.set(cv2.CAP_PROP_FPS, profile.fps)
+    return CaptureProfile(
+        int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or profile.width,
+        int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or profile.height,
+        cap.get(cv2.CAP_PROP_FPS) or profile.fps,
+        profile.fourcc)
+
+
+class ProfileController:
+    """Ölçülen çizim süresine göre yakalama profilini düşüren/yükselten denetleyici"""
+    SMOOTHING = 0.1  # Çizim süresi için üstel ortalama katsayısı
+    DOWN_RATIO = 0.9  # Ortalama çizim süresi bütçenin bu oranını aşarsa bir basamak in
+    UP_RATIO = 0.6  # Bir üst basamakta tahmini süre bu oranın altındaysa çık
+    COOLDOWN_FRAMES = 90  # Her değişiklikten sonra ölçüm için beklenen kare sayısı
+
+    def __init__(self, ladder=PROFILE_LADDER, index=DEFAULT_PROFILE_INDEX):
+        self.ladder = ladder
+        self.index = index
+        self.ceiling = 0  # Widget boyutunun gerektirdiği en büyük basamak
+        self.render_time = None
+        self._cooldown = self.COOLDOWN_FRAMES
+
+    @property
+    def profile(self):
+        return self.ladder[self.index]
+
+    def set_target_size(self, width, height):
+        """Gösterim boyutunu karşılayan en küçük profili üst sınır yapar
+
+        Profil değiştiyse True döndürür.
+        """
+        ceiling = 0
+        for i, profile in enumerate(self.ladder):
+            if profile.width >= width and profile.height >= height:
+                ceiling = i
+        self.ceiling = ceiling
+
+        # Gereğinden büyük yakalamanın anlamı yok, hemen in
+        if self.index < ceiling:
+            return self._step(ceiling)
+        return False
+
+    def report(self, seconds):
+        """Bir karenin çizim süresini kaydeder, profil değiştiyse True döndürür"""
+        if self.render_time is None:
+            self.render_time = seconds
+        else:
+            self.render_time += (seconds - self.render_time) * self.SMOOTHING
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return False
+
+        budget = 1.0 / self.profile.fps
+        if self.render_time > budget * self.DOWN_RATIO and self.index < len(self.ladder) - 1:
+            return self._step(self.index + 1)
+
+        if self.index > self.ceiling:
+            # Bir üst basamaktaki süreyi piksel sayısıyla orantılı tahmin et
+            current, upper = self.profile, self.ladder[self.index - 1]
+            scale = (upper.width * upper.height) / (current.width * current.height)
+            if self.render_time * scale < (1.0 / upper.fps) * self.UP_RATIO:
+                return self._step(self.index - 1)
+        return False
+
+    def _step(self, index):
+        self.index = index
+        self.render_time = None
+        self._cooldown = self.COOLDOWN_FRAMES
+        return True
+
+
+class CaptureWorker(QThread):
+    """Bir kamera kaynağını GUI thread'i dışında okuyan yakalama işçisi"""
+    frame_ready = Signal()
+    opened = Signal(bool)
+    profile_applied = Signal(object)
+    RECONNECT_DELAY = 1.0  # Kaynak koptuğunda ilk yeniden açma beklemesi (s)
+    MAX_RECONNECT_DELAY = 8.0
+    READ_RETRIES = 3  # Art arda bu kadar başarısız okumada kaynak yeniden açılır
+
+    def __init__(self, source, profile=None, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self._lock = threading.Lock()
+        self._latest = None  # Sadece en yeni kare tutulur
+        self._pending = False  # GUI henüz son bildirimi işlemediyse True
+        self._requested_profile = profile  # Thread içinde uygulanacak profil
+        self._profile = None  # Son uygulanan profil (yeniden açılışta tekrar uygulanır)
+        self._resumed = threading.Event()  # Temizken okuma durur, cihaz açık kalır
+        self.measured_fps = 0.0
+        self.frames = 0  # Kameradan okunan kareler
+        self.dropped = 0  # GUI almadan yenisi geldiği için ezilen kareler
+
+        # Thread bitene kadar referansı tut (erken çöp toplanmasını engeller)
+        _live_workers.add(self)
+        self.finished.connect(lambda: _live_workers.discard(self), Qt.QueuedConnection)
+
+    def run(self):
+        """Kamerayı açar ve durdurulana kadar kare okur
+
+        Kaynak açılamazsa ya da okuma art arda READ_RETRIES kez başarısız
+        olursa kamera bırakılıp artan aralıklarla (RECONNECT_DELAY,
+        MAX_RECONNECT_DELAY'e kadar iki katına çıkarak) yeniden açılır; ağ
+        akışlarında kısa kopmalar olağandır. Kaynak kapalıyken opened(False)
+        bir kez yayılır. Yalnızca ilk açılış denemesi OpenCV uyarısı basar;
+        yeniden denemeler konsolu doldurmasın diye sessiz açılır.
+        """
+        delay = self.RECONNECT_DELAY
+        is_opened = None
+        while not self.isInterruptionRequested():
+            address = camera_address(self.source)
+            cap = cv2.VideoCapture(address) if is_opened is None else _open_quietly(address)
+            if cap.isOpened() != is_opened:
+                is_opened = cap.isOpened()
+                self.opened.emit(is_opened)
+            if is_opened:
+                with self._lock:
+                    # Yeniden açılan kaynağa, yenisi istenmediyse son profil uygulanır
+                    if self._requested_profile is None:
+                        self._requested_profile = self._profile
+                if self.capture(cap):
+                    delay = self.RECONNECT_DELAY
+            cap.release()
+            if self.isInterruptionRequested():
+                break
+            if is_opened:
+                is_opened = False
+                self.opened.emit(False)
+            # Yeniden denemeye kadar kesilebilir bekleme
+            deadline = time.perf_counter() + delay
+            while not self.isInterruptionRequested() and time.perf_counter() < deadline:
+                self.msleep(50)
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+
+    def capture(self, cap):
+        """Açık kaynaktan kare okur; en az bir kare okunduysa True döndürür"""
+        last_time = None
+        failures = 0
+        read_any = False
+
+        # Kare hızını kamera belirler: read() bir sonraki kare gelene kadar bekler
+        while not self.isInterruptionRequested():
+            # Görünür abone yoksa kare okunmaz ve çözülmez
+            if not self._resumed.wait(0.1):
+                last_time = None
+                continue
+
+            with self._lock:
+                profile, self._requested_profile = self._requested_profile, None
+            if profile is not None:
+                self._profile = profile
+                self.profile_applied.emit(apply_profile(cap, profile))
+                last_time = None
+
+            ret, frame = cap.read()
+            if not ret:
+                failures += 1
+                if failures >= self.READ_RETRIES:
+                    return read_any
+                continue
+            failures = 0
+            read_any = True
+
+            # Kameranın gerçek kare hızı (aralıkların üstel ortalaması)
+            now = time.perf_counter()
+            if last_time is not None and now > last_time:
+                fps = 1.0 / (now - last_time)
+                self.measured_fps = fps if not self.measured_fps else self.measured_fps * 0.9 + fps * 0.1
+            last_time = now
+
+            with self._lock:
+                self.frames += 1
+                if self._latest is not None:
+                    self.dropped += 1
+                self._latest = frame
+                notify = not self._pending
+                self._pending = True
+
+            # GUI yetişemiyorsa kuyruğa yeni olay eklenmez, eski kare ezilir
+            if notify:
+                self.frame_ready.emit()
+        return read_any
+
+    def take_frame(self):
+        """En yeni kareyi döndürür ve bildirimi sıfırlar"""
+        with self._lock:
+            frame = self._latest
+            self._latest = None
+            self._pending = False
+        return frame
+
+    def set_profile(self, profile):
+        """Profili bir sonraki okumadan önce uygulanmak üzere kaydeder"""
+        with self._lock:
+            self._requested_profile = profile
+
+    def set_paused(self, paused):
+        """Okumayı duraklatır veya sürdürür (kamera açık kalır)"""
+        if paused:
+            self._resumed.clear()
+        else:
+            self._resumed.set()
+
+    def stop(self):
+        """İşçiyi GUI thread'ini bekletmeden durdurur"""
+        self.requestInterruption()
+
+
+class CameraStream(QObject):
+    """Tek bir fiziksel kaynağın, tüm abonelerle paylaşılan yakalama akışı"""
+    frame_ready = Signal(object)
+    opened = Signal(bool)
+    fps_measured = Signal(float)
+    profile_changed = Signal(object)
+    FPS_REPORT_INTERVAL = 1.0  # Ölçülen kare hızının yayınlanma aralığı (s)
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.refcount = 0
+        self.is_opened = None  # Açılış sonucu henüz bilinmiyorsa None
+        self.last_frame = None
+        self.profile = None  # Kameranın gerçekte verdiği profil
+        self.target_sizes = {}  # Abone başına istenen gösterim boyutu
+        self.active_subscribers = set()  # Şu anda görünür olan aboneler
+        self._last_fps_report = 0.0
+        self._render_time = 0.0  # Son karenin tüm abonelerdeki toplam çizim süresi
+
+        self.controller = ProfileController()
+        self.worker = CaptureWorker(source, self.controller.profile)
+        self.worker.opened.connect(self._on_opened, Qt.QueuedConnection)
+        self.worker.frame_ready.connect(self._on_frame, Qt.QueuedConnection)
+        self.worker.profile_applied.connect(self._on_profile_applied, Qt.QueuedConnection)
+
+    def start(self):
+        self.worker.start()
+
+    def stop(self):
+        self.worker.stop()
+        self.last_frame = None
+
+    def set_active(self, key, active):
+        """Abonenin görünürlüğünü bildirir; görünür abone yoksa yakalama duraklar"""
+        if active:
+            self.active_subscribers.add(key)
+        else:
+            self.active_subscribers.discard(key)
+        self.worker.set_paused(not self.active_subscribers)
+
+    def request_size(self, key, width, height):
+        """Bir abonenin fiziksel gösterim boyutunu bildirir"""
+        self.target_sizes[key] = (width, height)
+        self._update_target_size()
+
+    def forget_size(self, key):
+        self.target_sizes.pop(key, None)
+        self._update_target_size()
+
+    def report_render_time(self, seconds):
+        """Abonenin son kareyi çizme süresini bildirir
+
+        Aboneler aynı GUI thread'inde çizdiği için süreler kare başına toplanır.
+        """
+        self._render_time += seconds
+
+    def _update_target_size(self):
+        if not self.target_sizes:
+            return
+        width = max(w for w, h in self.target_sizes.values())
+        height = max(h for w, h in self.target_sizes.values())
+        if self.controller.set_target_size(width, height):
+            self.worker.set_profile(self.controller.profile)
+
+    def _on_opened(self, ok):
+        self.is_opened = ok
+        if not ok:
+            self.last_frame = None  # Kopuk kaynağın eski karesi analiz edilmez
+        self.opened.emit(ok)
+
+    def _on_profile_applied(self, profile):
+        self.profile = profile
+        self.profile_changed.emit(profile)
+
+    def _on_frame(self):
+        # Kare bir kez okunur ve kopyalanmadan tüm abonelere dağıtılır
+        frame = self.worker.take_frame()
+        if frame is not None:
+            self.last_frame = frame
+            self._render_time = 0.0
+            self.frame_ready.emit(frame)
+
+            if self.refcount > 0 and self.controller.report(self._render_time):
+                self.worker.set_profile(self.controller.profile)
+
+            now = time.perf_counter()
+            if now - self._last_fps_report >= self.FPS_REPORT_INTERVAL:
+                self._last_fps_report = now
+                self.fps_measured.emit(self.worker.measured_fps)
+
+
+class CameraHub(QObject):
+    """Kaynakları tek seferde açan ve referans sayan merkezi kamera kaydı"""
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.streams = {}
+
+    @classmethod
+    def instance(cls):
+        """Paylaşılan hub örneğini döndürür"""
+        if cls._instance is None:
+            cls._instance = cls()
+            # Uygulama kapanırken kameralar serbest bırakılır
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(cls._instance.shutdown)
+        return cls._instance
+
+    def acquire(self, source):
+        """Kaynağa abone olur, ilk abonede cihazı açar"""
+        stream = self.streams.get(source)
+        if stream is None:
+            stream = CameraStream(source, self)
+            self.streams[source] = stream
+            stream.start()
+        stream.refcount += 1
+        return stream
+
+    def release(self, source):
+        """Aboneliği bırakır, son abone gidince cihazı serbest bırakır"""
+        stream = self.streams.get(source)
+        if stream is None:
+            return
+        stream.refcount -= 1
+        if stream.refcount <= 0:
+            del self.streams[source]
+            stream.stop()
+            stream.deleteLater()
+
+    def shutdown(self, timeout_ms=1000):
+        """Uygulama kapanırken tüm akışları kapatır ve işçileri bekler"""
+        streams, self.streams = list(self.streams.values()), {}
+        for stream in streams:
+            stream.stop()
+        stop_all_workers(timeout_ms)
+
+
+# Çalışan tüm yakalama işçileri
+_live_workers = set()
+
+
+def stop_all_workers(timeout_ms=1000):
+    """Uygulama kapanırken tüm yakalama işçilerini durdurur ve bekler"""
+    workers = list(_live_workers)
+    for worker in workers:
+        worker.stop()
+    for worker in workers:
+        worker.wait(timeout_ms)
@@ -0,0 +1,286 @@
+"""Araca komut gönderen yukarı bağlantı (uplink)
+
+Komutlar öncelikli ve sınırlı bir kuyrukta bekler; yazıcı thread'i kuyruğu
+sırayla bağlantıya yazar, okuyucu thread'i onayları (ack) ayrıştırır. GUI
+sadece kuyruğa ekler, hiçbir zaman bağlantıyı beklemez.
+
+Çerçeveler telemetriyle aynı düzendedir (senk, alanlar, 16 bitlik sağlama
+toplamı, little-endian):
+
+    komut: senk 0xAA 0x5A, id uint32, kod uint8, parametre float32, sağlama uint16
+    onay:  senk 0xAA 0xA5, id uint32, durum uint8, sağlama uint16
+
+Araç aynı id'yi birden fazla alırsa (yeniden deneme) komutu bir kez uygular,
+her seferinde onay gönderir.
+"""
+import heapq
+import itertools
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+
+import serial
+from PySide6.QtCore import QObject, Signal
+
+from telemetry_handler import TelemetryParser, encode_record
+
+COMMAND_SYNC = b"\xaa\x5a"
+COMMAND_STRUCT = struct.Struct("<2sIBfH")  # 13 bayt
+ACK_SYNC = b"\xaa\xa5"
+ACK_STRUCT = struct.Struct("<2sIBH")  # 9 bayt
+
+CommandFrame = namedtuple("CommandFrame", "id code param")
+Ack = namedtuple("Ack", "id status")
+ACK_ACCEPTED = 0  # Diğer durum kodları aracın ret sebebidir
+
+# Öncelikler: küçük sayı önce gönderilir
+PRIORITY_SAFETY = 0   # İniş gibi güvenlik komutları her şeyin önüne geçer
+PRIORITY_CONTROL = 1  # Kalkış gibi uçuş komutları
+PRIORITY_BULK = 2     # Parametre yazma gibi toplu trafik
+
+Command = namedtuple("Command", "name code priority label")
+COMMANDS = {command.name: command for command in (
+    Command("land", 1, PRIORITY_SAFETY, "İniş"),
+    Command("takeoff", 2, PRIORITY_CONTROL, "Kalkış"),
+    Command("param", 3, PRIORITY_BULK, "Parametre"),
+)}
+COMMAND_NAMES = {command.code: command.name for command in COMMANDS.values()}
+
+
+class CommandParser(TelemetryParser):
+    """Araç tarafı: bayt akışından komut çerçevelerini ayıklar"""
+    SYNC = COMMAND_SYNC
+    STRUCT = COMMAND_STRUCT
+    RECORD = CommandFrame
+
+
+class AckParser(TelemetryParser):
+    SYNC = ACK_SYNC
+    STRUCT = ACK_STRUCT
+    RECORD = Ack
+
+
+def encode_command(frame):
+    return encode_record(frame, COMMAND_SYNC, COMMAND_STRUCT)
+
+
+def encode_ack(ack):
+    return encode_record(ack, ACK_SYNC, ACK_STRUCT)
+
+
+class Pending:
+    """Gönderilmeyi ya da onay bekleyen bir komut"""
+    __slots__ = ("id", "command", "param", "order", "queued", "expires", "attempts", "sent", "deadline")
+
+    def __init__(self, command_id, command, param, order, now, ttl):
+        self.id = command_id
+        self.command = command
+        self.param = param
+        self.order = order  # Aynı öncelikte ilk gelen önce gider
+        self.queued = now
+        self.expires = now + ttl
+        self.attempts = 0
+        self.sent = None
+        self.deadline = None
+
+    @property
+    def key(self):
+        return (self.command.priority, self.order)
+
+
+class CommandUplink(QObject):
+    """Öncelikli komut kuyruğu, onay takibi, zaman aşımı ve yeniden deneme
+
+    send() kuyruğa ekleyip hemen döner. Yazıcı aynı anda en fazla
+    MAX_IN_FLIGHT komutun onayını bekler; böylece toplu trafik bağlantının ve
+    aracın tamponlarına yığılmaz, sonradan gelen iniş komutu sıradaki toplu
+    komutların önüne geçebilir. Kuyruk MAX_QUEUE komutla sınırlıdır;
+    doluysa yeni komut kuyruktaki en düşük öncelikliden daha önemliyse onun
+    yerini alır, değilse reddedilir. Onayı ACK_TIMEOUT içinde gelmeyen komut
+    kendi önceliğiyle yeniden sıraya girer; MAX_ATTEMPTS denemede ya da
+    COMMAND_TTL içinde onaylanmazsa başarısız sayılır (eski bir kalkış komutu
+    bağlantı geri geldiğinde uygulanmasın diye). Gidiş-dönüş süresi sadece
+    tek denemede onaylanan komutlardan ölçülür; yeniden gönderilmiş bir
+    komutun onayının hangi denemeye ait olduğu bilinemez.
+
+    Sinyaller yazıcı/okuyucu thread'lerinden yayılır; GUI'de kuyruklu bağlanmalıdır.
+    """
+    command_acked = Signal(int, str, bool, float)  # id, ad, kabul edildi mi, RTT (s, bilinmiyorsa -1)
+    command_failed = Signal(int, str, str)  # id, ad, sebep
+    connection_changed = Signal(bool)
+
+    MAX_QUEUE = 32
+    MAX_IN_FLIGHT = 4  # Onay beklenen en fazla komut; güvenlik komutları bu sınırı beklemez
+    ACK_TIMEOUT = 0.3  # s
+    MAX_ATTEMPTS = 3
+    COMMAND_TTL = 3.0  # s, kuyruğa girişten itibaren
+    RECONNECT_DELAY = 1.0
+    RTT_SAMPLES = 20  # Ortalama RTT için son ölçümler
+
+    def __init__(self, port, baudrate=115200, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.baudrate = baudrate
+        self.link = None
+        self._condition = threading.Condition()
+        self._queue = []  # (öncelik, sıra, Pending) yığını
+        self._in_flight = {}  # id -> onay bekleyen Pending
+        self._ids = itertools.count(1)
+        self._order = itertools.count()
+        self.rtts = deque(maxlen=self.RTT_SAMPLES)
+        self.retries = 0
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        self._running = True
+        self._threads = [threading.Thread(target=self._read_loop, name="CommandUplink-reader", daemon=True),
+                         threading.Thread(target=self._write_loop, name="CommandUplink-writer", daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=1.0):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    @property
+    def connected(self):
+        return self.link is not None
+
+    @property
+    def mean_rtt(self):
+        return sum(self.rtts) / len(self.rtts) if self.rtts else None
+
+    def queued(self):
+        """Gönderilmeyi ve onay bekleyen komut sayıları"""
+        with self._condition:
+            return len(self._queue), len(self._in_flight)
+
+    def send(self, name, param=0.0):
+        """Komutu kuyruğa ekler ve id'sini döndürür; reddedilirse None (GUI'yi bekletmez)"""
+        command = COMMANDS[name]
+        now = time.monotonic()
+        with self._condition:
+            pending = Pending(next(self._ids), command, float(param), next(self._order), now, self.COMMAND_TTL)
+            rejected = evicted = None
+            if len(self._queue) >= self.MAX_QUEUE:
+                worst = max(self._queue)
+                if worst[0] <= command.priority:
+                    rejected = pending
+                else:
+                    # Daha düşük öncelikli, en son gelen komut yer açar
+                    self._queue.remove(worst)
+                    heapq.heapify(self._queue)
+                    evicted = worst[2]
+            if rejected is None:
+                heapq.heappush(self._queue, (*pending.key, pending))
+                self._condition.notify()
+        if rejected is not None:
+            self.command_failed.emit(rejected.id, name, "kuyruk dolu")
+            return None
+        if evicted is not None:
+            self.command_failed.emit(evicted.id, evicted.command.name, "daha öncelikli komut için kuyruktan atıldı")
+        return pending.id
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                pending = self._next_command()
+                if pending is None:
+                    return
+                link = self.link
+            try:
+                link.write(encode_command(CommandFrame(pending.id, pending.command.code, pending.param)))
+            except (serial.SerialException, OSError):
+                # Bağlantı koptu; okuyucu yeniden bağlanırken komut onay zaman aşımıyla tekrar denenir
+                pass
+
+    def _next_command(self):
+        """Sıradaki komutu bekler ve uçuşta olarak işaretler; durdurulunca None (kilit altında)"""
+        while self._running:
+            now = time.monotonic()
+            wake = self._expire(now)
+            if self._queue and self.link is not None and (
+                    len(self._in_flight) < self.MAX_IN_FLIGHT or self._queue[0][0] == PRIORITY_SAFETY):
+                _, _, pending = heapq.heappop(self._queue)
+                pending.attempts += 1
+                pending.sent = now
+                pending.deadline = now + self.ACK_TIMEOUT
+                self._in_flight[pending.id] = pending
+                return pending
+            self._condition.wait(None if wake is None else max(0.0, wake - now))
+        return None
+
+    def _expire(self, now):
+        """Zaman aşımlarını işler; bir sonraki kontrol anını döndürür (kilit altında)"""
+        failed = []
+        for pending in list(self._in_flight.values()):
+            if pending.deadline > now:
+                continue
+            del self._in_flight[pending.id]
+            if pending.attempts < self.MAX_ATTEMPTS and pending.expires > now:
+                self.retries += 1
+                heapq.heappush(self._queue, (*pending.key, pending))
+            else:
+                failed.append((pending, "onay gelmedi"))
+        expired = [entry for entry in self._queue if entry[2].expires <= now]
+        if expired:
+            self._queue = [entry for entry in self._queue if entry[2].expires > now]
+            heapq.heapify(self._queue)
+            failed += [(entry[2], "gönderilemedi (bağlantı yok)") for entry in expired]
+        for pending, reason in failed:
+            self.command_failed.emit(pending.id, pending.command.name, reason)
+
+        times = [pending.deadline for pending in self._in_flight.values()]
+        times += [entry[2].expires for entry in self._queue]
+        return min(times) if times else None
+
+    def _read_loop(self):
+        parser = AckParser()
+        while self._running:
+            try:
+                link = serial.serial_for_url(self.port, baudrate=self.baudrate, timeout=0.1)
+            except (serial.SerialException, OSError):
+                self.connection_changed.emit(False)
+                time.sleep(self.RECONNECT_DELAY)
+                continue
+
+            with self._condition:
+                self.link = link
+                self._condition.notify()
+            self.connection_changed.emit(True)
+            try:
+                while self._running:
+                    data = link.read(link.in_waiting or 1)
+                    if data:
+                        for ack in parser.feed(data):
+                            self._acknowledge(ack)
+            except (serial.SerialException, OSError):
+                self.connection_changed.emit(False)
+            finally:
+                with self._condition:
+                    self.link = None
+                link.close()
+
+    def _acknowledge(self, ack):
+        now = time.monotonic()
+        with self._condition:
+            pending = self._in_flight.pop(ack.id, None)
+            late = pending is None
+            if late:
+                # Zaman aşımından sonra gelen onay: yeniden gönderilmek üzere bekleyen komut tamamlanır
+                entry = next((entry for entry in self._queue if entry[2].id == ack.id), None)
+                if entry is None:
+                    return  # Yeniden denenmiş komutun ikinci onayı
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                pending = entry[2]
+            rtt = now - pending.sent if pending.attempts == 1 and not late else -1.0
+            if rtt >= 0:
+                self.rtts.append(rtt)
+            self._condition.notify()
+        self.command_acked.emit(pending.id, pending.command.name, ack.status == ACK_ACCEPTED, rtt)
@@ -0,0 +1,96 @@
+import time
+
+from PySide6.QtCore import Qt, QObject, QRectF, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QPen
+
+BOX_COLOR = QColor("#00E676")
+TEXT_BACKGROUND = QColor(0, 0, 0, 150)
+
+
+def draw_detections(painter, rect, detections):
+    """Normalize tespit kutularını ve etiketlerini verilen alana çizer"""
+    painter.setFont(QFont("Arial", 9, QFont.Bold))
+    metrics = painter.fontMetrics()
+    painter.setBrush(Qt.NoBrush)
+    for det in detections:
+        box = QRectF(rect.x() + det.x * rect.width(), rect.y() + det.y * rect.height(),
+                     det.w * rect.width(), det.h * rect.height())
+        painter.setPen(QPen(BOX_COLOR, 2))
+        painter.drawRect(box)
+
+        # Etiket kutunun üstüne, yer yoksa kutunun içine yazılır
+        text = f"{det.label} {det.score:.0%}"
+        label_y = box.y() - metrics.height()
+        if label_y < rect.y():
+            label_y = box.y()
+        text_rect = QRectF(box.x(), label_y, metrics.horizontalAdvance(text) + 6, metrics.height())
+        painter.fillRect(text_rect, BOX_COLOR)
+        painter.setPen(Qt.black)
+        painter.drawText(text_rect, Qt.AlignCenter, text)
+
+
+class DetectionOverlay(QObject):
+    """Video yüzeyinin paintEvent'inde, ölçeklenmiş görüntünün üstüne çizilen kaplama
+
+    Kare tamponuna dokunulmaz; kutular, etiketler ve FPS yazısı her çizimde
+    QPainter ile eklenir. Kaplama kendi hızında (yeni sonuç, süre aşımı)
+    changed yayınlar, yüzey de sadece yeniden çizilir - kare yeniden ölçeklenmez.
+    """
+    changed = Signal()
+    STALE_AFTER_MS = 1000  # Yeni sonuç gelmezse kutular bu süre sonra kaldırılır
+    SMOOTHING = 0.2  # Tespit hızı için üstel ortalama katsayısı
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result = None
+        self.camera_fps = 0.0
+        self.detection_fps = 0.0
+        self._last_result_time = None
+
+        self._expire_timer = QTimer(self)
+        self._expire_timer.setSingleShot(True)
+        self._expire_timer.setInterval(self.STALE_AFTER_MS)
+        self._expire_timer.timeout.connect(self.clear)
+
+    def set_result(self, result):
+        """Yeni çıkarım sonucunu gösterir ve tespit hızını günceller"""
+        now = time.perf_counter()
+        if self._last_result_time is not None and now > self._last_result_time:
+            fps = 1.0 / (now - self._last_result_time)
+            self.detection_fps = fps if not self.detection_fps else \
+                self.detection_fps + (fps - self.detection_fps) * self.SMOOTHING
+        self._last_result_time = now
+        self.result = result
+        self._expire_timer.start()
+        self.changed.emit()
+
+    def set_camera_fps(self, fps):
+        self.camera_fps = fps
+        if self.result is not None:
+            self.changed.emit()
+
+    def clear(self):
+        self._expire_timer.stop()
+        self._last_result_time = None
+        self.detection_fps = 0.0
+        if self.result is not None:
+            self.result = None
+            self.changed.emit()
+
+    def paint(self, painter, rect):
+        """Kaplamayı görüntünün çizildiği alana (mantıksal piksel) çizer"""
+        if self.result is None:
+            return
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        draw_detections(painter, rect, self.result.detections)
+
+        text = (f"CAM {self.camera_fps:.1f} fps · DET {self.detection_fps:.1f} fps · "
+                f"{self.result.latency * 1e3:.0f} ms")
+        metrics = painter.fontMetrics()
+        text_rect = QRectF(rect.x() + 6, rect.y() + 6,
+                           metrics.horizontalAdvance(text) + 10, metrics.height() + 4)
+        painter.fillRect(text_rect, TEXT_BACKGROUND)
+        painter.setPen(Qt.white)
+        painter.drawText(text_rect, Qt.AlignCenter, text)
+        painter.restore()
@@ -0,0 +1,330 @@
+import glob
+import math
+import os
+import queue
+import shutil
+import threading
+import time
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject, QSettings, QStandardPaths
+
+from telemetry_handler import CHANNELS
+
+# Halka dosyası: 64 baytlık başlık + sabit boyutlu kayıtlar (little-endian)
+RING_MAGIC = b"ULGENTLM"
+RING_VERSION = 1
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("record_size", "<u4"),
+    ("capacity", "<u8"),
+    ("count", "<u8"),      # Şimdiye kadar yazılan toplam kayıt (halka başa dönse de artar)
+    ("created", "<f8"),    # Oturumun başladığı an (time.time())
+])
+
+# host_time kayıt anındaki bilgisayar saatidir; video kareleriyle eşleme bu saatle yapılır
+RECORD_DTYPE = np.dtype(
+    [("host_time", "<f8"), ("timestamp", "<f8"), ("seq", "<u4")]
+    + [(channel, "<f4") for channel in CHANNELS])  # 48 bayt
+
+TELEMETRY_FILE = "telemetry.ring"
+VIDEO_EXTENSION = ".avi"
+INDEX_EXTENSION = ".idx"  # Segmentteki her karenin host_time değeri (float64)
+
+
+class TelemetryRing:
+    """Telemetri kayıtlarını sabit kapasiteli, bellek eşlemeli halka dosyasına yazar
+
+    Yazma tek bir NumPy atamasıdır; sayfa önbelleğindeki veri uygulama
+    çökse bile dosyada kalır. capacity verilmezse mevcut dosya salt okunur açılır.
+    """
+
+    def __init__(self, path, capacity=None):
+        self.path = path
+        self._lock = threading.Lock()
+        if capacity is None:
+            self.header = np.memmap(path, dtype=HEADER_DTYPE, mode="r", shape=(1,))
+            if self.header["magic"][0] != RING_MAGIC or self.header["record_size"][0] != RECORD_DTYPE.itemsize:
+                raise ValueError(f"Geçersiz telemetri kaydı: {path}")
+            self.capacity = int(self.header["capacity"][0])
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r",
+                                     offset=HEADER_SIZE, shape=(self.capacity,))
+        else:
+            self.capacity = int(capacity)
+            with open(path, "wb") as f:
+                f.truncate(HEADER_SIZE + self.capacity * RECORD_DTYPE.itemsize)
+            self.header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            self.header["magic"] = RING_MAGIC
+            self.header["version"] = RING_VERSION
+            self.header["record_size"] = RECORD_DTYPE.itemsize
+            self.header["capacity"] = self.capacity
+            self.header["created"] = time.time()
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r+",
+                                     offset=HEADER_SIZE, shape=(self.capacity,))
+            # Seyrek dosyada her sayfanın ilk yazımı blok ayırır ve sayfa hatası verir;
+            # bu maliyet kayıt yolunda değil açılışta ödensin diye halka sıfırla doldurulur
+            self.records.view(np.uint8)[:] = 0
+
+    @property
+    def count(self):
+        return int(self.header["count"][0])
+
+    @property
+    def created(self):
+        return float(self.header["created"][0])
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append_records(self, records, host_time=None):
+        """TelemetryRecord listesini halkaya yazar (her thread'den çağrılabilir)"""
+        if not records:
+            return
+        host_time = time.time() if host_time is None else host_time
+        self.append_rows(np.array([(host_time, r.timestamp, r.seq) + tuple(r[2:]) for r in records],
+                                  dtype=RECORD_DTYPE))
+
+    def append_rows(self, rows):
+        """RECORD_DTYPE dizisini halkaya yazar"""
+        rows = rows[-self.capacity:]
+        with self._lock:
+            if self.records is None:
+                return  # Kapatıldı; okuma thread'i son grubu yazmaya çalışabilir
+            start = self.count % self.capacity
+            first = min(len(rows), self.capacity - start)
+            self.records[start:start + first] = rows[:first]
+            self.records[:len(rows) - first] = rows[first:]
+            # Sayaç en son güncellenir: okuyan taraf yarım kayıt görmez
+            self.header["count"] = self.count + len(rows)
+
+    def snapshot(self):
+        """Halkadaki kayıtları eskiden yeniye sıralı bir kopya olarak döndürür"""
+        with self._lock:
+            count = self.count
+            if count <= self.capacity:
+                return np.array(self.records[:count])
+            start = count % self.capacity
+            return np.concatenate((self.records[start:], self.records[:start]))
+
+    def flush(self):
+        if self.records is not None and self.records.mode == "r+":
+            self.records.flush()
+            self.header.flush()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self.records = None
+
+
+class VideoRecorder:
+    """Kareleri sınırlı bir kuyruktan alıp ayrı bir thread'de segment dosyalarına kodlayan kaydedici
+
+    submit() sadece kuyruğa referans bırakır; kuyruk doluysa kare atlanır.
+    Segmentler segment_seconds uzunluğundadır ve son keep_segments tanesi tutulur.
+    Çökmede sadece açık segment eksik kalabilir; kapanmış segmentler tamdır.
+    """
+    QUEUE_SIZE = 8
+    FOURCC = "MJPG"
+
+    def __init__(self, directory, name, fps=30.0, segment_seconds=60, keep_segments=11):
+        self.directory = directory
+        self.name = name
+        self.fps = fps
+        self.segment_seconds = segment_seconds
+        self.keep_segments = keep_segments
+        self.queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.written = 0
+        self.dropped = 0  # Kodlayıcı yetişemediği için atlanan kareler
+        self.segment = 0
+        self._thread = threading.Thread(target=self._run, name=f"VideoRecorder-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame, host_time=None):
+        """Kareyi kodlanmak üzere bırakır; GUI thread'ini asla bekletmez"""
+        try:
+            self.queue.put_nowait((time.time() if host_time is None else host_time, frame))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=2.0):
+        """Kuyruktaki kareleri yazıp kodlayıcıyı kapatır"""
+        self.queue.put(None)
+        self._thread.join(timeout)
+
+    def segment_path(self, segment, extension):
+        return os.path.join(self.directory, f"{self.name}_{segment:05d}{extension}")
+
+    def _run(self):
+        writer = index = None
+        segment_start = frame_size = None
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            host_time, frame = item
+            size = (frame.shape[1], frame.shape[0])
+
+            # Süre dolduysa veya kamera profili değiştiyse yeni segment
+            if writer is None or size != frame_size or host_time - segment_start >= self.segment_seconds:
+                if writer is not None:
+                    writer.release()
+                    index.close()
+                    self.segment += 1
+                writer = cv2.VideoWriter(self.segment_path(self.segment, VIDEO_EXTENSION),
+                                         cv2.VideoWriter_fourcc(*self.FOURCC), self.fps, size)
+                index = open(self.segment_path(self.segment, INDEX_EXTENSION), "wb")
+                segment_start, frame_size = host_time, size
+                self._prune()
+
+            writer.write(frame)
+            index.write(np.float64(host_time).tobytes())
+            self.written += 1
+
+        if writer is not None:
+            writer.release()
+            index.close()
+
+    def _prune(self):
+        """Son keep_segments segmentten eskilerini siler"""
+        oldest = self.segment - self.keep_segments
+        for segment in range(max(0, oldest - 1), oldest + 1):
+            for extension in (VIDEO_EXTENSION, INDEX_EXTENSION):
+                path = self.segment_path(segment, extension)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def default_directory():
+    """Kayıtların varsayılan yeri, ör. Linux'ta ~/.local/share/ULGEN/flights"""
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation), "ULGEN", "flights")
+
+
+class FlightRecorder(QObject):
+    """Telemetri ve kamera karelerini son N dakikayı tutan oturum klasörüne kaydeder
+
+    Her çalıştırma <klasör>/<tarih-saat>/ altında bir oturumdur: telemetry.ring
+    ve kamera başına cam<kaynak>_<segment>.avi/.idx dosyaları. Aynı saniyede
+    açılan ikinci oturum -2, -3... ekiyle ayrı klasöre yazılır. Telemetri de
+    video gibi kendi thread'inde yazılır: bellek eşlemeli dosya, çekirdek kirli
+    sayfaları diske yazarken milisaniyelerce bekletebilir. Kayıt thread'i her
+    kayıtta uyanmaz, WRITE_INTERVAL'da bir biriken grupları tek yazımla ekler;
+    çökmede en fazla bu kadarlık telemetri kaybolur.
+    """
+    WRITE_INTERVAL = 0.05  # s
+
+    def __init__(self, directory=None, minutes=None, record_video=None, parent=None):
+        super().__init__(parent)
+        settings = QSettings("ULGEN", "Dashboard")
+        directory = directory or settings.value("recorder/directory", "") or default_directory()
+        self.minutes = minutes or settings.value("recorder/minutes", 10, type=int)
+        self.record_video = record_video if record_video is not None else \
+            settings.value("recorder/video", False, type=bool)
+        self.video_fps = settings.value("recorder/video_fps", 30.0, type=float)
+        self.segment_seconds = settings.value("recorder/segment_seconds", 60, type=int)
+        telemetry_rate = settings.value("recorder/telemetry_rate", 200, type=int)
+
+        self.session = create_session(directory)
+        self.telemetry = TelemetryRing(os.path.join(self.session, TELEMETRY_FILE),
+                                       self.minutes * 60 * telemetry_rate)
+        prune_sessions(directory, settings.value("recorder/sessions", 5, type=int),
+                       settings.value("recorder/keep_hours", 24.0, type=float) * 3600)
+        self.video = {}  # kaynak -> VideoRecorder
+        self.closed = False
+        self._telemetry_queue = queue.SimpleQueue()  # (host_time, kayıtlar); telemetri atılmaz
+        self._stop = threading.Event()
+        self._telemetry_thread = threading.Thread(target=self._write_telemetry, name="TelemetryRecorder",
+                                                  daemon=True)
+        self._telemetry_thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
+
+    def record_telemetry(self, records):
+        """Telemetri kaynağının alıcısı (okuma thread'inde veya GUI'de çağrılır); sadece kuyruğa bırakır"""
+        if not self.closed:
+            self._telemetry_queue.put((time.time(), records))
+
+    def record_frame(self, frame, source):
+        """Kamera karesini kaynağın kodlayıcı kuyruğuna bırakır"""
+        if self.closed or not self.record_video:
+            return
+        recorder = self.video.get(source)
+        if recorder is None:
+            keep = math.ceil(self.minutes * 60 / self.segment_seconds) + 1
+            recorder = VideoRecorder(self.session, f"cam{source}", self.video_fps, self.segment_seconds, keep)
+            self.video[source] = recorder
+        recorder.submit(frame)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for recorder in self.video.values():
+            recorder.close()
+        self._stop.set()
+        self._telemetry_thread.join(2.0)
+        self.telemetry.close()
+
+    def _write_telemetry(self):
+        while True:
+            stopping = self._stop.wait(self.WRITE_INTERVAL)
+            rows = []
+            while not self._telemetry_queue.empty():
+                host_time, records = self._telemetry_queue.get_nowait()
+                rows.extend((host_time, r.timestamp, r.seq) + tuple(r[2:]) for r in records)
+            if rows:
+                self.telemetry.append_rows(np.array(rows, dtype=RECORD_DTYPE))
+            if stopping:
+                break
+
+
+def create_session(directory):
+    """Yeni oturum klasörünü oluşturur; ad varsa -2, -3... eki denenir"""
+    os.makedirs(directory, exist_ok=True)
+    name = time.strftime("%Y%m%d-%H%M%S")
+    path, suffix = os.path.join(directory, name), 1
+    while True:
+        try:
+            os.mkdir(path)
+            return path
+        except FileExistsError:
+            suffix += 1
+            path = os.path.join(directory, f"{name}-{suffix}")
+
+
+def session_key(path):
+    """Oturumları başlama sırasına dizer: ad, sonra sayısal ek (…-10, …-2'den sonra)"""
+    name = os.path.basename(path)
+    stamp, _, suffix = name.rpartition("-")
+    if name.count("-") >= 2 and suffix.isdigit():
+        return stamp, int(suffix)
+    return name, 1
+
+
+def last_written(path):
+    """Oturum klasöründeki dosyaların en yeni değişiklik zamanı"""
+    return max((entry.stat().st_mtime for entry in os.scandir(path) if entry.is_file()),
+               default=os.path.getmtime(path))
+
+
+def prune_sessions(directory, keep, min_age=0.0):
+    """En yeni keep oturum dışında, min_age saniyedir yazılmamış olanları siler
+
+    Art arda yeniden başlatmalar yeni oturumu hemen eskiyi siler hale
+    getirmesin diye yakın zamanda yazılmış oturumlar sayıya bakılmadan kalır.
+    """
+    sessions = sorted((path for path in glob.glob(os.path.join(directory, "*"))
+                       if os.path.exists(os.path.join(path, TELEMETRY_FILE))), key=session_key)
+    now = time.time()
+    for path in sessions[:-keep] if keep > 0 else []:
+        try:
+            if now - last_written(path) < min_age:
+                continue
+        except OSError:
+            continue  # Başka bir süreç tarafından silinmiş
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,362 @@
+import glob
+import os
+import re
+import threading
+import time
+
+import cv2
+import numpy as np
+from PySide6.QtCore import Qt, QCoreApplication, QObject, QTimer, Signal
+
+from flight_recorder import INDEX_EXTENSION, TELEMETRY_FILE, VIDEO_EXTENSION, TelemetryRing
+from telemetry_handler import CHANNELS, TelemetryRecord
+
+MIN_SPEED = 0.25
+MAX_SPEED = 16.0
+SPEED_STEPS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+SEGMENT_PATTERN = re.compile(r"cam(.+)_(\d{5})$")  # FlightRecorder: cam<kaynak>_<segment>
+
+
+def to_record(row):
+    """Halka dosyasındaki bir satırı TelemetryRecord'a çevirir"""
+    return TelemetryRecord(int(row["seq"]), float(row["timestamp"]), *(float(row[c]) for c in CHANNELS))
+
+
+def format_clock(seconds):
+    """Saniyeyi MM:SS (bir saatten uzunsa S:MM:SS) olarak yazar"""
+    minutes, seconds = divmod(int(max(seconds, 0)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class CameraLog:
+    """Bir kameranın segmentlerini tek bir kare ekseninde birleştiren indeks
+
+    times tüm segmentlerdeki karelerin art arda host_time değerleridir,
+    starts[i] i. segmentin ilk karesinin genel sırasıdır. Zamandan kareye
+    ve kareden segmente geçiş np.searchsorted ile yapılır; dosya taranmaz.
+    """
+
+    def __init__(self, source, segments):
+        self.source = source
+        self.paths = []
+        starts, times = [], []
+        count = 0
+        for video_path, index_path in segments:
+            frame_times = np.fromfile(index_path, dtype="<f8")
+            if not len(frame_times):
+                continue
+            self.paths.append(video_path)
+            starts.append(count)
+            times.append(frame_times)
+            count += len(frame_times)
+        self.starts = np.array(starts, dtype=np.int64)
+        self.times = np.concatenate(times) if times else np.empty(0, dtype="<f8")
+
+    def __len__(self):
+        return len(self.times)
+
+    def frame_at(self, t):
+        """t anında ekranda olan karenin genel sırası (-1: henüz kare yok)"""
+        return int(np.searchsorted(self.times, t, side="right")) - 1
+
+    def locate(self, index):
+        """Genel kare sırasını (segment, segment içi sıra) çiftine çevirir"""
+        segment = int(np.searchsorted(self.starts, index, side="right")) - 1
+        return segment, index - int(self.starts[segment])
+
+
+class FlightLog:
+    """FlightRecorder oturum klasörü: telemetri kayıtları ve kamera indeksleri
+
+    Hepsi kayıt anındaki bilgisayar saatinde (host_time) hizalıdır; oynatma
+    bu eksende ilerler.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        ring = TelemetryRing(os.path.join(session, TELEMETRY_FILE))
+        try:
+            records = ring.snapshot()
+        finally:
+            ring.close()
+        # Halka yazma sırasıyla döner; saat geri alındıysa arama için yine sıralanır
+        if len(records) > 1 and np.any(np.diff(records["host_time"]) < 0):
+            records = records[np.argsort(records["host_time"], kind="stable")]
+        self.telemetry = records
+        self.times = records["host_time"]
+
+        segments = {}
+        for video_path in sorted(glob.glob(os.path.join(session, "cam*" + VIDEO_EXTENSION))):
+            base = os.path.splitext(video_path)[0]
+            match = SEGMENT_PATTERN.match(os.path.basename(base))
+            if match is None or not os.path.exists(base + INDEX_EXTENSION):
+                continue
+            source = int(match.group(1)) if match.group(1).isdigit() else match.group(1)
+            segments.setdefault(source, []).append((video_path, base + INDEX_EXTENSION))
+        self.cameras = {}
+        for source, paths in segments.items():
+            camera = CameraLog(source, paths)
+            if len(camera):
+                self.cameras[source] = camera
+
+        axes = [times for times in [self.times] + [c.times for c in self.cameras.values()] if len(times)]
+        if not axes:
+            raise ValueError(f"Kayıt boş: {session}")
+        self.start = min(float(times[0]) for times in axes)
+        self.end = max(float(times[-1]) for times in axes)
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    def telemetry_at(self, t):
+        """t anındaki (t'den önceki en yeni) telemetri kaydının sırası (-1: henüz yok)"""
+        return int(np.searchsorted(self.times, t, side="right")) - 1
+
+
+class ReplayDecoder(QObject):
+    """Bir kameranın kayıtlı karelerini ayrı thread'de çözen işçi
+
+    Sadece en son istenen kare çözülür; oynatma çözücüden hızlıysa aradaki
+    kareler atlanır. Ardışık karede okumaya devam edilir, atlamada
+    CAP_PROP_POS_FRAMES ile konumlanılır (MJPG'de her kare bağımsızdır).
+    """
+    frame_ready = Signal()
+
+    def __init__(self, camera, parent=None):
+        super().__init__(parent)
+        self.camera = camera
+        self._cond = threading.Condition()
+        self._wanted = None
+        self._result = None
+        self._pending = False
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"ReplayDecoder-{camera.source}", daemon=True)
+        self._thread.start()
+
+    def request(self, index):
+        """Genel sırası index olan kareyi ister; bekleyen eski istek ezilir"""
+        with self._cond:
+            self._wanted = index
+            self._cond.notify()
+
+    def take_frame(self):
+        """Son çözülen (sıra, kare) çiftini döndürür; kare okunamadıysa None'dır"""
+        with self._cond:
+            result, self._result = self._result, None
+            self._pending = False
+        return result
+
+    def stop(self, timeout=1.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        capture = None
+        segment = position = None  # Açık segment ve sıradaki read()'in vereceği kare
+        while True:
+            with self._cond:
+                while self._running and self._wanted is None:
+                    self._cond.wait()
+                if not self._running:
+                    break
+                index, self._wanted = self._wanted, None
+
+            wanted_segment, local = self.camera.locate(index)
+            if wanted_segment != segment:
+                if capture is not None:
+                    capture.release()
+                capture = cv2.VideoCapture(self.camera.paths[wanted_segment])
+                segment, position = wanted_segment, 0
+            if local != position:
+                capture.set(cv2.CAP_PROP_POS_FRAMES, local)
+            ok, frame = capture.read()
+            # Çökmede açık kalmış segment okunamayabilir; telemetri yine de ilerler
+            position = local + 1 if ok else None
+
+            with self._cond:
+                self._result = (index, frame if ok else None)
+                notify = not self._pending
+                self._pending = True
+            if notify:
+                self.frame_ready.emit()
+
+        if capture is not None:
+            capture.release()
+
+
+class ReplayEngine(QObject):
+    """Kayıtlı bir uçuşu canlı verilerle aynı yoldan oynatır
+
+    Telemetri TelemetryBus'a (ve varsa alıcılara), kareler frame_ready ile
+    VideoFeedWidget'lara gider. Saat kayıt zamanında 0.25x-16x hızla
+    ilerler. Eşitleme kaynağının karesi teslim edilirken veri yoluna tam o
+    karenin anındaki telemetri yayınlanır; çözücü geride kalsa bile
+    göstergeler görüntüdeki anı gösterir. O anda kare yoksa telemetri saati izler.
+    """
+    frame_ready = Signal(object, object)  # (kare, kaynak) - VideoFeedWidget.frame_received ile aynı
+    position_changed = Signal(float)  # Oynatma konumu (host_time); durum veya hız değişince de yayınlanır
+    seeked = Signal(float)  # Atlamada; alıcılar biriktirdiği geçmişi sıfırlayabilir
+    finished = Signal()
+    INTERVAL = 10  # ms
+    MAX_FRAME_GAP = 0.5  # Eşitleme karesi bundan eskiyse (kamera kaydedilmemiş) saat izlenir
+    MAX_SINK_RECORDS = 10000  # Alıcılara tek adımda verilecek en fazla kayıt
+
+    def __init__(self, log, bus, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.bus = bus
+        self.position = log.start
+        self.speed = 1.0
+        self.playing = False
+        self.sinks = []  # GUI thread'inde oynatılan her kayıt grubuyla çağrılan alıcılar
+        self.sync_source = min(log.cameras, key=str) if log.cameras else None
+        self.frame_times = {}  # kaynak -> son teslim edilen karenin host_time değeri
+        self._telemetry_index = None
+        self._requested = {}  # kaynak -> en son istenen kare
+        self._first_requested = {}  # kaynak -> son atlamadan beri istenen ilk kare
+        self._last_tick = None
+
+        self.decoders = {}
+        for source, camera in log.cameras.items():
+            decoder = ReplayDecoder(camera, self)
+            decoder.frame_ready.connect(self._deliver_frames)
+            self.decoders[source] = decoder
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(self.INTERVAL)
+        self.timer.timeout.connect(self._tick)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def add_sink(self, sink):
+        """Oynatılan kayıtları alacak bir fonksiyon ekler (SerialTelemetryReader ile aynı)"""
+        self.sinks.append(sink)
+
+    def play(self):
+        if self.position >= self.log.end:
+            self.seek(self.log.start)
+        self.playing = True
+        self._last_tick = time.perf_counter()
+        self.timer.start()
+        self.position_changed.emit(self.position)
+
+    def pause(self):
+        self.playing = False
+        self.timer.stop()
+        self.position_changed.emit(self.position)
+
+    def toggle(self):
+        self.pause() if self.playing else self.play()
+
+    def set_speed(self, speed):
+        self.speed = min(max(float(speed), MIN_SPEED), MAX_SPEED)
+        self.position_changed.emit(self.position)
+
+    def faster(self):
+        self.set_speed(next((s for s in SPEED_STEPS if s > self.speed), MAX_SPEED))
+
+    def slower(self):
+        self.set_speed(next((s for s in reversed(SPEED_STEPS) if s < self.speed), MIN_SPEED))
+
+    def seek(self, position):
+        """Kayıtta verilen ana atlar; kare ve kayıt indeksten bulunur"""
+        position = min(max(position, self.log.start), self.log.end)
+        self._telemetry_index = None
+        self._requested.clear()
+        self._first_requested.clear()
+        self.seeked.emit(position)
+        self._move(position)
+
+    def refresh(self):
+        """Konumdaki kareleri yeniden ister (ör. izlenen kamera değişince)"""
+        self._requested.clear()
+        self._first_requested.clear()
+        self._move(self.position)
+
+    def set_sync_source(self, source):
+        """Göstergelerin eşleneceği kamerayı değiştirir; kaydı olmayan kaynak yok sayılır"""
+        if source in self.decoders:
+            self.sync_source = source
+
+    def status_text(self):
+        state = "▶" if self.playing else "⏸"
+        return (f"{state} {self.speed:g}× {format_clock(self.position - self.log.start)} / "
+                f"{format_clock(self.log.duration)}")
+
+    def stop(self):
+        self.timer.stop()
+        self.playing = False
+        for decoder in self.decoders.values():
+            decoder.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        elapsed, self._last_tick = now - self._last_tick, now
+        position = self.position + elapsed * self.speed
+        if position < self.log.end:
+            self._move(position)
+            return
+        self._move(self.log.end)
+        self.pause()
+        self.finished.emit()
+
+    def _move(self, position):
+        self.position = position
+        follow_clock = True
+        for source, decoder in self.decoders.items():
+            index = decoder.camera.frame_at(position)
+            if index < 0:
+                continue
+            if source == self.sync_source and position - decoder.camera.times[index] <= self.MAX_FRAME_GAP:
+                follow_clock = False  # Telemetri kare teslim edilince yayınlanır
+            if self._requested.get(source) != index:
+                self._requested[source] = index
+                self._first_requested.setdefault(source, index)
+                decoder.request(index)
+        if follow_clock:
+            self._publish_telemetry(position)
+        self.position_changed.emit(position)
+
+    def _deliver_frames(self):
+        for source, decoder in self.decoders.items():
+            result = decoder.take_frame()
+            if result is None:
+                continue
+            index, frame = result
+            # Atlamadan önce istenmiş kare eski anın telemetrisini yayınlamasın. Oynatma
+            # hep ileri gider; geride kalan çözücünün atlamadan sonraki kareleri geçerlidir.
+            if not self._first_requested.get(source, index + 1) <= index <= self._requested[source]:
+                continue
+            frame_time = float(decoder.camera.times[index])
+            # Telemetri kareden önce yayınlanır: kareyi alan, aynı anın verisini görür
+            if source == self.sync_source:
+                self._publish_telemetry(frame_time)
+            if frame is not None:
+                self.frame_times[source] = frame_time
+                self.frame_ready.emit(frame, source)
+
+    def _publish_telemetry(self, t):
+        index = self.log.telemetry_at(t)
+        if index < 0 or index == self._telemetry_index:
+            return
+        previous, self._telemetry_index = self._telemetry_index, index
+        rows = self.log.telemetry
+        if not self.sinks:
+            self.bus.publish_record(to_record(rows[index]))
+            return
+
+        # İleri oynatmada aradaki tüm kayıtlar alıcılara gider; atlamada sadece hedef kayıt
+        if previous is not None and previous < index and index - previous <= self.MAX_SINK_RECORDS:
+            records = [to_record(row) for row in rows[previous + 1:index + 1]]
+        else:
+            records = [to_record(rows[index])]
+        for sink in self.sinks:
+            sink(records)
+        self.bus.publish_records(records)
@@ -0,0 +1,387 @@
+"""Kamera karelerinde nesne tespiti: dedektörler ve toplu çıkarım motoru
+
+Dedektör ortak bir taban sınıf gerektirmez; şu arayüzü sağlayan her nesne olur:
+
+    name                          durum satırında gösterilen ad
+    detect(frame, source)         tek BGR kare -> Detection listesi
+    detect_batch(frames, sources) isteğe bağlı; karelerin hepsi için tek çağrı
+
+detect_batch tanımlı değilse motor kareleri detect_each ile tek tek işler.
+"""
+import math
+import os
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QObject, QSettings, Signal
+
+# Kutular kareye göre normalize (0-1) tutulur; her boyuttaki yüzeye çizilebilir
+Detection = namedtuple("Detection", ["label", "score", "x", "y", "w", "h"])
+
+# Bir karenin analiz sonucu; frame analiz edilen karenin kendisidir (kopya değil)
+InferenceResult = namedtuple("InferenceResult",
+                             ["seq", "source", "frame", "detections", "latency", "detector", "batch_size"])
+
+# Toplu çıkarım sayaçları; gecikmeler saniye, verim kare/saniye
+BatchStats = namedtuple("BatchStats",
+                        ["batches", "frames", "dropped", "mean_batch_size", "batch_latency", "throughput"])
+
+DEFAULT_INPUT_SIZE = 640
+DEFAULT_CONFIDENCE = 0.4
+DEFAULT_BATCH_SIZE = 2  # Araç ve dron kamerası
+DEFAULT_MAX_WAIT_MS = 10
+NMS_THRESHOLD = 0.45
+
+
+def load_labels(path):
+    """Satır başına bir sınıf adı içeren etiket dosyasını okur"""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def decode_yolo(output, input_size, confidence, labels):
+    """YOLO çıktısını normalize Detection listesine çevirir
+
+    YOLOv8 çıktısı (1, 4+C, N), YOLOv5 çıktısı (1, N, 5+C) biçimindedir;
+    v5'te sınıf skorları nesne skoru ile çarpılır.
+    """
+    rows = np.squeeze(output, axis=0)
+    if rows.shape[0] < rows.shape[1]:
+        rows = rows.T  # YOLOv8: kanal önce
+        scores = rows[:, 4:]
+    else:
+        scores = rows[:, 5:] * rows[:, 4:5]
+
+    class_ids = scores.argmax(axis=1)
+    best = scores[np.arange(len(scores)), class_ids]
+    keep = best >= confidence
+    if not keep.any():
+        return []
+
+    # cx, cy, w, h giriş pikseli cinsinden; sol üst köşe ve normalize boyuta çevrilir
+    boxes = rows[keep, :4] / input_size
+    boxes[:, 0] -= boxes[:, 2] / 2
+    boxes[:, 1] -= boxes[:, 3] / 2
+    best, class_ids = best[keep], class_ids[keep]
+
+    indices = cv2.dnn.NMSBoxes(boxes.tolist(), best.tolist(), confidence, NMS_THRESHOLD)
+    detections = []
+    for i in np.array(indices).flatten():
+        class_id = int(class_ids[i])
+        label = labels[class_id] if class_id < len(labels) else f"class {class_id}"
+        x, y, w, h = (float(v) for v in boxes[i])
+        detections.append(Detection(label, float(best[i]), x, y, w, h))
+    return detections
+
+
+def detect_each(detector, frames, sources):
+    """Toplu çıkarımı olmayan dedektörde kareleri tek tek işler"""
+    return [detector.detect(frame, source) for frame, source in zip(frames, sources)]
+
+
+class OnnxDetector:
+    """OpenCV DNN ile bir ONNX (YOLO) modelini çalıştıran dedektör"""
+
+    def __init__(self, path, input_size=DEFAULT_INPUT_SIZE, confidence=DEFAULT_CONFIDENCE, labels=()):
+        self.net = cv2.dnn.readNetFromONNX(path)
+        self.input_size = input_size
+        self.confidence = confidence
+        self.labels = list(labels)
+        self.name = f"ONNX {os.path.basename(path)}"
+        self.batchable = True  # Sabit batch=1 ile dışa aktarılmış modellerde False olur
+
+    def detect(self, frame, source=None):
+        # blobFromImage ölçekleme, BGR->RGB ve 0-1 aralığını tek adımda yapar
+        blob = cv2.dnn.blobFromImage(frame, 1 / 255.0, (self.input_size, self.input_size),
+                                     swapRB=True, crop=False)
+        self.net.setInput(blob)
+        return decode_yolo(self.net.forward(), self.input_size, self.confidence, self.labels)
+
+    def detect_batch(self, frames, sources):
+        """Kareleri tek bir NCHW NumPy bloğunda toplayıp modeli bir kez çalıştırır"""
+        if self.batchable and len(frames) > 1:
+            blob = cv2.dnn.blobFromImages(frames, 1 / 255.0, (self.input_size, self.input_size),
+                                          swapRB=True, crop=False)
+            try:
+                self.net.setInput(blob)
+                output = self.net.forward()
+            except cv2.error:
+                self.batchable = False
+            else:
+                return [decode_yolo(output[i:i + 1], self.input_size, self.confidence, self.labels)
+                        for i in range(len(frames))]
+        return detect_each(self, frames, sources)
+
+
+class HogPersonDetector:
+    """Model dosyası yokken kullanılan OpenCV HOG insan dedektörü"""
+    MAX_WIDTH = 480  # Hız için kare bu genişliğe küçültülür
+
+    def __init__(self, confidence=DEFAULT_CONFIDENCE):
+        self.hog = cv2.HOGDescriptor()
+        self.hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+        self.confidence = confidence
+        self.name = "HOG person"
+
+    def detect(self, frame, source=None):
+        scale = min(1.0, self.MAX_WIDTH / frame.shape[1])
+        small = cv2.resize(frame, None, fx=scale, fy=scale) if scale < 1.0 else frame
+        rects, weights = self.hog.detectMultiScale(small, winStride=(8, 8), padding=(8, 8), scale=1.05)
+        height, width = small.shape[:2]
+
+        detections = []
+        for (x, y, w, h), weight in zip(rects, np.ravel(weights)):
+            # SVM mesafesi olasılık değildir; sigmoid ile 0-1 aralığına taşınır
+            score = 1.0 / (1.0 + math.exp(-float(weight)))
+            if score >= self.confidence:
+                detections.append(Detection("person", score, x / width, y / height, w / width, h / height))
+        return detections
+
+
+class MotionDetector:
+    """HOG'un olmadığı OpenCV sürümlerinde (5.x) kullanılan hareket dedektörü
+
+    Arka plan çıkarma ile hareketli bölgeleri bulur; skor kutudaki ön plan oranıdır.
+    Arka plan modeli kareler arasında tutulduğu için ilk karelerde tespit olmaz.
+    """
+    MAX_WIDTH = 320
+    MIN_AREA = 0.002  # Karenin bu oranından küçük bölgeler gürültü sayılır
+
+    def __init__(self, confidence=DEFAULT_CONFIDENCE):
+        self.subtractors = {}  # Arka plan modeli kaynak başına ayrı tutulur
+        self.kernel = np.ones((5, 5), np.uint8)
+        self.confidence = confidence
+        self.name = "motion"
+
+    def detect(self, frame, source=None):
+        scale = min(1.0, self.MAX_WIDTH / frame.shape[1])
+        small = cv2.resize(frame, None, fx=scale, fy=scale) if scale < 1.0 else frame
+        subtractor = self.subtractors.get(source)
+        if subtractor is None:
+            subtractor = cv2.createBackgroundSubtractorMOG2(history=200, detectShadows=False)
+            self.subtractors[source] = subtractor
+        mask = cv2.dilate(subtractor.apply(small), self.kernel, iterations=2)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        height, width = mask.shape[:2]
+
+        detections = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if w * h < self.MIN_AREA * width * height:
+                continue
+            score = float(np.count_nonzero(mask[y:y + h, x:x + w])) / (w * h)
+            if score >= self.confidence:
+                detections.append(Detection("motion", score, x / width, y / height, w / width, h / height))
+        return detections
+
+
+def create_detector(settings=None):
+    """Ayarlardaki modeli yükler; "inference/model" boşsa HOG veya hareket dedektörüne düşer"""
+    settings = settings or QSettings("ULGEN", "Dashboard")
+    confidence = settings.value("inference/confidence", DEFAULT_CONFIDENCE, type=float)
+    path = settings.value("inference/model", "")
+    if path:
+        return OnnxDetector(path,
+                            settings.value("inference/input_size", DEFAULT_INPUT_SIZE, type=int),
+                            confidence,
+                            load_labels(settings.value("inference/labels", "")))
+    if hasattr(cv2, "HOGDescriptor"):
+        return HogPersonDetector(confidence)
+    return MotionDetector(confidence)
+
+
+class InferenceEngine(QObject):
+    """Kareleri GUI thread'i dışında, bir işçi havuzunda toplu analiz eden çıkarım motoru
+
+    Kuyruk yoktur: her kaynaktan sadece en yeni kare bekler, model yetişemezse
+    eski kare ezilir. Bir işçi etkin kaynakların bekleyen karelerini en fazla
+    batch_size kadar toplayıp modeli bir kez çalıştırır; diğer kaynakların
+    karesi için en fazla max_wait bekler. Sonuçlar kamera kareleri gibi
+    bildirim + take_results() ile kaynak başına alınır.
+    """
+    result_ready = Signal()
+    model_loaded = Signal(str)
+    model_failed = Signal(str)
+    batch_failed = Signal(str)  # Tek bir toplu iş hata verdi; iş atlanır, motor çalışmaya devam eder
+    ACTIVE_WINDOW = 1.0  # Bu süre içinde kare gönderen kaynak etkin sayılır (s)
+    THROUGHPUT_WINDOW = 1.0  # Verim bu aralıklarla yeniden hesaplanır (s)
+    SMOOTHING = 0.1  # Toplu gecikme için üstel ortalama katsayısı
+
+    def __init__(self, workers=None, batch_size=None, max_wait_ms=None, parent=None):
+        super().__init__(parent)
+        settings = QSettings("ULGEN", "Dashboard")
+        self.worker_count = max(1, workers or settings.value("inference/workers", 1, type=int))
+        self.batch_size = max(1, batch_size or settings.value("inference/batch_size", DEFAULT_BATCH_SIZE, type=int))
+        if max_wait_ms is None:
+            max_wait_ms = settings.value("inference/max_wait_ms", DEFAULT_MAX_WAIT_MS, type=int)
+        self.max_wait = max_wait_ms / 1000.0
+        self._cond = threading.Condition()
+        self._latest = {}  # kaynak -> (seq, kare): kaynak başına analiz bekleyen tek kare
+        self._last_submit = {}  # kaynak -> son gönderim zamanı (etkin kaynak sayımı için)
+        self._seq = 0
+        self._results = {}  # kaynak -> en yeni InferenceResult
+        self._result_seq = {}  # kaynak -> yayınlanan en yeni sonucun kare sırası
+        self._pending = False  # GUI henüz son bildirimi işlemediyse True
+        self._running = False
+        self._threads = []
+        self.detector_name = None
+
+        # Sayaçlar (stats() ile anlık görüntüsü alınır)
+        self.dropped = 0  # Analiz edilmeden ezilen kare sayısı
+        self.failed = 0  # Model hata verdiği için atlanan toplu işler
+        self.batches = 0
+        self.frames = 0
+        self.batch_latency = 0.0
+        self.throughput = 0.0
+        self._window_start = time.perf_counter()
+        self._window_frames = 0
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def start(self):
+        """İşçileri başlatır; model her işçide ayrı yüklenir (cv2.dnn.Net paylaşılamaz)"""
+        if self._running:
+            return
+        self._running = True
+        for i in range(self.worker_count):
+            thread = threading.Thread(target=self._run, name=f"InferenceWorker-{i}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, frame, source=None, one_shot=False):
+        """Kaynağın karesini analiz için bırakır ve sıra numarasını döndürür
+
+        Sadece referans saklanır; GUI thread'inde kopya veya ön işleme yapılmaz.
+        one_shot kareler (ör. tek görüntü analizi) etkin kaynak sayılmaz; toplu
+        iş onların kaynağından yeni kare beklemez.
+        """
+        with self._cond:
+            if source in self._latest:
+                self.dropped += 1
+            self._seq += 1
+            self._latest[source] = (self._seq, frame)
+            if not one_shot:
+                self._last_submit[source] = time.perf_counter()
+            self._cond.notify()
+            return self._seq
+
+    def take_results(self):
+        """Kaynak başına en yeni sonuçları döndürür ve bildirimi sıfırlar"""
+        with self._cond:
+            results, self._results = self._results, {}
+            self._pending = False
+        return results
+
+    def stats(self):
+        """Toplu çıkarım sayaçlarının anlık görüntüsü"""
+        with self._cond:
+            mean_batch = self.frames / self.batches if self.batches else 0.0
+            return BatchStats(self.batches, self.frames, self.dropped, mean_batch,
+                              self.batch_latency, self.throughput)
+
+    def stop(self, timeout=1.0):
+        """İşçileri durdurur; süren analiz en fazla timeout kadar beklenir"""
+        with self._cond:
+            self._running = False
+            self._latest.clear()
+            self._cond.notify_all()
+        threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def _expected_sources(self, now):
+        """Son ACTIVE_WINDOW içinde kare gönderen kaynak sayısı (en fazla batch_size)"""
+        active = sum(1 for t in self._last_submit.values() if now - t < self.ACTIVE_WINDOW)
+        return min(self.batch_size, active)
+
+    def _take_batch(self):
+        """Bekleyen karelerden bir toplu iş oluşturur; durdurulduysa None döndürür
+
+        _cond kilidi tutulurken çağrılır.
+        """
+        while self._running and not self._latest:
+            self._cond.wait()
+        # İlk kare geldi; diğer etkin kaynakların karesi en fazla max_wait beklenir
+        deadline = time.perf_counter() + self.max_wait
+        while self._running:
+            now = time.perf_counter()
+            if len(self._latest) >= self._expected_sources(now) or now >= deadline:
+                break
+            self._cond.wait(deadline - now)
+        if not self._running:
+            return None
+
+        # En eski kareler önce; toplu işe girmeyenler bir sonraki işe kalır
+        items = sorted(self._latest.items(), key=lambda item: item[1][0])[:self.batch_size]
+        for source, _ in items:
+            del self._latest[source]
+        return [(source, seq, frame) for source, (seq, frame) in items]
+
+    def _run(self):
+        try:
+            detector = create_detector()
+        except Exception as e:  # cv2.error, bozuk veya bulunamayan model dosyası
+            self.model_failed.emit(f"{type(e).__name__}: {e}")
+            return
+        self.detector_name = detector.name
+        self.model_loaded.emit(detector.name)
+
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if batch is None:
+                return
+
+            sources = [source for source, seq, frame in batch]
+            frames = [frame for source, seq, frame in batch]
+            start = time.perf_counter()
+            try:
+                if hasattr(detector, "detect_batch"):
+                    all_detections = detector.detect_batch(frames, sources)
+                else:
+                    all_detections = detect_each(detector, frames, sources)
+            except Exception as e:  # cv2.error: beklenmeyen kare boyutu, bozuk kare vb.
+                # İşçi ölmez; toplu iş atlanır, sıradaki karelerle devam edilir
+                with self._cond:
+                    self.failed += 1
+                self.batch_failed.emit(f"{type(e).__name__}: {e}")
+                continue
+            end = time.perf_counter()
+            latency = end - start
+
+            with self._cond:
+                self._record_batch(len(batch), latency, end)
+                for (source, seq, frame), detections in zip(batch, all_detections):
+                    # Birden fazla işçide aynı kaynağın daha yeni karesi önce bitmiş olabilir
+                    if seq < self._result_seq.get(source, 0):
+                        continue
+                    self._result_seq[source] = seq
+                    self._results[source] = InferenceResult(
+                        seq, source, frame, detections, latency, detector.name, len(batch))
+                notify = bool(self._results) and not self._pending
+                self._pending = self._pending or notify
+
+            # GUI yetişemiyorsa kuyruğa yeni olay eklenmez, eski sonuç ezilir
+            if notify:
+                self.result_ready.emit()
+
+    def _record_batch(self, size, latency, now):
+        """Sayaçları günceller; _cond kilidi tutulurken çağrılır"""
+        self.batches += 1
+        self.frames += size
+        if self.batches == 1:
+            self.batch_latency = latency
+        else:
+            self.batch_latency += (latency - self.batch_latency) * self.SMOOTHING
+        self._window_frames += size
+        elapsed = now - self._window_start
+        if elapsed >= self.THROUGHPUT_WINDOW:
+            self.throughput = self._window_frames / elapsed
+            self._window_start, self._window_frames = now, 0
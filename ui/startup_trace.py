@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Açılış izleme: ULGEN_PROFILE_STARTUP=1 veya --profile-startup ile açılır.
+# Süreler rapora kadar her zaman kaydedilir (ucuzdur), rapor sadece açıkken yazdırılır.
+ENV_VAR = "ULGEN_PROFILE_STARTUP"
+CLI_FLAG = "--profile-startup"
+
+enabled = bool(os.environ.get(ENV_VAR)) or CLI_FLAG in sys.argv
+
+_origin = time.perf_counter()  # İzlemenin sıfır noktası (ilk import)
+_events = []  # (isim, başlangıç, süre veya None, derinlik)
+_local = threading.local()  # İç içe derinlik iş parçacığı başına tutulur
+_marked = set()
+_reported = False
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+@contextmanager
+def span(name):
+    """Bir kod bloğunun süresini kaydeder; iç içe bloklar girintili raporlanır"""
+    start = time.perf_counter()
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        _record(name, start, time.perf_counter() - start, depth)
+
+
+def traced(fn):
+    """Fonksiyonun her çağrısını span olarak kaydeden dekoratör"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(fn.__qualname__):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def mark(name, once=True):
+    """Anlık bir olayı kaydeder (ör. ilk kare); once=True ise sadece ilki"""
+    if once:
+        if name in _marked:
+            return
+        _marked.add(name)
+    _record(name, time.perf_counter(), None, getattr(_local, "depth", 0))
+
+
+def _format(name, start, duration, depth):
+    offset = (start - _origin) * 1e3
+    took = f"{duration * 1e3:9.1f} ms" if duration is not None else " " * 12
+    return f"  +{offset:8.1f} ms {took}  {'  ' * depth}{name}"
+
+
+def _record(name, start, duration, depth):
+    # Rapordan sonra gelen olaylar (ör. tembel sayfa, ilk kare) saklanmaz, açıksa anında
+    # yazdırılır; tema değişimi gibi tekrar eden izli çağrılar listeyi büyütmez
+    if _reported:
+        if enabled:
+            print(_format(name, start, duration, depth), file=sys.stderr)
+        return
+    _events.append((name, start, duration, depth))
+
+
+def report(title="Açılış izi"):
+    """Şimdiye kadarki olayları başlangıç sırasıyla yazdırır; sonraki olaylar saklanmaz"""
+    global _reported
+    _reported = True
+    if enabled:
+        print(f"{title} (başlangıç, süre, olay):", file=sys.stderr)
+        for event in sorted(_events, key=lambda e: e[1]):
+            print(_format(*event), file=sys.stderr)
+    _events.clear()
+
+
+def report_after_first_paint(widget):
+    """Widget ilk kez çizildiğinde 'ilk çizim' olayını kaydedip raporu yazdırır"""
+    from PySide6.QtCore import QEvent, QObject, QTimer
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                obj.removeEventFilter(self)
+                # Çizim bittikten sonra ölçmek için olay döngüsüne bırak
+                QTimer.singleShot(0, lambda: (mark("ilk çizim"), report()))
+            return False
+
+    widget._first_paint_filter = FirstPaintFilter(widget)
+    widget.installEventFilter(widget._first_paint_filter)
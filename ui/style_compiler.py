@@ -0,0 +1,248 @@
+from functools import lru_cache
+
+from PySide6.QtCore import Qt
+
+# Widget'lar sadece sınıf etiketi taşır, görünüm tek uygulama stilinden gelir
+STYLE_PROPERTY = "styleClass"
+
+# Tüm arayüzün stil şablonu: {card_color} gibi alanlar tema değerleriyle doldurulur.
+# Widget'lar [styleClass~="..."] ile seçilir; bir widget birden fazla sınıf taşıyabilir.
+STYLESHEET_TEMPLATE = """
+QMainWindow {{
+    background: {bg_color};
+}}
+QWidget {{
+    font-family: {font_family};
+    border: none;
+}}
+QLabel {{
+    color: {text_color};
+    font-family: {font_family};
+    border: none;
+}}
+QPushButton {{
+    font-family: {font_family};
+    font-weight: bold;
+    border: none;
+}}
+QScrollArea {{
+    border: none;
+    background: transparent;
+}}
+QScrollBar:vertical {{
+    border: none;
+    background: {card_border};
+    width: 8px;
+    margin: 0px;
+}}
+QScrollBar::handle:vertical {{
+    background: {gray_color};
+    min-height: 20px;
+    border-radius: 4px;
+}}
+QLCDNumber {{
+    border: none;
+    color: {primary_color};
+}}
+QMenu {{
+    background-color: {card_color};
+    color: {text_color};
+    border: 1px solid {card_border};
+    border-radius: {radius};
+    padding: 5px;
+}}
+QMenu::item {{
+    padding: 5px 25px 5px 25px;
+    border-radius: 3px;
+    border: none;
+}}
+QMenu::item:selected {{
+    background-color: {accent_color};
+    color: white;
+}}
+
+/* Yüzeyler */
+[styleClass~="page"] {{
+    background-color: {bg_color};
+}}
+[styleClass~="sideMenu"] {{
+    background: {bg_color};
+    border-right: 1px solid {card_border};
+}}
+[styleClass~="card"] {{
+    background: {card_color};
+    border-radius: {radius};
+}}
+[styleClass~="sourceBox"] {{
+    background: {bg_color};
+    border-radius: {radius};
+    padding: 6px;
+}}
+[styleClass~="sourceBox"] QLabel {{
+    padding: 6px;
+}}
+[styleClass~="preview"] {{
+    background: {preview_bg};
+    border-radius: {radius};
+}}
+[styleClass~="issueBar"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff8373, stop:1 #ffd600);
+    color: white;
+    border-radius: {radius};
+}}
+[styleClass~="issueBar"] QLabel {{
+    color: white;
+}}
+
+/* Yazı renkleri */
+[styleClass~="text"] {{ color: {text_color}; }}
+[styleClass~="textSecondary"] {{ color: {text_secondary}; }}
+[styleClass~="textPrimary"] {{ color: {primary_color}; }}
+[styleClass~="textAccent"] {{ color: {accent_color}; }}
+[styleClass~="textSuccess"] {{ color: {success_color}; }}
+[styleClass~="textDanger"] {{ color: {danger_color}; }}
+[styleClass~="textInfo"] {{ color: {info_color}; }}
+[styleClass~="textGray"] {{ color: {gray_color}; }}
+
+/* Göstergeler */
+QLCDNumber[styleClass~="lcd"] {{
+    background: {bg_color};
+    border-radius: {radius};
+}}
+QLCDNumber[styleClass~="textInfo"] {{
+    color: {info_color};
+}}
+QProgressBar[styleClass~="levelBar"] {{
+    background: {bg_color};
+    border: none;
+    border-radius: 5px;
+    text-align: center;
+    height: 20px;
+}}
+QProgressBar[styleClass~="levelBar"]::chunk {{
+    border-radius: 5px;
+}}
+QProgressBar#batteryBar::chunk {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #43a047, stop:1 #66bb6a);
+}}
+QProgressBar#signalBar::chunk {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #1976d2, stop:1 #42a5f5);
+}}
+QComboBox[styleClass~="cameraSelector"] {{
+    background: {card_color};
+    color: #333;
+    padding: 4px;
+    border-radius: 4px;
+    border: 1px solid #ccc;
+}}
+
+/* Butonlar */
+QPushButton[styleClass~="menuButton"] {{
+    background-color: {bg_color};
+    border-radius: 16px;
+    border: none;
+}}
+QPushButton[styleClass~="menuButton"]:hover {{
+    background-color: #ffe082;
+    color: #333;
+}}
+QPushButton[styleClass~="ejectButton"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #d500f9, stop:1 #448aff);
+    color: white;
+    border-radius: {radius};
+    font-weight: bold;
+    padding: 12px;
+    font-size: 13px;
+    border: none;
+}}
+QPushButton[styleClass~="ejectButton"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #448aff, stop:1 #d500f9);
+}}
+QPushButton[styleClass~="toolButton"] {{
+    background: {button_bg};
+    color: {button_text};
+    border-radius: {radius};
+    font-weight: bold;
+    padding: 8px 12px;
+    font-size: 13px;
+    border: none;
+}}
+QPushButton[styleClass~="toolButton"]:hover {{
+    color: white;
+}}
+QPushButton#uploadButton:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7c4dff, stop:1 #536dfe);
+}}
+QPushButton#cnnButton:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00897b, stop:1 #43a047);
+}}
+QPushButton#settingsButton:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ffd600, stop:1 #ffc107);
+}}
+QPushButton[styleClass~="analyzeButton"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #d500f9, stop:1 #2979ff);
+    color: white;
+    border-radius: {radius};
+    font-weight: bold;
+    padding: 14px 24px;
+    font-size: 15px;
+    margin-top: 12px;
+    border: none;
+}}
+QPushButton[styleClass~="analyzeButton"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2979ff, stop:1 #d500f9);
+}}
+QPushButton[styleClass~="analyzeButton"]:pressed {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #aa00ff, stop:1 #2962ff);
+}}
+QPushButton[styleClass~="outlineButton"] {{
+    background: {bg_color};
+    color: {text_color};
+    border: 1px solid {card_border};
+    border-radius: {radius};
+    padding: 10px 20px;
+}}
+QPushButton[styleClass~="outlineButton"]:hover {{
+    background: {card_border};
+}}
+QPushButton[styleClass~="takeoffButton"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #66bb6a, stop:1 #43a047);
+    color: white;
+    border: none;
+    border-radius: {radius};
+    padding: 10px 20px;
+}}
+QPushButton[styleClass~="takeoffButton"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #43a047, stop:1 #2e7d32);
+}}
+QPushButton[styleClass~="landButton"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ef5350, stop:1 #e53935);
+    color: white;
+    border: none;
+    border-radius: {radius};
+    padding: 10px 20px;
+}}
+QPushButton[styleClass~="landButton"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e53935, stop:1 #c62828);
+}}
+"""
+
+
+@lru_cache(maxsize=8)
+def _compile(items):
+    return STYLESHEET_TEMPLATE.format(**dict(items))
+
+
+def compile_stylesheet(values):
+    """Tema değerlerinden tek bir uygulama stil sayfası üretir (tema başına bir kez)"""
+    return _compile(tuple(sorted(values.items())))
+
+
+def set_style_class(widget, *classes):
+    """Widget'a stil sınıf(lar)ını atar; görünüm uygulama stilinden gelir"""
+    widget.setProperty(STYLE_PROPERTY, " ".join(classes))
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        # Çalışırken değişen sınıfın seçicilere yansıması için yeniden cilala
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    return widget
@@ -0,0 +1,290 @@
+import random
+import struct
+import threading
+import time
+from collections import namedtuple
+
+import serial
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+
+# Tek bir telemetri örneği (birimler göstergelerle aynı)
+TelemetryRecord = namedtuple("TelemetryRecord", [
+    "seq",         # Sıra numarası
+    "timestamp",   # Araç saati (s)
+    "altitude",    # Yükseklik (m)
+    "speed",       # Hız (km/s)
+    "battery",     # Batarya (%)
+    "signal",      # Sinyal gücü (%)
+    "roll",        # Yatış (derece)
+    "pitch",       # Yunuslama (derece)
+    "climb_rate",  # Tırmanma hızı (ft/dk)
+])
+
+# Göstergelere giden telemetri kanalları
+CHANNELS = TelemetryRecord._fields[2:]
+
+# Bir göstergenin yeniden çizilmesi için gereken en küçük değişim
+DISPLAY_THRESHOLDS = {
+    "altitude": 0.05,   # LCD bir ondalık gösterir
+    "speed": 0.05,
+    "battery": 1.0,     # İlerleme çubukları tam sayı
+    "signal": 1.0,
+    "roll": 0.1,        # Derece
+    "pitch": 0.1,
+    "climb_rate": 5.0,  # ft/dk (ibrede ~0.6 derece)
+}
+
+# Sabit boyutlu çerçeve: senk + sıra + zaman + 7 kanal + sağlama toplamı (little-endian)
+FRAME_SYNC = b"\xaa\x55"
+FRAME_STRUCT = struct.Struct("<2sId7fH")
+FRAME_SIZE = FRAME_STRUCT.size  # 44 bayt
+
+
+def frame_checksum(frame):
+    """Senk ve sağlama alanları hariç baytların 16 bitlik toplamı"""
+    return sum(frame[2:-2]) & 0xFFFF
+
+
+def encode_record(record, sync=FRAME_SYNC, frame_struct=FRAME_STRUCT):
+    """Bir kaydı (varsayılan TelemetryRecord) sağlama toplamlı kablo çerçevesine dönüştürür"""
+    frame = bytearray(frame_struct.pack(sync, *record, 0))
+    struct.pack_into("<H", frame, frame_struct.size - 2, frame_checksum(frame))
+    return bytes(frame)
+
+
+class TelemetryParser:
+    """Bayt akışından çerçeveleri ayıklayan artımlı ayrıştırıcı
+
+    Çerçeve tipi sınıf özellikleriyle belirlenir; aynı senk ve sağlama
+    toplamı düzenindeki başka çerçeveler (ör. komut onayları) için alt sınıf
+    SYNC, STRUCT ve RECORD'u değiştirir.
+    """
+    SYNC = FRAME_SYNC
+    STRUCT = FRAME_STRUCT
+    RECORD = TelemetryRecord
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.errors = 0  # Sağlama toplamı tutmayan çerçeveler
+
+    def feed(self, data):
+        """Yeni baytları ekler ve tamamlanan kayıtların listesini döndürür"""
+        sync, unpack, size, record = self.SYNC, self.STRUCT.unpack, self.STRUCT.size, self.RECORD
+        self.buffer += data
+        records = []
+        pos = 0
+        end = len(self.buffer)
+        while True:
+            pos = self.buffer.find(sync, pos)
+            if pos < 0 or end - pos < size:
+                break
+            frame = self.buffer[pos:pos + size]
+            fields = unpack(frame)
+            if fields[-1] == frame_checksum(frame):
+                records.append(record(*fields[1:-1]))
+                pos += size
+            else:
+                # Bozuk çerçeve ya da veri içinde senk deseni: bir bayt kaydırıp yeniden eşle
+                self.errors += 1
+                pos += 1
+
+        # İşlenen baytları at; yarım kalan çerçeve bir sonraki okumaya kalır
+        if pos < 0:
+            keep = 1 if self.buffer.endswith(sync[:1]) else 0
+            del self.buffer[:end - keep]
+        else:
+            del self.buffer[:pos]
+        return records
+
+
+class TelemetryReader(QThread):
+    """Telemetri okuyucularının ortak tabanı: kayıtları alıcılara dağıtır
+
+    Alt sınıflar run() içinde bağlantıyı yönetir ve çözülen her kayıt grubunu
+    deliver() ile verir. Alıcılar okuma thread'inde çağrılır; göstergelere
+    giden yol TelemetryBus alıcısıdır (ekran tazelemesi başına tek güncelleme).
+    """
+    connection_changed = Signal(bool)
+    RECONNECT_DELAY = 1.0  # Bağlantı koptuğunda yeniden deneme aralığı (s)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parser = TelemetryParser()
+        self.received = 0
+        self.sinks = []  # Okuma thread'inde her kayıt grubuyla çağrılan alıcılar
+
+    def deliver(self, records):
+        """Bir kayıt grubunu alıcılara verir"""
+        self.received += len(records)
+        for sink in self.sinks:
+            sink(records)
+
+    def load_batch_decoder(self):
+        """Ayrıştırıcıyı toplu NumPy çözücüsüyle değiştirir; run() başında çağrılır
+
+        NumPy okuma thread'inde yüklenir, açılışta GUI thread'ini bekletmez.
+        """
+        from telemetry_codec import FrameDecoder
+        self.parser = FrameDecoder()
+
+    def add_sink(self, sink):
+        """Kayıtları GUI thread'ine uğramadan alacak bir fonksiyon ekler
+
+        Alıcı okuma thread'inde çağrılır, hızlı ve thread-safe olmalıdır.
+        """
+        self.sinks.append(sink)
+
+    def stop(self, timeout_ms=1000):
+        self.requestInterruption()
+        self.wait(timeout_ms)
+
+
+class SerialTelemetryReader(TelemetryReader):
+    """Seri port (UART, pty veya socket:// URL) üzerinden telemetri okuyan işçi"""
+
+    def __init__(self, port, baudrate=115200, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.baudrate = baudrate
+
+    def run(self):
+        self.load_batch_decoder()
+        while not self.isInterruptionRequested():
+            try:
+                # serial_for_url hem cihaz yollarını hem de socket:// gibi URL'leri açar
+                link = serial.serial_for_url(self.port, baudrate=self.baudrate, timeout=0.05)
+            except (serial.SerialException, OSError):
+                self.connection_changed.emit(False)
+                self.msleep(int(self.RECONNECT_DELAY * 1000))
+                continue
+
+            self.connection_changed.emit(True)
+            try:
+                self.read_loop(link)
+            except (serial.SerialException, OSError):
+                self.connection_changed.emit(False)
+            finally:
+                link.close()
+
+    def read_loop(self, link):
+        """Bağlantı açıkken gelen baytları ayrıştırır"""
+        while not self.isInterruptionRequested():
+            data = link.read(link.in_waiting or 1)
+            if not data:
+                continue
+            records = self.parser.feed(data)
+            if records:
+                self.deliver(records)
+
+
+class TelemetryBus(QObject):
+    """Her hızda örnek kabul edip göstergeleri ekran tazelemesi başına bir kez güncelleyen veri yolu
+
+    Kanal başına sadece en son değer tutulur. Tazeleme anında yalnızca
+    gösterim eşiğinden fazla değişen kanallar ``updated`` ile yayınlanır.
+    """
+    updated = Signal(dict)  # {kanal: değer} - sadece değişen kanallar
+
+    def __init__(self, thresholds=DISPLAY_THRESHOLDS, parent=None):
+        super().__init__(parent)
+        self.thresholds = thresholds
+        self.values = {}  # Göstergelerde şu an görünen değerler
+        self._lock = threading.Lock()
+        self._latest = {}  # Son tazelemeden bu yana gelen en yeni değerler
+
+        # Tek zamanlayıcı, ekranın tazeleme hızında
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 60.0
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / (refresh_rate or 60.0))))
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    def publish(self, channel, value):
+        """Tek bir kanal değeri yayınlar (her thread'den çağrılabilir)"""
+        with self._lock:
+            self._latest[channel] = value
+
+    def publish_record(self, record):
+        """Bir TelemetryRecord'un tüm kanallarını yayınlar"""
+        with self._lock:
+            for channel in CHANNELS:
+                self._latest[channel] = getattr(record, channel)
+
+    def publish_records(self, records):
+        """Bir kayıt grubundan sadece en yenisini yayınlar"""
+        if records:
+            self.publish_record(records[-1])
+
+    def set_active(self, active):
+        """Pencere görünmüyorken tazelemeyi durdurur; değerler birikmeye devam eder"""
+        if active:
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def flush(self):
+        """Bekleyen değerleri eşik kontrolünden geçirip tek seferde yayınlar"""
+        with self._lock:
+            latest, self._latest = self._latest, {}
+        if not latest:
+            return
+
+        changed = {}
+        for channel, value in latest.items():
+            shown = self.values.get(channel)
+            if shown is None or abs(value - shown) >= self.thresholds.get(channel, 0.0):
+                changed[channel] = value
+                self.values[channel] = value
+        if changed:
+            self.updated.emit(changed)
+
+
+class TelemetrySimulator(QObject):
+    """Gerçek bağlantı yokken veri yoluna rastgele telemetri yayınlayan kaynak
+
+    Her adımda tüm kanalların güncel değerleriyle bir TelemetryRecord üretir;
+    kayıtlar seri okuyucudaki gibi alıcılara (ör. uçuş kaydedici) da verilir.
+    """
+    INTERVAL = 100  # ms
+
+    def __init__(self, bus, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        self.ticks = 0
+        self.values = dict.fromkeys(CHANNELS, 0.0)
+        self.sinks = []  # GUI thread'inde her kayıt grubuyla çağrılan alıcılar
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(self.INTERVAL)
+
+    def add_sink(self, sink):
+        """Üretilen kayıtları alacak bir fonksiyon ekler (SerialTelemetryReader ile aynı)"""
+        self.sinks.append(sink)
+
+    def tick(self):
+        values = self.values
+        # Yapay ufuk her 100 ms'de küçük adımlarla yürür
+        values["roll"] = max(min(values["roll"] + random.uniform(-1, 1), 30), -30)
+        values["pitch"] = max(min(values["pitch"] + random.uniform(-0.5, 0.5), 15), -15)
+
+        # Tırmanma hızı her 200 ms'de
+        if self.ticks % 2 == 0:
+            values["climb_rate"] = random.uniform(-800, 800)
+
+        # Uçuş verileri her 500 ms'de
+        if self.ticks % 5 == 0:
+            values["altitude"] = random.uniform(20, 150)
+            values["speed"] = random.uniform(0, 45)
+            values["battery"] = random.randint(60, 100)
+            values["signal"] = random.randint(70, 100)
+
+        # Değişmeyen kanallar veri yolunun gösterim eşiğinde elenir
+        record = TelemetryRecord(self.ticks, time.monotonic(), **values)
+        self.bus.publish_record(record)
+        for sink in self.sinks:
+            sink([record])
+
+        self.ticks += 1
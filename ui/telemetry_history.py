@@ -0,0 +1,208 @@
+import math
+import threading
+from collections import namedtuple
+
+import numpy as np
+from PySide6.QtCore import QSettings
+
+from telemetry_handler import CHANNELS
+
+WindowStats = namedtuple("WindowStats", "minimum maximum mean count")
+Series = namedtuple("Series", "time minimum maximum mean count")  # Nokta başına değerler
+BucketView = namedtuple("BucketView", "time minimum maximum total count")  # Kova halkasından görünümler
+
+
+class ColumnRing:
+    """Sütun başına bir NumPy dizisi tutan sabit kapasiteli halka
+
+    Her değer hem i hem i + capacity konumuna yazılır (ayna); böylece son n
+    eleman daima tek parça bir dilimdir ve okuyucu kopya almadan görünüm kullanır.
+    """
+
+    def __init__(self, capacity, dtypes):
+        self.capacity = int(capacity)
+        self.columns = {name: np.zeros(2 * self.capacity, dtype) for name, dtype in dtypes.items()}
+        self.count = 0  # Şimdiye kadar yazılan toplam eleman
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, values):
+        """{sütun: dizi} gruplarını sona ekler; tüm diziler aynı uzunlukta olmalı"""
+        n = len(next(iter(values.values())))
+        skipped = max(0, n - self.capacity)  # Kapasiteden uzun grubun sadece sonu kalır
+        n -= skipped
+        start = (self.count + skipped) % self.capacity
+        first = min(n, self.capacity - start)
+        for name, data in values.items():
+            column, data = self.columns[name], data[skipped:]
+            for offset in (0, self.capacity):
+                column[offset + start:offset + start + first] = data[:first]
+                column[offset:offset + n - first] = data[first:]
+        self.count += n + skipped
+
+    def last(self):
+        """Son elemanın iki konumu (güncellemeler ikisine birden yazılır)"""
+        slot = (self.count - 1) % self.capacity
+        return [slot, slot + self.capacity]
+
+    def tail(self, n):
+        """Son n elemanın sütunlardaki dilimi"""
+        n = min(n, len(self))
+        end = (self.count - 1) % self.capacity + self.capacity + 1 if self.count else self.capacity
+        return slice(end - n, end)
+
+    def clear(self):
+        self.count = 0
+
+
+class TelemetryHistory:
+    """Telemetri geçmişi: kanal başına ham örnek halkası ve zaman kovası özetleri
+
+    Ham halka son ``samples`` kaydı tutar (yüksek hızlı grafikler için).
+    Kova halkası her bucket_seconds aralığı için kanal başına min, max, toplam
+    ve sayı saklar; pencere sorguları örnekleri değil kovaları dolaştığından
+    O(pencere/kova) sürer. Zaman ekseni kayıtların kendi timestamp'idir;
+    pencereler en son kaydın kovasında biter. Zaman geri giderse (araç
+    yeniden başladı, oynatmada geri atlama) geçmiş sıfırlanır.
+
+    append_records kaynak alıcısıdır, okuma thread'inden çağrılabilir.
+    """
+
+    def __init__(self, seconds=None, bucket_seconds=None, samples=None):
+        settings = QSettings("ULGEN", "Dashboard")
+        seconds = seconds or settings.value("history/seconds", 600, type=int)
+        self.bucket_seconds = bucket_seconds or settings.value("history/bucket_ms", 100, type=int) / 1000.0
+        samples = samples or settings.value("history/samples", 120000, type=int)
+        self.lock = threading.Lock()
+
+        self.samples = ColumnRing(samples, dict({"time": np.float64}, **dict.fromkeys(CHANNELS, np.float32)))
+        # Kova özetleri (kova, kanal) matrisleridir: bir grup tüm kanallar için tek işlemde eklenir
+        channels = len(CHANNELS)
+        self.buckets = ColumnRing(math.ceil(seconds / self.bucket_seconds), {
+            "time": np.float64, "count": np.int32, "min": np.dtype((np.float32, channels)),
+            "max": np.dtype((np.float32, channels)), "total": np.dtype((np.float64, channels))})
+        self.current_bucket = None  # En son kovanın numarası (timestamp // bucket_seconds)
+
+    @property
+    def latest_time(self):
+        with self.lock:
+            if not self.samples.count:
+                return None
+            return float(self.samples.columns["time"][self.samples.tail(1)][0])
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+            self.buckets.clear()
+            self.current_bucket = None
+
+    def append_records(self, records):
+        """TelemetryRecord grubunu ekler; grup başına tek vektörel işlem
+
+        Ham örnek zamanları azalmaz (grafikler zamanda ikili arama yapar): sıra
+        dışı gelen kayıt kendinden önceki en yeni zamanı alır, grup içinde de
+        önceki grubun son kaydına göre de.
+        """
+        if not records:
+            return
+        data = np.array(records, dtype=np.float64)  # (seq, timestamp, kanallar...)
+        times = np.maximum.accumulate(data[:, 1])
+        values = data[:, 2:]
+        summary = self._summarize(times, values)
+
+        with self.lock:
+            if self.current_bucket is not None and summary[0][0] < self.current_bucket:
+                self.samples.clear()
+                self.buckets.clear()
+                self.current_bucket = None
+            elif self.samples.count:
+                last_time = self.samples.columns["time"][self.samples.last()[0]]
+                if times[0] < last_time:
+                    # Aynı kovada geriye giden kayıt: zamanlar son kaydınkine sabitlenir
+                    times = np.maximum(times, last_time)
+                    summary = self._summarize(times, values)
+            buckets, starts, counts, minimum, maximum, total = summary
+            self.samples.append(dict({channel: values[:, i] for i, channel in enumerate(CHANNELS)}, time=times))
+            for group, bucket in enumerate(buckets[starts]):
+                self._add_bucket(int(bucket), int(counts[group]), minimum[group], maximum[group], total[group])
+
+    def _summarize(self, times, values):
+        """Azalmayan zamanlı grubu kovalara böler: kova numaraları, grup başları, sayı, min, max, toplam"""
+        buckets = np.floor(times / self.bucket_seconds).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        counts = np.diff(np.r_[starts, len(buckets)])
+        return (buckets, starts, counts, np.minimum.reduceat(values, starts),
+                np.maximum.reduceat(values, starts), np.add.reduceat(values, starts))
+
+    def _add_bucket(self, bucket, count, minimum, maximum, total):
+        ring = self.buckets
+        columns = ring.columns
+        if self.current_bucket == bucket:
+            slots = ring.last()
+            columns["count"][slots] += count
+            columns["min"][slots] = np.fmin(columns["min"][slots], minimum)
+            columns["max"][slots] = np.fmax(columns["max"][slots], maximum)
+            columns["total"][slots] += total
+            return
+
+        # Veri gelmeyen aralıklar boş kova olarak eklenir; zaman ekseni kesintisiz kalır
+        gap = 0 if self.current_bucket is None else min(bucket - self.current_bucket - 1, ring.capacity)
+        numbers = np.arange(bucket - gap, bucket + 1)
+        values = {"time": numbers * self.bucket_seconds, "count": np.zeros(len(numbers), np.int32)}
+        values["count"][-1] = count
+        for name, value, empty in (("min", minimum, np.nan), ("max", maximum, np.nan), ("total", total, 0.0)):
+            values[name] = np.full((len(numbers), len(value)), empty)
+            values[name][-1] = value
+        ring.append(values)
+        self.current_bucket = bucket
+
+    def _window(self, seconds):
+        return self.buckets.tail(math.ceil(seconds / self.bucket_seconds))
+
+    def view(self, channel, seconds):
+        """Son seconds'ın kova sütunlarına kopyasız görünümler
+
+        Görünümler bir sonraki eklemeyle değişir; tutarlı okuma için lock altında kullanın.
+        """
+        window = self._window(seconds)
+        columns = self.buckets.columns
+        i = CHANNELS.index(channel)
+        return BucketView(columns["time"][window], columns["min"][window, i],
+                          columns["max"][window, i], columns["total"][window, i], columns["count"][window])
+
+    def stats(self, channel, seconds):
+        """Son seconds içindeki min, max, ortalama ve örnek sayısı"""
+        with self.lock:
+            view = self.view(channel, seconds)
+            count = int(view.count.sum())
+            if not count:
+                return WindowStats(math.nan, math.nan, math.nan, 0)
+            return WindowStats(float(np.nanmin(view.minimum)), float(np.nanmax(view.maximum)),
+                               float(view.total.sum()) / count, count)
+
+    def series(self, channel, seconds, points):
+        """Son seconds'ı en fazla points noktaya indirger (ör. piksel sütunu başına bir nokta)
+
+        Her nokta ardışık kovaların min, max ve ortalamasıdır; zamanı grubun bitişidir,
+        boş noktalar NaN'dır.
+        """
+        with self.lock:
+            view = self.view(channel, seconds)
+            step = max(1, math.ceil(len(view.time) / max(1, points)))
+            groups = np.arange(0, len(view.time), step)
+            if not len(groups):
+                empty = np.empty(0)
+                return Series(empty, empty, empty, empty, empty)
+            time = view.time[np.minimum(groups + step, len(view.time)) - 1] + self.bucket_seconds
+            minimum = np.fmin.reduceat(view.minimum, groups)
+            maximum = np.fmax.reduceat(view.maximum, groups)
+            total = np.add.reduceat(view.total, groups)
+            count = np.add.reduceat(view.count, groups)
+        mean = np.divide(total, count, out=np.full(len(total), np.nan), where=count > 0)
+        return Series(time, minimum, maximum, mean, count)
+
+    def recent(self, channel, count):
+        """Son count ham örneğin (zaman, değer) görünümleri; lock altında okunmalı"""
+        window = self.samples.tail(count)
+        return self.samples.columns["time"][window], self.samples.columns[channel][window]
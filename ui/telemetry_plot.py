@@ -0,0 +1,212 @@
+import math
+import time
+
+import numpy as np
+import shiboken6
+from PySide6.QtCore import Qt, QRectF, QTimer
+from PySide6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen, QPixmap, QPolygonF
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+LINE_COLOR = QColor("#FFB300")
+GRID_COLOR = QColor(255, 255, 255, 40)
+TEXT_COLOR = QColor(255, 255, 255, 200)
+GRID_LINES = 4
+
+
+def nice_range(low, high, steps=GRID_LINES):
+    """Aralığı 1-2-5 adımlarına genişletir; ölçek her karede değil, adım aşılınca değişir"""
+    if high - low < 1e-6:
+        low, high = low - 1.0, high + 1.0  # Sabit sinyal ortada durur
+    span = high - low
+    magnitude = 10 ** math.floor(math.log10(span / steps))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude * steps >= span)
+    low = math.floor(low / step) * step
+    high = max(math.ceil(high / step) * step, low + step)
+    return low, high
+
+
+class TelemetryPlot(QWidget):
+    """Bir kanalın son window saniyesini ham örneklerden çizen kayan grafik
+
+    Her piksel sütununa düşen örneklerin min ve max'ı alınır; 50k+ örnek en
+    fazla 2 × genişlik noktaya iner ve titreşim tepeleri kaybolmaz. Seyrek
+    veride noktalar önceden ayrılmış bir QPolygonF'in belleğine NumPy ile
+    doğrudan yazılır ve tek drawPolyline ile çizilir. Titreşimde zikzak çizgi
+    uzun dikey parçalardan oluşur ve QPainter'da pahalıdır; bu durumda
+    aralıklar NumPy ile bir görüntüye doldurulur (bkz. draw_spans). Yeni örnek
+    gelmediyse yeniden çizilmez; ızgara ve eksen yazıları ölçek değişene kadar
+    önbellekteki katmandan gelir.
+    """
+    MARGIN = 48  # Sol eksen yazıları için
+    SPAN_STEP = 4.0  # Noktalar arası ortalama dikey adım (px) bunu aşınca görüntüyle çizilir
+
+    def __init__(self, history, channel="altitude", unit="m", window=300, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.channel = channel
+        self.unit = unit
+        self.window = window
+        self.paint_time = 0.0  # Son çizimin süresi (s)
+        self._drawn_count = None
+        self.polygon = QPolygonF()
+        self.dense = False  # Son çizimde sütunlar min/max aralıklarına indirgendiyse True
+        self.raster = False  # Son çizim polyline yerine draw_spans görüntüsüyle yapıldıysa True
+        self.background = None
+        self._background_key = None
+        self.setMinimumHeight(140)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        # Ekranın tazeleme hızında yoklanır, sadece yeni veri varsa çizilir
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 60.0
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / (refresh_rate or 60.0))))
+        self.timer.timeout.connect(self.poll)
+
+    def set_channel(self, channel, unit):
+        self.channel, self.unit = channel, unit
+        self.update()
+
+    def poll(self):
+        if self.history.samples.count != self._drawn_count:
+            self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def points(self, count):
+        """Poligonu count noktaya ayarlar ve belleğini (count, 2) float64 dizisi olarak verir
+
+        Küçülmede bellek yeniden ayrılmaz; büyümede QPolygonF kapasitesini artırır.
+        """
+        self.polygon.resize(count)
+        address = shiboken6.VoidPtr(self.polygon.data(), count * 16, True)
+        return np.frombuffer(address, np.float64).reshape(count, 2)
+
+    def fill_points(self, times, values, start, plot):
+        """Pencereyi piksel sütunu başına min/max noktalarına indirger; nokta dizisini döndürür"""
+        columns = max(1, int(plot.width()))
+        count = len(times)
+        self.dense = count > 2 * columns
+        if not self.dense:
+            points = self.points(count)
+            points[:, 0] = plot.left() + (times - start) * (plot.width() / self.window)
+            points[:, 1] = values
+            return points
+
+        # Sütun sınırları zamandan ikili aramayla bulunur; boş sütunlar atlanır
+        edges = np.searchsorted(times, start + np.arange(columns) * (self.window / columns))
+        filled = np.diff(np.append(edges, count)) > 0
+        edges = edges[filled]
+        minimum = np.minimum.reduceat(values, edges)
+        maximum = np.maximum.reduceat(values, edges)
+        points = self.points(2 * len(edges))
+        points[:, 0] = plot.left() + np.repeat(np.flatnonzero(filled), 2)
+        # Zikzak sıra (min, max, max, min, ...): sütunlar arası çizgiler kısa kalır
+        ys = points[:, 1].reshape(-1, 2)
+        ys[0::2, 0], ys[0::2, 1] = minimum[0::2], maximum[0::2]
+        ys[1::2, 0], ys[1::2, 1] = maximum[1::2], minimum[1::2]
+        return points
+
+    def draw_spans(self, painter, points, plot):
+        """Sütun başına min-max aralıklarını tek görüntü olarak çizer
+
+        Zikzak çizgiyle aynı pikselleri kaplar: her aralık önceki sütuna
+        değecek kadar uzatılır, böylece eğri kesintisiz görünür.
+        """
+        ratio = self.devicePixelRatioF()
+        height = max(1, math.ceil(plot.height() * ratio))
+        width = max(1, int(plot.width()))
+        ys = (points[:, 1].reshape(-1, 2) - plot.top()) * ratio
+        top, bottom = ys.min(axis=1), ys.max(axis=1)
+        top[1:] = np.minimum(top[1:], bottom[:-1])
+        bottom[1:] = np.maximum(bottom[1:], top[:-1])
+        rows = np.arange(height, dtype=np.int16)[:, None]
+        inside = (rows >= np.floor(top).astype(np.int16)) & (rows <= np.ceil(bottom).astype(np.int16))
+        columns = (points[0::2, 0] - plot.left()).astype(np.intp)
+        # Maske × renk doğrudan önceden çarpılmış ARGB32 görüntü olur; QPainter dönüştürmeden çizer
+        pixels = inside.view(np.uint8) * np.uint32(LINE_COLOR.rgba())
+        if len(columns) != width:  # Boş sütunlar saydam kalır
+            spans, pixels = pixels, np.zeros((height, width), np.uint32)
+            pixels[:, np.clip(columns, 0, width - 1)] = spans
+        image = QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32_Premultiplied)
+        painter.drawImage(QRectF(plot.left(), plot.top(), width, plot.height()), image)
+
+    def plot_rect(self):
+        return QRectF(self.rect()).adjusted(self.MARGIN, 8, -8, -8)
+
+    def cached_background(self, low, high):
+        """Siyah zemin, ızgara ve eksen yazıları; boyut, DPI veya ölçek değişince yeniden çizilir"""
+        ratio = self.devicePixelRatioF()
+        key = (self.size(), ratio, low, high)
+        if key == self._background_key:
+            return self.background
+        pixmap = QPixmap(max(1, math.ceil(self.width() * ratio)), max(1, math.ceil(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.black)
+        painter = QPainter(pixmap)
+        painter.setFont(QFont("Arial", 8))
+        plot = self.plot_rect()
+        for i in range(GRID_LINES + 1):
+            y = plot.top() + plot.height() * i / GRID_LINES
+            painter.setPen(QPen(GRID_COLOR, 0))
+            painter.drawLine(int(plot.left()), int(y), int(plot.right()), int(y))
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, y - 8, self.MARGIN - 4, 16), Qt.AlignRight | Qt.AlignVCenter,
+                             f"{high - (high - low) * i / GRID_LINES:g}")
+        painter.end()
+        self.background, self._background_key = pixmap, key
+        return pixmap
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.setFont(QFont("Arial", 8))
+        plot = self.plot_rect()
+
+        with self.history.lock:
+            self._drawn_count = self.history.samples.count
+            times, values = self.history.recent(self.channel, self.history.samples.capacity)
+            if len(times):
+                end = times[-1]
+                start = end - self.window
+                first = int(np.searchsorted(times, start))
+                times, values = times[first:], values[first:]
+            samples = len(times)
+            if samples:
+                latest = float(values[-1])
+                points = self.fill_points(times, values, start, plot)
+        if not samples or plot.height() <= 0:
+            painter.fillRect(self.rect(), Qt.black)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(self.rect(), Qt.AlignCenter, "Veri bekleniyor…")
+            return
+
+        # Dikey ölçek görünen verinin aralığını kapsayan yuvarlak değerlere oturur
+        ys = points[:, 1]
+        low, high = nice_range(float(ys.min()), float(ys.max()))
+        ys -= low
+        ys *= -plot.height() / (high - low)
+        ys += plot.bottom()
+        painter.drawPixmap(0, 0, self.cached_background(low, high))
+
+        self.raster = self.dense and np.abs(np.diff(ys)).mean() > self.SPAN_STEP
+        if self.raster:
+            self.draw_spans(painter, points, plot)
+            drawn = f"{len(points) // 2} sütun"
+        else:
+            drawn = f"{len(points)} nokta"
+            painter.setPen(QPen(LINE_COLOR, 0))  # Kozmetik 1 px kalem, kenar yumuşatma kapalı
+            painter.drawPolyline(self.polygon)
+
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(plot.adjusted(6, 2, -6, 0), Qt.AlignRight | Qt.AlignTop,
+                         f"{latest:.1f} {self.unit} · {samples} örnek → {drawn} · "
+                         f"{self.paint_time * 1e3:.1f} ms")
+        painter.end()
+        self.paint_time = time.perf_counter() - started
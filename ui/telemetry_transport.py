@@ -0,0 +1,418 @@
+"""WebSocket üzerinden konu tabanlı telemetri taşıma katmanı (asyncio)
+
+Aracı (TelemetryBroker) MQTT aracısının yerel karşılığıdır: istemciler
+{"subscribe": "vehicle/+/telemetry"} gibi metin mesajlarıyla konulara abone
+olur, ikili mesajlarla yayın yapar. İkili mesaj biçimi:
+
+    [1 bayt konu uzunluğu][konu][44 baytlık telemetri çerçeveleri...]
+
+Bir mesaj birden çok çerçeve taşıyabilir (toplu yayın); çerçeveler seri
+hattaki ile aynıdır ve FrameDecoder ile toplu çözülür.
+
+Aracıyı tek başına çalıştırmak için: python ui/telemetry_transport.py --port 8765
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import struct
+from urllib.parse import urlsplit
+
+from telemetry_handler import TelemetryReader
+
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+MAX_MESSAGE = 1 << 20  # Tek mesajın üst sınırı (bayt)
+TELEMETRY_TOPIC = "vehicle/telemetry"
+DEFAULT_PORT = 8765
+CLOSED_ERRORS = (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError)
+CONTROL_KEYS = ("subscribe", "unsubscribe")
+
+logger = logging.getLogger(__name__)
+
+
+def accept_key(key):
+    return base64.b64encode(hashlib.sha1(key.encode() + WS_GUID).digest()).decode()
+
+
+def mask_payload(payload, mask):
+    """RFC 6455 XOR maskesi; bayt döngüsü yerine tek büyük tamsayı işlemi"""
+    n = len(payload)
+    if not n:
+        return payload
+    repeated = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(repeated, "little")).to_bytes(n, "little")
+
+
+def topic_matches(pattern, topic):
+    """MQTT tarzı konu filtresi: + tek seviyeyle, # kalan tüm seviyelerle eşleşir"""
+    pattern_parts, topic_parts = pattern.split("/"), topic.split("/")
+    for i, part in enumerate(pattern_parts):
+        if part == "#":
+            return True
+        if i >= len(topic_parts) or part not in ("+", topic_parts[i]):
+            return False
+    return len(pattern_parts) == len(topic_parts)
+
+
+def encode_message(topic, payload):
+    topic = topic.encode()
+    return bytes([len(topic)]) + topic + payload
+
+
+def decode_message(message):
+    """İkili mesajı (konu, yük) olarak ayırır; metin veya kısa mesajda ValueError"""
+    if not isinstance(message, (bytes, bytearray)):
+        raise ValueError("Yayın mesajı ikili olmalı")
+    if not message or len(message) < 1 + message[0]:
+        raise ValueError(f"Mesaj konu uzunluğundan kısa: {len(message)} bayt")
+    length = message[0]
+    return message[1:1 + length].decode(), message[1 + length:]
+
+
+def parse_control(message):
+    """Metin kontrol mesajını {"subscribe" | "unsubscribe": konu} olarak doğrular"""
+    control = json.loads(message)
+    if (not isinstance(control, dict) or not control or not set(control) <= set(CONTROL_KEYS)
+            or not all(isinstance(topic, str) and topic for topic in control.values())):
+        raise ValueError(f"Geçersiz kontrol mesajı: {message[:100]!r}")
+    return control
+
+
+def parse_headers(data):
+    """HTTP başlığını (ilk satır, {küçük harf başlık: değer}) olarak ayırır"""
+    lines = data.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if value:
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+class WebSocket:
+    """asyncio akışları üzerinde RFC 6455 çerçeveleme (bu projenin ihtiyacı kadar)
+
+    İstemci çerçeveleri maskeli, sunucununkiler maskesiz gönderilir; parçalı
+    mesajlar birleştirilir, ping'e pong ile cevap verilir. Bağlantı
+    kapandığında receive() CLOSED_ERRORS'tan birini fırlatır.
+    """
+
+    def __init__(self, reader, writer, client):
+        self.reader = reader
+        self.writer = writer
+        self.client = client
+
+    def frame(self, opcode, payload):
+        header = bytearray([0x80 | opcode])
+        mask_bit = 0x80 if self.client else 0
+        n = len(payload)
+        if n < 126:
+            header.append(mask_bit | n)
+        elif n < 65536:
+            header.append(mask_bit | 126)
+            header += struct.pack(">H", n)
+        else:
+            header.append(mask_bit | 127)
+            header += struct.pack(">Q", n)
+        if self.client:
+            mask = os.urandom(4)
+            header += mask
+            payload = mask_payload(payload, mask)
+        return bytes(header) + payload
+
+    def write(self, data):
+        """Mesajı beklemeden tampona yazar; str metin, bytes ikili mesaj olur"""
+        if isinstance(data, str):
+            self.writer.write(self.frame(OP_TEXT, data.encode()))
+        else:
+            self.writer.write(self.frame(OP_BINARY, data))
+
+    async def send(self, data):
+        """Mesajı yazar ve soket tamponu boşalana kadar bekler (geri basınç)"""
+        self.write(data)
+        await self.writer.drain()
+
+    async def receive(self):
+        """Bir sonraki metin (str) veya ikili (bytes) mesajı döndürür
+
+        Metin mesajı geçerli UTF-8 değilse ValueError fırlatır; çerçeve okunmuş
+        olduğundan bağlantı kullanılabilir kalır ve sonraki mesaj alınabilir.
+        """
+        fragments = []
+        message_opcode = OP_BINARY
+        while True:
+            head = await self.reader.readexactly(2)
+            final, opcode = head[0] & 0x80, head[0] & 0x0F
+            masked, n = head[1] & 0x80, head[1] & 0x7F
+            if n == 126:
+                n = struct.unpack(">H", await self.reader.readexactly(2))[0]
+            elif n == 127:
+                n = struct.unpack(">Q", await self.reader.readexactly(8))[0]
+            if n > MAX_MESSAGE:
+                raise ConnectionError(f"Mesaj çok büyük: {n} bayt")
+            mask = await self.reader.readexactly(4) if masked else None
+            payload = await self.reader.readexactly(n)
+            if mask:
+                payload = mask_payload(payload, mask)
+
+            if opcode == OP_PING:
+                self.writer.write(self.frame(OP_PONG, payload))
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                self.writer.write(self.frame(OP_CLOSE, payload[:2]))
+                raise ConnectionError("Bağlantı karşı taraftan kapatıldı")
+            if opcode != OP_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(payload)
+            if final:
+                data = fragments[0] if len(fragments) == 1 else b"".join(fragments)
+                if message_opcode != OP_TEXT:
+                    return data
+                try:
+                    return data.decode()
+                except UnicodeDecodeError as e:
+                    raise ValueError(f"Metin mesajı UTF-8 değil: {e}") from None
+
+    async def close(self):
+        try:
+            self.writer.write(self.frame(OP_CLOSE, struct.pack(">H", 1000)))
+            await self.writer.drain()
+        except CLOSED_ERRORS:
+            pass
+        self.writer.close()
+
+
+async def connect(url, timeout=5.0):
+    """ws://host:port/yol adresine bağlanır ve el sıkışmayı tamamlar"""
+    parts = urlsplit(url)
+    if parts.scheme != "ws":
+        raise ValueError(f"Desteklenmeyen adres: {url}")
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, parts.port or 80), timeout)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET {parts.path or '/'} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                  "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                  f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    try:
+        status, headers = parse_headers(await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout))
+    except BaseException:
+        writer.close()
+        raise
+    if status.split()[1:2] != ["101"] or headers.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise ConnectionError(f"WebSocket el sıkışması reddedildi: {status}")
+    return WebSocket(reader, writer, client=True)
+
+
+class Subscriber:
+    """Aracıdaki bir istemci: konu filtreleri ve sınırlı gönderim kuyruğu
+
+    Kuyruk dolarsa en eski mesaj atılır; telemetride yeni veri eskisinden
+    değerlidir ve yavaş bir abone yayıncıyı ya da diğer aboneleri bekletmez.
+    """
+
+    def __init__(self, websocket, queue_size):
+        self.websocket = websocket
+        self.filters = set()
+        self.queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+
+    def wants(self, topic):
+        return any(topic_matches(pattern, topic) for pattern in self.filters)
+
+    def offer(self, message):
+        """Mesajı kuyruğa ekler; yer açmak için eski mesaj atıldıysa False döner"""
+        kept = not self.queue.full()
+        if not kept:
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+        return kept
+
+    async def send_loop(self):
+        while True:
+            message = await self.queue.get()
+            self.websocket.write(message)
+            # Kuyrukta biriken mesajlar tek drain ile gönderilir
+            while not self.queue.empty():
+                self.websocket.write(self.queue.get_nowait())
+            await self.websocket.writer.drain()
+
+
+class TelemetryBroker:
+    """Yerel WebSocket yayın/abone aracısı (MQTT aracısının yerine geçer)
+
+    Aynı asyncio döngüsünde çalışan kod publish() ile doğrudan yayın yapabilir.
+    """
+    QUEUE_SIZE = 256  # Abone başına bekleyen en fazla mesaj
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, queue_size=QUEUE_SIZE):
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.server = None
+        self.subscribers = set()
+        self.handlers = set()  # Açık bağlantıların görevleri
+        self.published = 0
+        self.dropped = 0  # Abone kuyrukları dolduğu için atılan mesajlar
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]  # port=0 ise atanan port
+
+    async def close(self):
+        self.server.close()
+        for subscriber in list(self.subscribers):
+            await subscriber.websocket.close()
+        # Bağlantı görevleri kendi finally bloklarıyla bitsin, döngü kapanırken iptal edilmesin
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def publish(self, message):
+        """Ham ikili mesajı konusuna abone olan herkese iletir"""
+        topic, _ = decode_message(message)
+        self.published += 1
+        for subscriber in self.subscribers:
+            if subscriber.wants(topic) and not subscriber.offer(message):
+                self.dropped += 1
+
+    async def handle(self, reader, writer):
+        try:
+            status, headers = parse_headers(await reader.readuntil(b"\r\n\r\n"))
+        except CLOSED_ERRORS:
+            writer.close()
+            return
+        key = headers.get("sec-websocket-key")
+        if not status.startswith("GET ") or headers.get("upgrade", "").lower() != "websocket" or not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+        writer.write((f"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n").encode())
+
+        subscriber = Subscriber(WebSocket(reader, writer, client=False), self.queue_size)
+        peer = writer.get_extra_info("peername")
+        self.subscribers.add(subscriber)
+        self.handlers.add(asyncio.current_task())
+        sender = asyncio.create_task(subscriber.send_loop())
+        sender.add_done_callback(lambda task: writer.close())  # Gönderim durursa okuma da biter
+        try:
+            while True:
+                try:
+                    message = await subscriber.websocket.receive()
+                    if isinstance(message, bytes):
+                        self.publish(message)
+                        continue
+                    control = parse_control(message)
+                except ValueError as e:
+                    logger.warning("%s: mesaj atlandı: %s", peer, e)
+                    continue
+                if "subscribe" in control:
+                    subscriber.filters.add(control["subscribe"])
+                if "unsubscribe" in control:
+                    subscriber.filters.discard(control["unsubscribe"])
+        except CLOSED_ERRORS:
+            pass  # Bağlantı kapandı
+        finally:
+            sender.cancel()
+            await asyncio.wait([sender])
+            if not sender.cancelled() and sender.exception() is not None:
+                logger.warning("%s: gönderim hatasıyla bağlantı kapandı: %r", peer, sender.exception())
+            self.subscribers.discard(subscriber)
+            self.handlers.discard(asyncio.current_task())
+            writer.close()
+
+
+class WebSocketTelemetryReader(TelemetryReader):
+    """Aracıdaki telemetri konularına abone olan okuyucu
+
+    asyncio döngüsü bu QThread'in içinde çalışır; Qt döngüsüne köprü
+    SerialTelemetryReader ile aynıdır (alıcılar bu thread'de, göstergelere
+    TelemetryBus üzerinden). Okuyucu yetişemezse aracı bu abonenin en eski
+    mesajlarını atar.
+    """
+
+    def __init__(self, url, topics=(TELEMETRY_TOPIC,), parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.topics = list(topics)
+        self.port = url  # Durum satırında seri port yerine adres gösterilir
+        self._loop = None
+        self._task = None
+
+    def run(self):
+        self.load_batch_decoder()
+        try:
+            asyncio.run(self.main())
+        except asyncio.CancelledError:
+            pass
+
+    async def main(self):
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        if self.isInterruptionRequested():
+            return
+        while not self.isInterruptionRequested():
+            try:
+                websocket = await connect(self.url)
+            except CLOSED_ERRORS + (asyncio.TimeoutError,):
+                self.connection_changed.emit(False)
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            self.connection_changed.emit(True)
+            try:
+                for topic in self.topics:
+                    await websocket.send(json.dumps({"subscribe": topic}))
+                while True:
+                    try:
+                        topic, payload = decode_message(await websocket.receive())
+                    except ValueError as e:
+                        logger.warning("%s: mesaj atlandı: %s", self.url, e)
+                        continue
+                    if any(topic_matches(pattern, topic) for pattern in self.topics):
+                        records = self.parser.feed(payload)
+                        if records:
+                            self.deliver(records)
+            except CLOSED_ERRORS:
+                self.connection_changed.emit(False)
+            finally:
+                await websocket.close()
+
+    def stop(self, timeout_ms=1000):
+        self.requestInterruption()
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Döngü zaten kapanmış
+        self.wait(timeout_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel telemetri aracısını çalıştırır")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    async def serve():
+        broker = TelemetryBroker(args.host, args.port)
+        await broker.start()
+        print(f"Aracı ws://{args.host}:{broker.port} adresinde çalışıyor")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
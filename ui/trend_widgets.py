@@ -0,0 +1,90 @@
+from PySide6.QtCore import Qt, QPointF, QRectF, QTimer
+from PySide6.QtGui import QColor, QFont, QPainter, QPalette, QPen, QPolygonF
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+LINE_COLOR = QColor("#FFB300")
+BAND_COLOR = QColor(255, 179, 0, 60)
+
+
+class TrendSparkline(QWidget):
+    """Bir kanalın son window saniyesini min-max bandı ve ortalama çizgisiyle gösteren küçük grafik
+
+    Veri TelemetryHistory'nin kova özetlerinden piksel sütunu başına bir
+    noktaya indirgenmiş olarak okunur; ham geçmiş kopyalanmaz. Grafik kendi
+    hızında (REFRESH_MS) ve sadece görünürken yenilenir.
+    """
+    REFRESH_MS = 250
+
+    def __init__(self, channel, title, unit, window=60, parent=None):
+        super().__init__(parent)
+        self.channel = channel
+        self.title = title
+        self.unit = unit
+        self.window = window
+        self.history = None  # Arka plan modülleri yüklenince set_history ile verilir
+        self.setMinimumSize(120, 70)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_MS)
+        self.timer.timeout.connect(self.update)
+
+    def set_history(self, history):
+        self.history = history
+        self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        text_color = self.palette().color(QPalette.WindowText)
+        painter.setFont(QFont(self.font().family(), 9))
+        metrics = painter.fontMetrics()
+        rect = QRectF(self.rect()).adjusted(2, 2, -2, -2)
+        header = QRectF(rect.x(), rect.y(), rect.width(), metrics.height())
+        footer = QRectF(rect.x(), rect.bottom() - metrics.height(), rect.width(), metrics.height())
+        plot = QRectF(rect.x(), header.bottom() + 2, rect.width(), footer.top() - header.bottom() - 4)
+
+        painter.setPen(text_color)
+        painter.drawText(header, Qt.AlignLeft | Qt.AlignVCenter, self.title)
+        stats = self.history.stats(self.channel, self.window) if self.history is not None else None
+        if stats is None or not stats.count or plot.height() <= 0:
+            painter.drawText(plot, Qt.AlignCenter, "—")
+            return
+
+        series = self.history.series(self.channel, self.window, max(2, int(plot.width())))
+        latest = series.mean[series.count > 0][-1]
+        painter.drawText(header, Qt.AlignRight | Qt.AlignVCenter, f"{latest:.1f} {self.unit}")
+        summary = f"min {stats.minimum:.1f} · max {stats.maximum:.1f} · ort {stats.mean:.1f}"
+        painter.drawText(footer, Qt.AlignLeft | Qt.AlignVCenter,
+                         metrics.elidedText(summary, Qt.ElideRight, int(footer.width())))
+
+        # Zaman ekseni sağda en son kova, solda window saniye önce
+        low, high = stats.minimum, stats.maximum
+        if high - low < 1e-6:
+            low, high = low - 1.0, high + 1.0
+        xs = (plot.right() - (series.time[-1] - series.time) / self.window * plot.width()).tolist()
+        top = (plot.bottom() - (series.maximum - low) / (high - low) * plot.height()).tolist()
+        bottom = (plot.bottom() - (series.minimum - low) / (high - low) * plot.height()).tolist()
+        middle = (plot.bottom() - (series.mean - low) / (high - low) * plot.height()).tolist()
+        valid = [i for i, count in enumerate(series.count.tolist()) if count]
+
+        # Boş kovalar atlanır; bant ve çizgi veri olan noktaları birleştirir
+        band = QPolygonF([QPointF(xs[i], top[i]) for i in valid] +
+                         [QPointF(xs[i], bottom[i]) for i in reversed(valid)])
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(BAND_COLOR)
+        painter.drawPolygon(band)
+        painter.setPen(QPen(LINE_COLOR, 1.5))
+        painter.setBrush(Qt.NoBrush)
+        if len(valid) > 1:
+            painter.drawPolyline(QPolygonF([QPointF(xs[i], middle[i]) for i in valid]))
+        else:
+            painter.drawPoint(QPointF(xs[valid[0]], middle[valid[0]]))
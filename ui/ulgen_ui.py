@@ -1,5 +1,4 @@
 import sys
-import cv2
 import platform
 import json
 import os
@@ -10,6 +9,11 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont, QPixmap, QImage, QPalette, QColor, QAction, QCursor
 from PySide6.QtCore import Qt, QTimer, QSize, QRect, QSettings, QPoint
 
+from video_backend import DeferredModules
+
+# cv2 açılışta yüklenmez; pencere çizildikten sonra arka planda içe aktarılır
+video_modules = DeferredModules("cv2")
+
 class ThemeManager:
     """Tema yönetimi için sınıf"""
     LIGHT = "light"
@@ -117,18 +121,36 @@ class VideoFeedWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.label)
         
-        self.cap = cv2.VideoCapture()
-        if not self.cap.isOpened():
-            self.label.setText("Unable to open camera.")
+        # cv2 yüklenene kadar yer tutucu yazı gösterilir, kamera sonra açılır
+        self.label.setText("Kamera yükleniyor…")
+        self.cv2 = None
+        self.cap = None
+        video_modules.when_loaded(self.open_camera, self.on_backend_failed)
             
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_frame)
+        
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.cv2 is None:
+            # Yükleme yer tutucu ekrana çıktıktan sonra başlar, ilk çizimle yarışmaz
+            QTimer.singleShot(0, video_modules.start)
+        
+    def open_camera(self):
+        """cv2 hazır olunca kamerayı açar ve kare zamanlayıcısını başlatır"""
+        self.cv2 = video_modules.modules["cv2"]
+        self.cap = self.cv2.VideoCapture()
+        if not self.cap.isOpened():
+            self.label.setText("Unable to open camera.")
         self.timer.start(30)
         
+    def on_backend_failed(self, error):
+        self.label.setText(f"OpenCV yüklenemedi: {error}")
+        
     def update_frame(self):
         ret, frame = self.cap.read()
         if ret:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2RGB)
             h, w, ch = frame.shape
             image = QImage(frame, w, h, w*ch, QImage.Format_RGB888)
             
@@ -139,7 +161,7 @@ class VideoFeedWidget(QWidget):
             self.label.setPixmap(pixmap)
             
     def closeEvent(self, event):
-        if self.cap.isOpened():
+        if self.cap is not None and self.cap.isOpened():
             self.cap.release()
         event.accept()
 
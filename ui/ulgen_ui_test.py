@@ -1,15 +1,36 @@
+import startup_trace  # Açılış izi için ilk import olmalı
+from startup_trace import span, traced
+
 import sys
-import cv2
+import time
+import argparse
 import platform
 import math
-import random
-from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QFrame, QSizePolicy, QScrollArea, QMenu, QStackedWidget, QLCDNumber, QDial, QProgressBar,
-    QComboBox
-)
-from PySide6.QtGui import QFont, QPixmap, QImage, QPalette, QColor, QAction, QCursor, QPainter, QPen, QBrush, QRadialGradient
-from PySide6.QtCore import Qt, QTimer, QSize, QRect, QSettings, QPoint
+with span("import PySide6"):
+    from PySide6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout,
+        QFrame, QSizePolicy, QScrollArea, QMenu, QStackedWidget, QLCDNumber, QProgressBar,
+        QComboBox
+    )
+    from PySide6.QtGui import (
+        QFont, QPixmap, QPalette, QColor, QAction, QCursor, QPainter, QPen, QBrush, QRadialGradient,
+        QKeySequence, QShortcut
+    )
+    from PySide6.QtCore import Qt, QRectF, QSettings, QPoint, QPointF, QEvent, QTimer, Signal
+
+from video_backend import CAMERA_URLS, DeferredModules, configure_opengl
+with span("import telemetry_handler (pyserial)"):
+    from telemetry_handler import SerialTelemetryReader, TelemetryBus, TelemetrySimulator
+from style_compiler import compile_stylesheet, set_style_class
+from detection_overlay import DetectionOverlay, draw_detections
+from trend_widgets import TrendSparkline
+from command_uplink import COMMANDS, CommandUplink
+
+# OpenCV/numpy'ye bağlı katmanlar (video, çıkarım, telemetri geçmişi, uçuş kaydı ve oynatma)
+# arka planda yüklenir; pencere onları beklemeden çizilir
+backend_modules = DeferredModules(
+    "camera_handler", "video_engine", "inference_engine", "telemetry_history", "telemetry_plot",
+    "flight_recorder", "flight_replay")
 
 class ThemeManager:
     """Tema yönetimi için sınıf"""
@@ -55,7 +76,9 @@ class ThemeManager:
                 "warning_color": "#FFA726",
                 "danger_color": "#EF5350",
                 "info_color": "#42A5F5",
-                "preview_bg": "#212121"  # Önizleme arka planı
+                "preview_bg": "#212121",  # Önizleme arka planı
+                "button_bg": "#333333",  # Analiz kartı küçük butonları
+                "button_text": "white"
             }
         else:
             # Açık tema renkleri - işletim sistemine göre hafif farklılıklar
@@ -73,7 +96,9 @@ class ThemeManager:
                     "warning_color": "#FB8C00",
                     "danger_color": "#E53935",
                     "info_color": "#1E88E5",
-                    "preview_bg": "#ebeefb"  # Önizleme arka planı
+                    "preview_bg": "#ebeefb",  # Önizleme arka planı
+                    "button_bg": "#ede7f6",  # Analiz kartı küçük butonları
+                    "button_text": "#673ab7"
                 }
             elif platform_name == "Windows":
                 return {
@@ -89,7 +114,9 @@ class ThemeManager:
                     "warning_color": "#FB8C00",
                     "danger_color": "#E53935",
                     "info_color": "#1E88E5",
-                    "preview_bg": "#ebeefb"  # Önizleme arka planı
+                    "preview_bg": "#ebeefb",  # Önizleme arka planı
+                    "button_bg": "#ede7f6",  # Analiz kartı küçük butonları
+                    "button_text": "#673ab7"
                 }
             else:  # Linux ve diğerleri
                 return {
@@ -105,11 +132,26 @@ class ThemeManager:
                     "warning_color": "#FB8C00",
                     "danger_color": "#E53935",
                     "info_color": "#1E88E5",
-                    "preview_bg": "#ebeefb"  # Önizleme arka planı
+                    "preview_bg": "#ebeefb",  # Önizleme arka planı
+                    "button_bg": "#ede7f6",  # Analiz kartı küçük butonları
+                    "button_text": "#673ab7"
                 }
 
+class VideoPlaceholder(QLabel):
+    """Video katmanı yüklenene kadar video yüzeyinin yerini tutan etiket"""
+    
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setAlignment(Qt.AlignCenter)
+        
+    def set_bg_color(self, color):
+        self.setStyleSheet(f"background-color: {color};")
+
 class VideoFeedWidget(QWidget):
-    def __init__(self, parent=None, bg_color="#FFFFFF"):
+    fps_changed = Signal(float)  # Kameranın ölçülen kare hızı
+    frame_received = Signal(object, object)  # Her yeni kare ve kaynağı (ör. çıkarım motoru için)
+    
+    def __init__(self, parent=None, bg_color="#FFFFFF", renderer=None):
         super().__init__(parent)
         self.bg_color = bg_color
         self.camera_source = 0  # Varsayılan kamera
@@ -122,186 +164,326 @@ class VideoFeedWidget(QWidget):
         self.camera_selector = QComboBox()
         self.camera_selector.addItem("Araç Kamerası", 0)
         self.camera_selector.addItem("Dron Kamerası", 1)
-        self.camera_selector.setStyleSheet(f"""
-            QComboBox {{
-                background: {bg_color};
-                color: #333;
-                padding: 4px;
-                border-radius: 4px;
-                border: 1px solid #ccc;
-            }}
-        """)
+        set_style_class(self.camera_selector, "cameraSelector")
         self.camera_selector.currentIndexChanged.connect(self.change_camera)
         
         self.toolbar.addWidget(QLabel("Kamera:"))
         self.toolbar.addWidget(self.camera_selector)
         self.toolbar.addStretch()
         
-        # Video etiketi
-        self.label = QLabel()
-        self.label.setAlignment(Qt.AlignCenter)
-        self.label.setMinimumSize(320, 180)
-        self.label.setStyleSheet(f"background-color: {self.bg_color};")
-        self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Video katmanı yüklenene kadar yer tutucu gösterilir
+        self.renderer = renderer
+        self.label = VideoPlaceholder("Kamera yükleniyor…")
+        self.setup_surface()
         
         self.layout.addLayout(self.toolbar)
         self.layout.addWidget(self.label)
         
-        # OpenCV video yakalama
-        self.cap = cv2.VideoCapture()
-        if not self.cap.isOpened():
-            self.label.setText("Unable to open camera.")
-            
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(30)
+        # Kaynaklar CameraHub üzerinden paylaşılır, kareler kuyruklu sinyal ile gelir
+        self.hub = None
+        self.stream = None
+        # Kayıttan oynatmada kareler canlı akış yerine ReplayEngine'den gelir
+        self.replay = None
+        self.replay_frame = None
+        # Tespit kaplaması yüzeyin paintEvent'inde çizilir, kare tamponuna dokunmaz
+        self.overlay = DetectionOverlay(self)
+        self.fps_changed.connect(self.overlay.set_camera_fps)
+        backend_modules.when_loaded(self.on_backend_loaded, self.on_backend_failed)
+        
+        # Widget silindiğinde aboneliği bırak
+        self.destroyed.connect(lambda: self.release_stream())
+        
+    def setup_surface(self):
+        self.label.setMinimumSize(320, 180)
+        self.label.set_bg_color(self.bg_color)
+        self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.hub is None:
+            # Yükleme yer tutucu ekrana çıktıktan sonra başlar, ilk çizimle yarışmaz
+            QTimer.singleShot(0, backend_modules.start)
+        
+    def on_backend_loaded(self):
+        """Yer tutucuyu gerçek video yüzeyiyle değiştirir ve kamerayı açar"""
+        # Video yüzeyi - renderer "label" (CPU ölçekleme) veya "opengl" (GPU ölçekleme)
+        placeholder = self.label
+        self.label = backend_modules.modules["video_engine"].create_video_surface(self.renderer)
+        self.setup_surface()
+        self.label.set_overlay(self.overlay)
+        self.layout.replaceWidget(placeholder, self.label)
+        placeholder.deleteLater()
+        
+        self.hub = backend_modules.modules["camera_handler"].CameraHub.instance()
+        self.change_camera(self.camera_selector.currentIndex())
+        
+    def on_backend_failed(self, error):
+        self.label.setText(f"Video katmanı yüklenemedi: {error}")
         
     def change_camera(self, index):
         """Kamera kaynağını değiştirir"""
+        if self.hub is None:
+            return  # Seçili kamera, video katmanı yüklenince açılır
+        if self.replay is not None:
+            self.replay_frame = None
+            self.replay.refresh()  # Seçilen kameranın kaydı konumdaki kareden gösterilir
+            return
         camera_id = self.camera_selector.currentData()
         
-        if self.cap.isOpened():
-            self.cap.release()
-            
-        self.cap = cv2.VideoCapture(camera_id)
-        if not self.cap.isOpened():
-            self.label.setText(f"Unable to open camera source: {camera_id}")
+        self.stop_capture()
+        
+        self.stream = self.hub.acquire(camera_id)
+        self.stream.opened.connect(self.on_camera_opened)
+        self.stream.frame_ready.connect(self.update_frame)
+        self.stream.fps_measured.connect(self.fps_changed)
+        self.request_stream_size()
+        self.update_activity()
+        
+        # Kaynak başka bir widget tarafından zaten açılmışsa durumu hemen göster
+        if self.stream.is_opened is not None:
+            self.on_camera_opened(self.stream.is_opened)
+        
+    def set_replay(self, replay):
+        """Canlı kamerayı bırakıp kareleri kayıttan oynatıcıdan alır"""
+        self.stop_capture()
+        self.replay = replay
+        replay.frame_ready.connect(self.show_replay_frame)
+        
+    def stop_capture(self):
+        """Kamera aboneliğini bırakır"""
+        if self.stream is not None:
+            self.stream.opened.disconnect(self.on_camera_opened)
+            self.stream.frame_ready.disconnect(self.update_frame)
+            self.stream.fps_measured.disconnect(self.fps_changed)
+            self.release_stream()
+    
+    def release_stream(self):
+        """Aboneliği sinyal bağlantılarına dokunmadan hub'a geri verir"""
+        if self.stream is not None:
+            stream, self.stream = self.stream, None
+            stream.set_active(id(self), False)
+            stream.forget_size(id(self))
+            self.hub.release(stream.source)
+    
+    def request_stream_size(self):
+        """Video yüzeyinin fiziksel boyutunu profil seçimi için akışa bildirir"""
+        if self.stream is not None and self.label.width() > 0:
+            ratio = self.label.devicePixelRatioF()
+            self.stream.request_size(
+                id(self), int(self.label.width() * ratio), int(self.label.height() * ratio))
     
-    def update_frame(self):
-        ret, frame = self.cap.read()
-        if ret:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame.shape
-            image = QImage(frame, w, h, w*ch, QImage.Format_RGB888)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.request_stream_size()
+    
+    def is_shown(self):
+        """Widget gerçekten ekranda mı (gizli sayfa veya simge durumunda değil)"""
+        return self.isVisible() and not self.window().isMinimized()
+    
+    def update_activity(self):
+        """Görünür değilken yakalama ve çizimi askıya alır, görünür olunca sürdürür"""
+        if self.stream is not None:
+            self.stream.set_active(id(self), self.is_shown())
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_activity()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_activity()
+    
+    def on_camera_opened(self, ok):
+        """Kamera açılış sonucunu gösterir"""
+        if not ok and self.stream is not None:
+            self.label.setText(f"Unable to open camera source: {self.stream.source} (retrying)")
+    
+    def latest_frame(self):
+        """Akıştaki en son kareyi döndürür (henüz kare yoksa None)"""
+        if self.replay is not None:
+            return self.replay_frame
+        return self.stream.last_frame if self.stream is not None else None
+    
+    def source(self):
+        """İzlenen kamera kaynağı (video katmanı yüklenmediyse None)"""
+        if self.replay is not None:
+            return self.camera_selector.currentData()
+        return self.stream.source if self.stream is not None else None
+    
+    def set_detections(self, result):
+        """Bu kaynağın son çıkarım sonucunu kaplamada gösterir (None = temizle)"""
+        if result is None:
+            self.overlay.clear()
+        else:
+            self.overlay.set_result(result)
+    
+    def update_frame(self, frame):
+        if frame is not None:
+            self.frame_received.emit(frame, self.stream.source)
+        # Aynı kaynağı izleyen başka bir widget görünürken bile gizli widget çizmez
+        if frame is not None and self.is_shown():
+            # Çizim süresi, kamera profilini kare bütçesine göre ayarlamak için ölçülür
+            start = time.perf_counter()
+            self.label.show_frame(frame)
+            self.stream.report_render_time(time.perf_counter() - start)
+            startup_trace.mark("ilk kamera karesi")
             
-            pixmap = QPixmap.fromImage(image).scaled(
-                self.label.width(), self.label.height(),
-                Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                
-            self.label.setPixmap(pixmap)
+    def show_replay_frame(self, frame, source):
+        """Kayıttan gelen kareyi canlı karelerle aynı yoldan (çıkarım, kaplama) gösterir"""
+        if source != self.camera_selector.currentData():
+            return
+        self.replay_frame = frame
+        self.frame_received.emit(frame, source)
+        if self.is_shown():
+            self.label.show_frame(frame)
             
     def closeEvent(self, event):
-        if self.cap.isOpened():
-            self.cap.release()
+        self.stop_capture()
         event.accept()
         
     def set_bg_color(self, color):
         """Video arka plan rengini günceller"""
         self.bg_color = color
-        self.label.setStyleSheet(f"background-color: {self.bg_color};")
-        self.camera_selector.setStyleSheet(f"""
-            QComboBox {{
-                background: {color};
-                color: #333;
-                padding: 4px;
-                border-radius: 4px;
-                border: 1px solid #ccc;
-            }}
-        """)
+        self.label.set_bg_color(self.bg_color)
+
+def make_layer(size, device_pixel_ratio):
+    """Önbellek katmanı için şeffaf, yüksek DPI uyumlu bir QPixmap oluşturur"""
+    pixmap = QPixmap(max(1, math.ceil(size.width() * device_pixel_ratio)),
+                     max(1, math.ceil(size.height() * device_pixel_ratio)))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    return pixmap
 
-class ArtificialHorizon(QWidget):
+class CachedGauge(QWidget):
+    """Sabit parçalarını önbellekteki QPixmap'lere çizen gösterge tabanı
+
+    Katmanlar sadece boyut, DPI veya tema değişince yeniden oluşturulur.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.layers = None
+        
+    def invalidate_cache(self):
+        self.layers = None
+        self.update()
+        
+    def cached_layers(self):
+        if self.layers is None:
+            self.layers = self.build_layers()
+        return self.layers
+        
+    def build_layers(self):
+        return {}
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.layers = None
+        
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange, QEvent.DevicePixelRatioChange):
+            self.invalidate_cache()
+
+class ArtificialHorizon(CachedGauge):
     """Dron için yapay ufuk göstergesi"""
+    PITCH_SCALE = 5  # Derece başına piksel
+    PITCH_LIMIT = 15
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(200, 200)
         self.roll = 0
         self.pitch = 0
         
-        # Örnek veri güncelleme zamanlayıcısı
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_values)
-        self.timer.start(100)  # 100ms'de bir güncelle
-        
-    def update_values(self):
-        """Simüle edilmiş değerlerle ufuk çizgisini günceller"""
-        # Gerçek sistemde WebSocket veya benzeri bir teknoloji ile drondan veri alınır
-        self.roll += random.uniform(-1, 1)
-        self.pitch += random.uniform(-0.5, 0.5)
+    def set_attitude(self, roll, pitch):
+        """Telemetriden gelen yatış ve yunuslama açılarını gösterir"""
+        self.roll = max(min(roll, 30), -30)
+        self.pitch = max(min(pitch, self.PITCH_LIMIT), -self.PITCH_LIMIT)
+        self.update()
         
-        # Değerleri sınırla
-        self.roll = max(min(self.roll, 30), -30)  # -30 ile 30 derece arası
-        self.pitch = max(min(self.pitch, 15), -15)  # -15 ile 15 derece arası
+    def geometry_values(self):
+        width = self.width()
+        height = self.height()
+        return width / 2, height / 2, min(width, height) / 2 - 10
+        
+    def build_layers(self):
+        """Gökyüzü/yer fırçalarını ve ön plan katmanını bir kez oluşturur"""
+        center_x, center_y, radius = self.geometry_values()
+        
+        # Gradyanlar dönen eksenin merkezine sabittir, sadece boyutla değişir
+        def gradient_brush(inner, outer):
+            gradient = QRadialGradient(0, 0, radius * 2)
+            gradient.setColorAt(0, inner)
+            gradient.setColorAt(1, outer)
+            return QBrush(gradient)
+        
+        # Dış çerçeve ve merkez uçak göstergesi
+        overlay = make_layer(self.size(), self.devicePixelRatioF())
+        painter = QPainter(overlay)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(Qt.gray, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
+        painter.setPen(QPen(Qt.yellow, 2))
+        painter.drawLine(center_x - 20, center_y, center_x + 20, center_y)
+        painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
+        painter.drawLine(center_x - 5, center_y + 10, center_x + 5, center_y + 10)
+        painter.end()
         
-        self.update()
+        return {
+            "sky": gradient_brush(QColor(135, 206, 250), QColor(0, 0, 139)),  # Açık/koyu mavi
+            "ground": gradient_brush(QColor(139, 69, 19), QColor(101, 67, 33)),  # Açık/koyu kahverengi
+            "overlay": overlay,
+        }
         
     def paintEvent(self, event):
-        """Yapay ufuk çizimi"""
+        """Yapay ufuk çizimi: sadece dönen ufuk her seferinde çizilir"""
+        layers = self.cached_layers()
+        center_x, center_y, radius = self.geometry_values()
+        offset = self.pitch * self.PITCH_SCALE
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        width = self.width()
-        height = self.height()
-        center_x = width / 2
-        center_y = height / 2
-        radius = min(width, height) / 2 - 10
-        
-        # Arka plan gradient (gökyüzü ve yer)
         painter.save()
         painter.translate(center_x, center_y)
         painter.rotate(-self.roll)
         
-        # Gökyüzü (mavi)
-        sky_rect = QRect(-radius, -radius - self.pitch * 5, radius * 2, radius * 2)
-        sky_gradient = QRadialGradient(0, 0, radius * 2)
-        sky_gradient.setColorAt(0, QColor(135, 206, 250))  # Açık mavi
-        sky_gradient.setColorAt(1, QColor(0, 0, 139))  # Koyu mavi
-        painter.setBrush(QBrush(sky_gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(sky_rect)
-        
-        # Yer (kahverengi)
-        ground_rect = QRect(-radius, 0 - self.pitch * 5, radius * 2, radius * 2)
-        ground_gradient = QRadialGradient(0, 0, radius * 2)
-        ground_gradient.setColorAt(0, QColor(139, 69, 19))  # Açık kahverengi
-        ground_gradient.setColorAt(1, QColor(101, 67, 33))  # Koyu kahverengi
-        painter.setBrush(QBrush(ground_gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(ground_rect)
+        # Gökyüzü ve yer
+        painter.fillRect(QRectF(-radius, -radius - offset, radius * 2, radius * 2), layers["sky"])
+        painter.fillRect(QRectF(-radius, -offset, radius * 2, radius * 2), layers["ground"])
         
         # Ufuk çizgisi
         painter.setPen(QPen(Qt.white, 2))
-        painter.drawLine(-radius, -self.pitch * 5, radius, -self.pitch * 5)
+        painter.drawLine(QPointF(-radius, -offset), QPointF(radius, -offset))
         
         painter.restore()
         
-        # Dış çerçeve
-        painter.setPen(QPen(Qt.gray, 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
-        
-        # Merkez uçak göstergesi
-        painter.setPen(QPen(Qt.yellow, 2))
-        painter.drawLine(center_x - 20, center_y, center_x + 20, center_y)
-        painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
-        painter.drawLine(center_x - 5, center_y + 10, center_x + 5, center_y + 10)
+        painter.drawPixmap(0, 0, layers["overlay"])
 
-class ClimbIndicator(QWidget):
+class ClimbIndicator(CachedGauge):
     """Tırmanma hızı göstergesi"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(120, 200)
         self.climb_rate = 0  # ft/min
         
-        # Örnek veri güncelleme zamanlayıcısı
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_values)
-        self.timer.start(200)  # 200ms'de bir güncelle
-        
-    def update_values(self):
-        """Simüle edilmiş değerlerle tırmanma hızını günceller"""
-        self.climb_rate = random.uniform(-800, 800)  # -800 ile 800 ft/min arası
+    def set_climb_rate(self, climb_rate):
+        """Telemetriden gelen tırmanma hızını (ft/min) gösterir"""
+        self.climb_rate = climb_rate
         self.update()
         
-    def paintEvent(self, event):
-        """Tırmanma hızı göstergesini çizer"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
+    def geometry_values(self):
         width = self.width()
         height = self.height()
-        center_x = width / 2
-        center_y = height / 2
-        radius = min(width, height) / 2 - 10
+        return width / 2, height / 2, min(width, height) / 2 - 10
+        
+    def build_layers(self):
+        """Kadran, çizgiler, rakamlar, yazılar ve çerçeveyi bir kez çizer"""
+        center_x, center_y, radius = self.geometry_values()
+        dial = make_layer(self.size(), self.devicePixelRatioF())
+        painter = QPainter(dial)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # Arka plan
         painter.setBrush(QBrush(Qt.black))
@@ -335,8 +517,24 @@ class ClimbIndicator(QWidget):
         painter.drawText(center_x - 20, center_y - radius * 0.3, "CLIMB")
         painter.drawText(center_x - 30, center_y - radius * 0.15, "1000 FT PER MINUTE")
         
+        # Dış çerçeve (ibre çerçeveye ulaşmadığı için altta kalması görüntüyü değiştirmez)
+        painter.setPen(QPen(Qt.gray, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
+        painter.end()
+        
+        return {"dial": dial}
+        
+    def paintEvent(self, event):
+        """Tırmanma hızı göstergesini çizer: kadran önbellekten, ibre canlı"""
+        layers = self.cached_layers()
+        center_x, center_y, radius = self.geometry_values()
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, layers["dial"])
+        
         # İbre
-        painter.save()
         angle = self.climb_rate / 1000.0 * 120  # 1000 ft/min = 60 derece
         angle = max(min(angle, 120), -120)  # -120 ile 120 derece arası sınırla
         
@@ -345,31 +543,13 @@ class ClimbIndicator(QWidget):
         
         painter.setPen(QPen(Qt.white, 2))
         painter.drawLine(0, 0, 0, -radius * 0.8)
-        
-        painter.restore()
-        
-        # Dış çerçeve
-        painter.setPen(QPen(Qt.gray, 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPoint(center_x, center_y), radius, radius)
 
-def make_icon_button(icon_text, color="white", bg_color="#333333"):
+def make_icon_button(icon_text, color_class="textGray"):
     btn = QPushButton(icon_text)
     btn.setFont(QFont("Arial", 20, QFont.Bold))
     btn.setFixedSize(48, 48)
     btn.setCursor(Qt.PointingHandCursor)
-    btn.setStyleSheet(f"""
-        QPushButton {{
-            background-color: {bg_color};
-            color: {color};
-            border-radius: 16px;
-            border: none;
-        }}
-        QPushButton:hover {{
-            background-color: #ffe082;
-            color: #333;
-        }}
-    """)
+    set_style_class(btn, "menuButton", color_class)
     return btn
 
 class ResponsiveCard(QFrame):
@@ -387,25 +567,107 @@ class ResponsiveCard(QFrame):
     def add_layout(self, layout, stretch=0):
         self.layout.addLayout(layout, stretch)
 
+class LazyPage(QWidget):
+    """İçeriğini ilk gösterildiğinde oluşturan QStackedWidget sayfası"""
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.page = None
+        
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        
+    def ensure_built(self):
+        """Sayfa henüz oluşturulmadıysa şimdi oluşturur ve döndürür"""
+        if self.page is None:
+            self.page = self.factory()
+            self.layout.addWidget(self.page)
+        return self.page
+        
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
+
 class UlgenDashboard(QMainWindow):
-    def __init__(self):
+    def __init__(self, telemetry_port=None, baudrate=None, replay_session=None, replay_speed=1.0,
+                 command_port=None, command_baudrate=None):
         super().__init__()
-        self.setWindowTitle("ÜLGEN AI-DRIVEN EXPLORATION")
+        self.title = "ÜLGEN AI-DRIVEN EXPLORATION"
+        self.setWindowTitle(self.title)
         
         # Tema yöneticisi oluştur
         self.theme_manager = ThemeManager()
         
+        # Telemetri kaynağı: seri port tanımlıysa gerçek veri, değilse simülasyon
+        settings = QSettings("ULGEN", "Dashboard")
+        self.telemetry_port = telemetry_port or settings.value("telemetry/port", "")
+        self.telemetry_baudrate = baudrate or settings.value("telemetry/baudrate", 115200, type=int)
+        self.telemetry_connected = False
+        self.telemetry_reader = None
+        self.telemetry_simulator = None
+        
+        # Komut yukarı bağlantısı: Kalkış/İniş düğmeleri kuyruğa ekler, gönderim ayrı thread'de
+        self.command_port = command_port or settings.value("command/port", "")
+        self.command_baudrate = command_baudrate or settings.value("command/baudrate", 115200, type=int)
+        self.uplink = None
+        self.uplink_status = ("Komut bağlantısı yok", "textSecondary")
+        
+        # Tüm göstergeler tek veri yolundan, ekran tazelemesi başına bir kez güncellenir
+        self.telemetry_bus = TelemetryBus(parent=self)
+        
+        # Görüntü analizi: motor ilk kullanımda oluşturulur, model işçi thread'inde yüklenir
+        self.inference = None
+        self.live_inference = False
+        self.preview_presenter = None
+        
+        # Trend grafikleri için telemetri geçmişi ve uçuş kaydedici (son N dakika)
+        # arka plan modülleri yüklenince başlar
+        self.history = None
+        self.recorder = None
+        
+        # Kayıttan oynatma: göstergeler ve videolar bir oturum klasöründen beslenir
+        self.replay_session = replay_session
+        self.replay_speed = replay_speed
+        self.replay = None
+        
         # İşletim sistemi tespiti
         self.detect_platform()
         
         # Ana UI yapısını oluştur
         self.init_ui()
         
-        # Telemetri verilerini simüle etmek için zamanlayıcı
-        self.telemetry_timer = QTimer(self)
-        self.telemetry_timer.timeout.connect(self.update_telemetry)
-        self.telemetry_timer.start(500)  # 500ms'de bir güncelle
+        self.telemetry_bus.updated.connect(self.apply_telemetry)
+        backend_modules.when_loaded(self.start_history)
+        if self.replay_session:
+            # Oynatmada canlı kaynak ve kaydedici açılmaz; veri yolunu oynatıcı besler
+            backend_modules.when_loaded(self.start_replay)
+        elif self.telemetry_port:
+            # Okuma ayrı thread'de, kayıtlar doğrudan veri yoluna yazılır
+            if self.telemetry_port.startswith("ws://"):
+                # asyncio sadece WebSocket kaynağı seçildiğinde yüklenir
+                from telemetry_transport import WebSocketTelemetryReader
+                self.telemetry_reader = WebSocketTelemetryReader(self.telemetry_port)
+            else:
+                self.telemetry_reader = SerialTelemetryReader(self.telemetry_port, self.telemetry_baudrate)
+            self.telemetry_reader.add_sink(self.telemetry_bus.publish_records)
+            self.telemetry_reader.connection_changed.connect(self.on_telemetry_connection, Qt.QueuedConnection)
+            self.telemetry_reader.start()
+        else:
+            # Telemetri verilerini simüle eden tek zamanlayıcı
+            self.telemetry_simulator = TelemetrySimulator(self.telemetry_bus, self)
+        
+        if not self.replay_session and settings.value("recorder/enabled", True, type=bool):
+            backend_modules.when_loaded(self.start_recorder)
         
+        if not self.replay_session and self.command_port:
+            self.uplink = CommandUplink(self.command_port, self.command_baudrate, parent=self)
+            self.uplink.command_acked.connect(self.on_command_acked, Qt.QueuedConnection)
+            self.uplink.command_failed.connect(self.on_command_failed, Qt.QueuedConnection)
+            self.uplink.connection_changed.connect(self.on_uplink_connection, Qt.QueuedConnection)
+            self.uplink_status = ("Komut bağlantısı bekleniyor…", "textSecondary")
+            self.uplink.start()
+        
+    @traced
     def detect_platform(self):
         """İşletim sistemini tespit eder ve tema değişkenleri ayarlar"""
         self.platform_name = platform.system()
@@ -437,25 +699,270 @@ class UlgenDashboard(QMainWindow):
         self.info_color = colors["info_color"]
         self.preview_bg = colors["preview_bg"]
         
-    def update_telemetry(self):
-        """Telemetri verilerini simüle et ve göstergeleri güncelle"""
-        if hasattr(self, 'altitude_lcd'):
-            # Rastgele yükseklik değeri (gerçek sistemde drone'dan alınır)
-            altitude = random.uniform(20, 150)
-            self.altitude_lcd.display(f"{altitude:.1f}")
-            
-            # Hız değeri
-            speed = random.uniform(0, 45)
-            self.speed_lcd.display(f"{speed:.1f}")
+        # Stil derleyicisinde kullanılan değerler
+        self.theme_values = dict(colors, radius=self.radius, font_family=self.font_family)
+        
+    def apply_telemetry(self, values):
+        """Veri yolundan gelen, değeri değişmiş kanalları göstergelere uygular"""
+        if not hasattr(self, 'altitude_lcd'):
+            return
+        if "altitude" in values:
+            self.altitude_lcd.display(f"{values['altitude']:.1f}")
+        if "speed" in values:
+            self.speed_lcd.display(f"{values['speed']:.1f}")
+        if "battery" in values:
+            self.battery_progress.setValue(int(values["battery"]))
+        if "signal" in values:
+            self.signal_progress.setValue(int(values["signal"]))
+        if "roll" in values or "pitch" in values:
+            self.artificial_horizon.set_attitude(
+                values.get("roll", self.artificial_horizon.roll),
+                values.get("pitch", self.artificial_horizon.pitch))
+        if "climb_rate" in values:
+            self.climb_indicator.set_climb_rate(values["climb_rate"])
             
-            # Batarya seviyesi
-            battery = random.randint(60, 100)
-            self.battery_progress.setValue(battery)
+    def on_telemetry_connection(self, connected):
+        """Seri bağlantı durumunu dron sayfasındaki durum etiketine yansıtır"""
+        self.telemetry_connected = connected
+        self.update_drone_status()
+        
+    def send_command(self, name):
+        """Komutu yukarı bağlantı kuyruğuna ekler; tıklama bağlantıyı beklemez"""
+        if self.uplink is None:
+            self.set_uplink_status("Komut bağlantısı yok", "textDanger")
+        elif self.uplink.send(name) is not None:
+            self.set_uplink_status(f"{COMMANDS[name].label} gönderildi…", "textSecondary")
+    
+    def on_command_acked(self, command_id, name, accepted, rtt):
+        label = COMMANDS[name].label
+        if not accepted:
+            self.set_uplink_status(f"{label} araç tarafından reddedildi", "textDanger")
+            return
+        # Yeniden denenen komutun RTT'si bilinmez; ortalama son tek denemeli komutlardandır
+        mean = self.uplink.mean_rtt
+        timing = f"RTT {rtt * 1e3:.0f} ms" if rtt >= 0 else "yeniden denendi"
+        if mean is not None:
+            timing += f" (ort. {mean * 1e3:.0f} ms)"
+        self.set_uplink_status(f"{label} onaylandı · {timing}", "textSuccess")
+    
+    def on_command_failed(self, command_id, name, reason):
+        self.set_uplink_status(f"{COMMANDS[name].label} başarısız: {reason}", "textDanger")
+    
+    def on_uplink_connection(self, connected):
+        if connected:
+            self.set_uplink_status("Komut bağlantısı hazır", "textSecondary")
+        else:
+            self.set_uplink_status(f"Komut bağlantısı yok - {self.command_port}", "textDanger")
+    
+    def set_uplink_status(self, text, style_class):
+        """Komut durumunu saklar; dron sayfası oluşturulduysa etikete yazar"""
+        self.uplink_status = (text, style_class)
+        if hasattr(self, 'uplink_label'):
+            self.uplink_label.setText(text)
+            set_style_class(self.uplink_label, style_class)
+        
+    def update_drone_status(self):
+        """Dron sayfasındaki bağlantı durum etiketini günceller"""
+        if self.telemetry_reader is None or not hasattr(self, 'drone_status_label'):
+            return
+        if self.telemetry_connected:
+            self.drone_status_label.setText("🟢 Online - Aktif Uçuş")
+            set_style_class(self.drone_status_label, "textSuccess")
+        else:
+            self.drone_status_label.setText(f"🔴 Offline - {self.telemetry_port}")
+            set_style_class(self.drone_status_label, "textDanger")
             
-            # Sinyal gücü
-            signal = random.randint(70, 100)
-            self.signal_progress.setValue(signal)
+    def start_history(self):
+        """Telemetri geçmişini kaynağa ve trend grafiklerine bağlar (oynatmada start_replay bağlar)"""
+        self.history = backend_modules.modules["telemetry_history"].TelemetryHistory()
+        source = self.telemetry_reader or self.telemetry_simulator
+        if source is not None:
+            source.add_sink(self.history.append_records)
+        for sparkline in self.findChildren(TrendSparkline):
+            sparkline.set_history(self.history)
+        if hasattr(self, 'plot_placeholder'):
+            self.add_telemetry_plot()
+        
+    def add_telemetry_plot(self):
+        """Dron sayfasındaki grafik yer tutucusunu yüksek hızlı telemetri grafiğiyle değiştirir"""
+        channel, unit = self.plot_channel_selector.currentData()
+        self.telemetry_plot = backend_modules.modules["telemetry_plot"].TelemetryPlot(self.history, channel, unit)
+        self.plot_layout.replaceWidget(self.plot_placeholder, self.telemetry_plot)
+        self.plot_placeholder.deleteLater()
+        del self.plot_placeholder
+        
+    def change_plot_channel(self, index):
+        if self.telemetry_plot is not None:
+            self.telemetry_plot.set_channel(*self.plot_channel_selector.currentData())
+        
+    def start_recorder(self):
+        """Telemetri kaynağının ve kameraların kayıtlarını uçuş kaydediciye bağlar"""
+        self.recorder = backend_modules.modules["flight_recorder"].FlightRecorder(parent=self)
+        source = self.telemetry_reader or self.telemetry_simulator
+        source.add_sink(self.recorder.record_telemetry)
+        if self.recorder.record_video:
+            for video in self.findChildren(VideoFeedWidget):
+                video.frame_received.connect(self.recorder.record_frame)
+        
+    def sync_replay_camera(self):
+        """Oynatmada göstergeleri ana videoda seçilen kameranın karesine eşler"""
+        self.replay.set_sync_source(self.video_widget.source())
+
+    def start_replay(self):
+        """Kayıtlı oturumu açar ve videoları, göstergeleri oynatıcıya bağlar"""
+        flight_replay = backend_modules.modules["flight_replay"]
+        try:
+            log = flight_replay.FlightLog(self.replay_session)
+        except (OSError, ValueError) as e:
+            self.status_text.setText(f"Replay could not be opened: {e}")
+            return
+        self.replay = flight_replay.ReplayEngine(log, self.telemetry_bus, parent=self)
+        # Göstergeler ana videodaki kareyle eşlenir, kamera değişince de
+        self.replay.set_sync_source(self.video_widget.source())
+        self.video_widget.camera_selector.currentIndexChanged.connect(self.sync_replay_camera)
+        self.replay.position_changed.connect(self.update_replay_status)
+        if self.history is not None:
+            self.replay.add_sink(self.history.append_records)
+            self.replay.seeked.connect(self.history.clear)
+        for video in self.findChildren(VideoFeedWidget):
+            video.set_replay(self.replay)
+        
+        # Boşluk oynat/duraklat, +/- hız, ←/→ 10 s geri/ileri, Home başa
+        shortcuts = (
+            ("Space", self.replay.toggle),
+            ("+", self.replay.faster),
+            ("=", self.replay.faster),
+            ("-", self.replay.slower),
+            ("Left", lambda: self.replay.seek(self.replay.position - 10)),
+            ("Right", lambda: self.replay.seek(self.replay.position + 10)),
+            ("Home", lambda: self.replay.seek(self.replay.log.start)),
+        )
+        for key, action in shortcuts:
+            QShortcut(QKeySequence(key), self, action)
+        
+        self.replay.set_speed(self.replay_speed)
+        self.replay.play()
+        
+    def update_replay_status(self, position):
+        """Oynatma durumunu, hızını ve konumunu pencere başlığında gösterir"""
+        title = f"{self.title} — REPLAY {self.replay.status_text()}"
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
+        
+    def closeEvent(self, event):
+        if self.replay is not None:
+            self.replay.stop()
+        if self.telemetry_reader is not None:
+            self.telemetry_reader.stop()
+        if self.uplink is not None:
+            self.uplink.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        super().closeEvent(event)
+        
+    def get_inference_engine(self):
+        """Çıkarım motorunu ilk kullanımda oluşturur; video katmanı yüklenmediyse None"""
+        if self.inference is None and backend_modules.done and backend_modules.error is None:
+            inference_engine = backend_modules.modules["inference_engine"]
+            self.preview_presenter = backend_modules.modules["video_engine"].FramePresenter()
+            self.inference = inference_engine.InferenceEngine(parent=self)
+            self.inference.result_ready.connect(self.show_inference_result)
+            self.inference.model_loaded.connect(self.on_model_loaded)
+            self.inference.model_failed.connect(self.on_model_failed)
+            self.inference.batch_failed.connect(self.on_batch_failed)
+            self.inference.start()
+        return self.inference
+        
+    def set_current_task(self, task):
+        self.current_task_label.setText(f"Current Task: <b>{task}</b>")
+        
+    def analyze_image(self):
+        """Video akışındaki son kareyi bir kez analiz eder"""
+        engine = self.get_inference_engine()
+        frame = self.video_widget.latest_frame()
+        if engine is None or frame is None:
+            self.set_current_task("no camera frame")
+            return
+        engine.submit(frame, "snapshot", one_shot=True)
+        self.set_current_task("analyzing image…")
+        
+    def set_live_inference(self, enabled):
+        """CNN butonu: açıkken her yeni kare analiz için motora bırakılır"""
+        if enabled and self.get_inference_engine() is None:
+            self.cnn_btn.setChecked(False)  # Video katmanı henüz yüklenmedi
+            return
+        self.live_inference = enabled
+        self.set_current_task("live detection…" if enabled else "none")
+        if not enabled:
+            for video in self.findChildren(VideoFeedWidget):
+                video.set_detections(None)
+        
+    def submit_live_frame(self, frame, source):
+        # Her kaynağın sadece en yeni karesi bekler; motor etkin kaynakları tek toplu işte çalıştırır
+        if self.live_inference:
+            self.inference.submit(frame, source)
+        
+    def on_model_loaded(self, name):
+        self.status_text.setText(f"Model ready - {name}")
+        
+    def on_model_failed(self, error):
+        self.cnn_btn.setChecked(False)
+        if self.inference is not None:
+            # Motor bırakılır; ayarlar düzeltilince sonraki analizde yeniden denenir
+            self.inference.stop(timeout=0)
+            self.inference.deleteLater()
+            self.inference = None
+        self.set_current_task("model error")
+        self.status_text.setText(f"Model could not be loaded: {error}")
+        
+    def on_batch_failed(self, error):
+        """Tek bir analiz hatası: motor çalışmaya devam eder, hata durum satırında gösterilir"""
+        skipped = self.inference.failed if self.inference is not None else 1
+        self.status_text.setText(f"Analysis failed, {skipped} batches skipped: {error}")
+        
+    def show_inference_result(self):
+        """Kaynak başına sonuçları video kaplamalarına, ana kaynağınkini önizlemeye yansıtır"""
+        results = self.inference.take_results()
+        for video in self.findChildren(VideoFeedWidget):
+            if self.live_inference and video.source() in results:
+                video.set_detections(results[video.source()])
+        
+        result = results.get("snapshot") or results.get(self.video_widget.source())
+        if result is None:
+            return
+        
+        # Önizleme kareden bir kez ölçeklenir, kutular QPainter ile üstüne çizilir
+        ratio = self.preview_img.devicePixelRatioF()
+        pixmap = self.preview_presenter.present(
+            result.frame, self.preview_img.width(), self.preview_img.height(), ratio)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw_detections(painter, QRectF(0, 0, pixmap.width() / ratio, pixmap.height() / ratio),
+                        result.detections)
+        painter.end()
+        self.preview_img.setPixmap(pixmap)
+        
+        if result.detections:
+            mean_score = sum(d.score for d in result.detections) / len(result.detections)
+            self.accuracy_value.setText(f"{mean_score:.0%}")
+        else:
+            self.accuracy_value.setText("--")
+        
+        task = "image analysis" if result.source == "snapshot" else "live detection"
+        self.set_current_task(f"{task} · {len(result.detections)} objects · "
+                              f"{result.latency * 1e3:.0f} ms ({result.detector})")
+        if self.live_inference:
+            stats = self.inference.stats()
+            self.status_text.setText(
+                f"{result.detector} - batch {stats.mean_batch_size:.1f}, "
+                f"{stats.batch_latency * 1e3:.0f} ms/batch, {stats.throughput:.1f} frames/s, "
+                f"{stats.dropped} dropped")
+        
+    def update_frequency(self, fps):
+        """DATASETS kartındaki frekansı kameranın ölçülen kare hızıyla günceller"""
+        self.frequency_value.setText(f"<b>{fps:.1f}Hz</b>")
             
+    @traced
     def init_ui(self):
         # Ekran boyutunu al ve %90'ını kullan
         available_geometry = QApplication.primaryScreen().availableGeometry()
@@ -477,7 +984,7 @@ class UlgenDashboard(QMainWindow):
         
         # Ana içerik widget'ı
         self.central_widget = QWidget()
-        self.central_widget.setStyleSheet(f"background-color: {self.bg_color};")
+        set_style_class(self.central_widget, "page")
         self.scroll_area.setWidget(self.central_widget)
         
         # Ana layout
@@ -492,15 +999,13 @@ class UlgenDashboard(QMainWindow):
         # Çoklu sayfa sistemi - Ana ekran ve Dron ekranı için
         self.stacked_widget = QStackedWidget()
         
-        # Ana sayfa oluştur
-        main_page = self.create_main_page()
-        
-        # Dron telemetri sayfası oluştur
-        drone_page = self.create_drone_telemetry_page()
+        # Sayfalar ilk gösterildiklerinde oluşturulur (dron kamerası da o zaman açılır)
+        self.main_page = LazyPage(self.create_main_page)
+        self.drone_page = LazyPage(self.create_drone_telemetry_page)
         
         # Sayfaları stack widget'a ekle
-        self.stacked_widget.addWidget(main_page)  # index 0 - Ana sayfa
-        self.stacked_widget.addWidget(drone_page)  # index 1 - Dron sayfası
+        self.stacked_widget.addWidget(self.main_page)  # index 0 - Ana sayfa
+        self.stacked_widget.addWidget(self.drone_page)  # index 1 - Dron sayfası
         
         main_layout.addWidget(self.stacked_widget, 1)
         
@@ -510,10 +1015,11 @@ class UlgenDashboard(QMainWindow):
         # Resize olayını özelleştir - responsive davranış için
         self.resizeEvent = self.on_resize
     
+    @traced
     def create_main_page(self):
         """Ana sayfa içeriğini oluşturur"""
         page = QWidget()
-        page.setStyleSheet(f"background-color: {self.bg_color};")
+        set_style_class(page, "page")
         
         content_layout = QVBoxLayout(page)
         content_layout.setContentsMargins(24, 24, 24, 24)
@@ -528,37 +1034,30 @@ class UlgenDashboard(QMainWindow):
         
         # SOL: Video kartı (büyük, 2 satır) - BORDER YOK
         video_card = ResponsiveCard()
-        video_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(video_card, "card")
         
         video_layout = QVBoxLayout()
         
         video_title = QLabel("Live Video Feed")
         video_title.setFont(QFont(self.font_family, 14, QFont.Bold))
-        video_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(video_title, "text")
         
         # Doğru tema rengiyle video widget oluştur
         self.video_widget = VideoFeedWidget(bg_color=self.card_color)
         
         # Durum çubuğu - BORDER YOK
         status_container = QFrame()
-        status_container.setStyleSheet(f"""
-            background: {self.card_color};
-            border: none;
-        """)
+        set_style_class(status_container, "card")
         status_layout = QHBoxLayout(status_container)
         status_layout.setContentsMargins(0, 8, 0, 0)
         
         status_icon = QLabel("🟢")
-        status_text = QLabel("System idle - Waiting for processing command")
-        status_text.setFont(QFont(self.font_family, 11))
-        status_text.setStyleSheet(f"color: {self.text_secondary};")
+        self.status_text = QLabel("System idle - Waiting for processing command")
+        self.status_text.setFont(QFont(self.font_family, 11))
+        set_style_class(self.status_text, "textSecondary")
         
         status_layout.addWidget(status_icon)
-        status_layout.addWidget(status_text, 1)
+        status_layout.addWidget(self.status_text, 1)
         
         video_layout.addWidget(video_title)
         video_layout.addWidget(self.video_widget, 1)  # 1 = stretch faktörü
@@ -569,42 +1068,41 @@ class UlgenDashboard(QMainWindow):
         
         # SAĞ ÜST: Data kartı - BORDER YOK
         data_card = ResponsiveCard()
-        data_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(data_card, "card")
         
         data_layout = QVBoxLayout()
         
         data_title = QLabel("Image Analysis")
         data_title.setFont(QFont(self.font_family, 14, QFont.Bold))
-        data_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(data_title, "text")
         
         accuracy_container = QHBoxLayout()
         accuracy_label = QLabel("Accuracy Rate:")
         accuracy_label.setFont(QFont(self.font_family, 12))
-        accuracy_label.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(accuracy_label, "text")
         
-        accuracy_value = QLabel("10%")
-        accuracy_value.setFont(QFont(self.font_family, 12, QFont.Bold))
-        accuracy_value.setStyleSheet(f"color: {self.accent_color}")
+        # Son analizdeki tespitlerin ortalama güven skoru
+        self.accuracy_value = QLabel("--")
+        self.accuracy_value.setFont(QFont(self.font_family, 12, QFont.Bold))
+        set_style_class(self.accuracy_value, "textAccent")
         
         accuracy_container.addWidget(accuracy_label)
-        accuracy_container.addWidget(accuracy_value)
+        accuracy_container.addWidget(self.accuracy_value)
         accuracy_container.addStretch()
         
         task_layout = QVBoxLayout()
-        current_task = QLabel(f"Current Task: <b>none</b>")
-        current_task.setFont(QFont(self.font_family, 11))
-        current_task.setStyleSheet(f"color: {self.text_secondary};")
+        self.current_task_label = QLabel()
+        self.current_task_label.setFont(QFont(self.font_family, 11))
+        set_style_class(self.current_task_label, "textSecondary")
+        self.set_current_task("none")
         
-        epochs_label = QLabel(f"Epochs Available: <span style='color:{self.accent_color}'><b>false</b></span>")
-        epochs_label.setFont(QFont(self.font_family, 11))
-        epochs_label.setStyleSheet(f"color: {self.text_secondary};")
+        self.epochs_label = QLabel()
+        self.epochs_label.setFont(QFont(self.font_family, 11))
+        set_style_class(self.epochs_label, "textSecondary")
+        self.update_epochs_label()
         
-        task_layout.addWidget(current_task)
-        task_layout.addWidget(epochs_label)
+        task_layout.addWidget(self.current_task_label)
+        task_layout.addWidget(self.epochs_label)
         
         data_layout.addWidget(data_title)
         data_layout.addLayout(accuracy_container)
@@ -617,17 +1115,13 @@ class UlgenDashboard(QMainWindow):
         
         # SAĞ ALT: Datasets kartı - BORDER YOK
         datasets_card = ResponsiveCard()
-        datasets_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(datasets_card, "card")
         
         datasets_layout = QVBoxLayout()
         
         datasets_title = QLabel("DATASETS")
         datasets_title.setFont(QFont(self.font_family, 14, QFont.Bold))
-        datasets_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(datasets_title, "text")
         
         params_grid = QGridLayout()
         params_grid.setHorizontalSpacing(12)
@@ -637,45 +1131,44 @@ class UlgenDashboard(QMainWindow):
         params = [
             ("Mode", "Performance", "⚡"),
             ("Intake", "Neutral", "📥"),
-            ("Frequency", "10.7Hz", "🔄")
+            ("Frequency", "-- Hz", "🔄")  # Kameranın ölçülen kare hızı ile güncellenir
         ]
         
         row = 0
         for label, value, icon in params:
             icon_label = QLabel(icon)
             icon_label.setFont(QFont(self.font_family, 16))
-            icon_label.setStyleSheet("border: none;")
             
             name_label = QLabel(f"{label}:")
             name_label.setFont(QFont(self.font_family, 11))
-            name_label.setStyleSheet(f"color: {self.text_secondary}; border: none;")
+            set_style_class(name_label, "textSecondary")
             
             value_label = QLabel(f"<b>{value}</b>")
             value_label.setFont(QFont(self.font_family, 11))
-            value_label.setStyleSheet(f"color: {self.text_color}; border: none;")
+            set_style_class(value_label, "text")
             
             params_grid.addWidget(icon_label, row, 0)
             params_grid.addWidget(name_label, row, 1)
             params_grid.addWidget(value_label, row, 2)
             row += 1
+            
+            if label == "Frequency":
+                self.frequency_value = value_label
+        
+        self.video_widget.fps_changed.connect(self.update_frequency)
+        self.video_widget.frame_received.connect(self.submit_live_frame)
         
         # Source box - Koyu tema uyumlu ve Border YOK
         source_box = QFrame()
-        source_box.setStyleSheet(f"""
-            background: {self.bg_color};
-            border-radius: {self.radius};
-            border: none;
-            padding: 6px;
-        """)
+        set_style_class(source_box, "sourceBox")
         
         source_layout = QHBoxLayout(source_box)
         source_icon = QLabel("🔗")
         source_icon.setFont(QFont(self.font_family, 16))
-        source_icon.setStyleSheet("border: none;")
         
         source_text = QLabel("<b>SOURCES</b><br>ACTIVE")
         source_text.setFont(QFont(self.font_family, 11))
-        source_text.setStyleSheet(f"color: {self.text_color}; border: none;")
+        set_style_class(source_text, "text")
         
         source_layout.addWidget(source_icon)
         source_layout.addWidget(source_text)
@@ -692,122 +1185,61 @@ class UlgenDashboard(QMainWindow):
         
         # SAĞ: Analiz kartı - BORDER YOK
         analyze_card = ResponsiveCard()
-        analyze_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(analyze_card, "card")
         
         analyze_layout = QVBoxLayout()
         
         analyze_title = QLabel("Image Analysis")
         analyze_title.setFont(QFont(self.font_family, 14, QFont.Bold))
-        analyze_title.setStyleSheet(f"color: {self.text_color}; border: none;")
+        set_style_class(analyze_title, "text")
         
         # Tema uyumlu önizleme alanı (koyu temada siyah, açık temada açık mavi)
-        preview_img = QLabel()
-        preview_img.setPixmap(QPixmap(320, 160))
-        preview_img.setStyleSheet(f"""
-            background: {self.preview_bg}; 
-            border-radius: {self.radius};
-            border: none;
-        """)
-        preview_img.setMinimumHeight(160)
-        preview_img.setAlignment(Qt.AlignCenter)
-        preview_img.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Analiz sonucu (kare + tespit kutuları) burada gösterilir
+        self.preview_img = QLabel()
+        self.preview_img.setPixmap(QPixmap(320, 160))
+        set_style_class(self.preview_img, "preview")
+        self.preview_img.setMinimumHeight(160)
+        self.preview_img.setAlignment(Qt.AlignCenter)
+        self.preview_img.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         # Butonlar - gradient'ler tema değişimine uygun hale getirildi
         eject_btn = QPushButton("⏏ Eject")
         eject_btn.setCursor(Qt.PointingHandCursor)
-        eject_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #d500f9, stop:1 #448aff);
-                color: white; 
-                border-radius: {self.radius}; 
-                font-weight: bold;
-                padding: 12px;
-                font-size: 13px;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #448aff, stop:1 #d500f9);
-            }}
-        """)
+        set_style_class(eject_btn, "ejectButton")
         
         # Alt buton grubu
         button_row = QHBoxLayout()
         button_row.setSpacing(8)
         
         # Buton oluşturma fonksiyonu - koyu tema desteği eklendi, borderlar kaldırıldı
-        def create_button(text, icon, hover_gradient):
+        def create_button(text, icon, name):
             btn = QPushButton(f"{icon} {text}")
             btn.setCursor(Qt.PointingHandCursor)
             
-            # Tema uyumlu buton renkleri
-            bg_color = "#333333" if self.theme_manager.get_theme() == "dark" else "#ede7f6"
-            text_color = "white" if self.theme_manager.get_theme() == "dark" else "#673ab7"
-            
-            btn.setStyleSheet(f"""
-                                QPushButton {{
-                    background: {bg_color};
-                    color: {text_color}; 
-                    border-radius: {self.radius}; 
-                    font-weight: bold;
-                    padding: 8px 12px;
-                    font-size: 13px;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background: {hover_gradient};
-                    color: white;
-                }}
-            """)
+            # Tema uyumlu renkler toolButton sınıfından, hover gradient'i nesne adından gelir
+            btn.setObjectName(name)
+            set_style_class(btn, "toolButton")
             return btn
         
-        upload_btn = create_button(
-            "Upload", "⏫", 
-            "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7c4dff, stop:1 #536dfe)"
-        )
-        
-        cnn_btn = create_button(
-            "CNN", "🔎", 
-            "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00897b, stop:1 #43a047)"
-        )
-        
-        settings_btn = create_button(
-            "", "⚙", 
-            "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ffd600, stop:1 #ffc107)"
-        )
+        upload_btn = create_button("Upload", "⏫", "uploadButton")
+        self.cnn_btn = create_button("CNN", "🔎", "cnnButton")
+        self.cnn_btn.setCheckable(True)  # Açıkken canlı görüntü sürekli analiz edilir
+        self.cnn_btn.toggled.connect(self.set_live_inference)
+        settings_btn = create_button("", "⚙", "settingsButton")
         settings_btn.setFixedWidth(42)
         
         button_row.addWidget(upload_btn)
-        button_row.addWidget(cnn_btn)
+        button_row.addWidget(self.cnn_btn)
         button_row.addWidget(settings_btn)
         
         # Analiz butonu
         analyze_btn = QPushButton("▶  Analyze Image")
         analyze_btn.setCursor(Qt.PointingHandCursor)
-        analyze_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #d500f9, stop:1 #2979ff);
-                color: white; 
-                border-radius: {self.radius}; 
-                font-weight: bold;
-                padding: 14px 24px;
-                font-size: 15px;
-                margin-top: 12px;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2979ff, stop:1 #d500f9);
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #aa00ff, stop:1 #2962ff);
-            }}
-        """)
+        set_style_class(analyze_btn, "analyzeButton")
+        analyze_btn.clicked.connect(self.analyze_image)
         
         analyze_layout.addWidget(analyze_title)
-        analyze_layout.addWidget(preview_img, 1)  # 1 = stretch
+        analyze_layout.addWidget(self.preview_img, 1)  # 1 = stretch
         analyze_layout.addWidget(eject_btn)
         analyze_layout.addLayout(button_row)
         analyze_layout.addWidget(analyze_btn)
@@ -824,12 +1256,7 @@ class UlgenDashboard(QMainWindow):
         
         # Alt bildirim bar - BORDER YOK
         issue_card = QFrame()
-        issue_card.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ff8373, stop:1 #ffd600); 
-            color: white; 
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(issue_card, "issueBar")
         issue_card.setFixedHeight(36)
         
         issue_layout = QHBoxLayout(issue_card)
@@ -837,16 +1264,13 @@ class UlgenDashboard(QMainWindow):
         
         issue_icon = QLabel("⚠️")
         issue_icon.setFont(QFont(self.font_family, 14))
-        issue_icon.setStyleSheet("border: none;")
         
         issue_text = QLabel("1 Issue Detected")
         issue_text.setFont(QFont(self.font_family, 12, QFont.Bold))
-        issue_text.setStyleSheet("border: none;")
         
         close_btn = QLabel("❌")
         close_btn.setFont(QFont(self.font_family, 14))
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("border: none;")
         
         issue_layout.addWidget(issue_icon)
         issue_layout.addWidget(issue_text)
@@ -857,10 +1281,11 @@ class UlgenDashboard(QMainWindow):
         
         return page
     
+    @traced
     def create_drone_telemetry_page(self):
         """Dron telemetri sayfasını oluşturur"""
         page = QWidget()
-        page.setStyleSheet(f"background-color: {self.bg_color};")
+        set_style_class(page, "page")
         
         layout = QVBoxLayout(page)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -869,17 +1294,18 @@ class UlgenDashboard(QMainWindow):
         header = QHBoxLayout()
         title = QLabel("ÜLGEN DRONE TELEMETRY")
         title.setFont(QFont(self.font_family, 22, QFont.Bold))
-        title.setStyleSheet(f"color: {self.primary_color};")
+        set_style_class(title, "textPrimary")
         
         header.addWidget(title)
         header.addStretch()
         
         # Durum göstergesi
-        status_label = QLabel("🟢 Online - Aktif Uçuş")
-        status_label.setFont(QFont(self.font_family, 14))
-        status_label.setStyleSheet(f"color: {self.success_color};")
+        self.drone_status_label = QLabel("🟢 Online - Aktif Uçuş")
+        self.drone_status_label.setFont(QFont(self.font_family, 14))
+        set_style_class(self.drone_status_label, "textSuccess")
+        self.update_drone_status()
         
-        header.addWidget(status_label)
+        header.addWidget(self.drone_status_label)
         
         layout.addLayout(header)
         layout.addSpacing(20)
@@ -890,17 +1316,13 @@ class UlgenDashboard(QMainWindow):
         
         # SOL ÜST: Drone Yükseklik ve Hız Göstergesi
         flight_data_card = ResponsiveCard()
-        flight_data_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(flight_data_card, "card")
         
         flight_layout = QVBoxLayout()
         
         flight_title = QLabel("Uçuş Verileri")
         flight_title.setFont(QFont(self.font_family, 16, QFont.Bold))
-        flight_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(flight_title, "text")
         
         # Yükseklik ve Hız LCD göstergeleri
         data_grid = QGridLayout()
@@ -909,32 +1331,24 @@ class UlgenDashboard(QMainWindow):
         # Yükseklik
         altitude_label = QLabel("Yükseklik (m)")
         altitude_label.setFont(QFont(self.font_family, 12))
-        altitude_label.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(altitude_label, "text")
         
         self.altitude_lcd = QLCDNumber()
         self.altitude_lcd.setDigitCount(5)  # 123.4 için 5 hane
         self.altitude_lcd.setSegmentStyle(QLCDNumber.Flat)
-        self.altitude_lcd.setStyleSheet(f"""
-            background: {self.bg_color};
-            color: {self.primary_color};
-            border: none;
-        """)
+        set_style_class(self.altitude_lcd, "lcd")
         self.altitude_lcd.setMinimumHeight(60)
         self.altitude_lcd.display("123.4")
         
         # Hız
         speed_label = QLabel("Hız (km/s)")
         speed_label.setFont(QFont(self.font_family, 12))
-        speed_label.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(speed_label, "text")
         
         self.speed_lcd = QLCDNumber()
         self.speed_lcd.setDigitCount(5)  # 45.6 için 5 hane
         self.speed_lcd.setSegmentStyle(QLCDNumber.Flat)
-        self.speed_lcd.setStyleSheet(f"""
-            background: {self.bg_color};
-            color: {self.info_color};
-            border: none;
-        """)
+        set_style_class(self.speed_lcd, "lcd", "textInfo")
         self.speed_lcd.setMinimumHeight(60)
         self.speed_lcd.display("45.6")
         
@@ -950,50 +1364,28 @@ class UlgenDashboard(QMainWindow):
         # Batarya
         battery_label = QLabel("Batarya")
         battery_label.setFont(QFont(self.font_family, 12))
-        battery_label.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(battery_label, "text")
         
         self.battery_progress = QProgressBar()
         self.battery_progress.setRange(0, 100)
         self.battery_progress.setValue(80)
         self.battery_progress.setTextVisible(True)
         self.battery_progress.setFormat("%p%")
-        self.battery_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background: {self.bg_color};
-                border: none;
-                border-radius: 5px;
-                text-align: center;
-                height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #43a047, stop:1 #66bb6a);
-                border-radius: 5px;
-            }}
-        """)
+        self.battery_progress.setObjectName("batteryBar")
+        set_style_class(self.battery_progress, "levelBar")
         
         # Sinyal
         signal_label = QLabel("Sinyal Gücü")
         signal_label.setFont(QFont(self.font_family, 12))
-        signal_label.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(signal_label, "text")
         
         self.signal_progress = QProgressBar()
         self.signal_progress.setRange(0, 100)
         self.signal_progress.setValue(90)
         self.signal_progress.setTextVisible(True)
         self.signal_progress.setFormat("%p%")
-        self.signal_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background: {self.bg_color};
-                border: none;
-                border-radius: 5px;
-                text-align: center;
-                height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #1976d2, stop:1 #42a5f5);
-                border-radius: 5px;
-            }}
-        """)
+        self.signal_progress.setObjectName("signalBar")
+        set_style_class(self.signal_progress, "levelBar")
         
         status_grid.addWidget(battery_label, 0, 0)
         status_grid.addWidget(self.battery_progress, 1, 0)
@@ -1012,20 +1404,21 @@ class UlgenDashboard(QMainWindow):
         
         # SOL ALT: Video Feed
         video_card = ResponsiveCard()
-        video_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(video_card, "card")
         
         video_layout = QVBoxLayout()
         video_title = QLabel("Drone Kamera")
         video_title.setFont(QFont(self.font_family, 16, QFont.Bold))
-        video_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(video_title, "text")
         
         # Video widget (ana sayfadaki ile aynı video widget'ı kullanabilirsiniz)
         drone_video = VideoFeedWidget(bg_color=self.card_color)
         drone_video.camera_selector.setCurrentIndex(1)  # Dron kamerasını seç
+        drone_video.frame_received.connect(self.submit_live_frame)
+        if self.recorder is not None and self.recorder.record_video:
+            drone_video.frame_received.connect(self.recorder.record_frame)
+        if self.replay is not None:
+            drone_video.set_replay(self.replay)
         
         video_layout.addWidget(video_title)
         video_layout.addWidget(drone_video, 1)
@@ -1035,28 +1428,24 @@ class UlgenDashboard(QMainWindow):
         
         # ORTA: Yapay Ufuk ve Tırmanma Göstergesi
         instruments_card = ResponsiveCard()
-        instruments_card.setStyleSheet(f"""
-            background: {self.card_color};
-            border-radius: {self.radius};
-            border: none;
-        """)
+        set_style_class(instruments_card, "card")
         
         instruments_layout = QVBoxLayout()
         instruments_title = QLabel("Uçuş Enstrümanları")
         instruments_title.setFont(QFont(self.font_family, 16, QFont.Bold))
-        instruments_title.setStyleSheet(f"color: {self.text_color};")
+        set_style_class(instruments_title, "text")
         
         # Yapay ufuk ve tırmanma göstergeleri
         gauges_layout = QHBoxLayout()
         
         # Yapay ufuk göstergesi
-        artificial_horizon = ArtificialHorizon()
+        self.artificial_horizon = ArtificialHorizon()
         
         # Tırmanma hızı göstergesi
-        climb_indicator = ClimbIndicator()
+        self.climb_indicator = ClimbIndicator()
         
-        gauges_layout.addWidget(artificial_horizon, 3)  # 3:1 oranında daha geniş
-        gauges_layout.addWidget(climb_indicator, 1)
+        gauges_layout.addWidget(self.artificial_horizon, 3)  # 3:1 oranında daha geniş
+        gauges_layout.addWidget(self.climb_indicator, 1)
         
         instruments_layout.addWidget(instruments_title)
         instruments_layout.addSpacing(10)
@@ -1065,6 +1454,55 @@ class UlgenDashboard(QMainWindow):
         instruments_card.add_layout(instruments_layout)
         telemetry_grid.addWidget(instruments_card, 0, 3, 2, 3)
         
+        # ALT: Yüksek hızlı grafik ve son 60 saniyenin trendleri (telemetri geçmişinden)
+        trends_card = ResponsiveCard()
+        trends_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)  # Sadece grafik yüksekliği kadar
+        set_style_class(trends_card, "card")
+        
+        trends_layout = QVBoxLayout()
+        trends_header = QHBoxLayout()
+        trends_title = QLabel("Trendler")
+        trends_title.setFont(QFont(self.font_family, 16, QFont.Bold))
+        set_style_class(trends_title, "text")
+        
+        # Yüksek hızlı grafikte gösterilecek kanal (son 5 dakikanın ham örnekleri)
+        self.plot_channel_selector = QComboBox()
+        set_style_class(self.plot_channel_selector, "cameraSelector")
+        trends_header.addWidget(trends_title)
+        trends_header.addStretch()
+        trends_header.addWidget(QLabel("Grafik (son 5 dk):"))
+        trends_header.addWidget(self.plot_channel_selector)
+        
+        sparklines_layout = QHBoxLayout()
+        sparklines_layout.setSpacing(12)
+        for channel, name, unit in (("altitude", "Yükseklik", "m"), ("speed", "Hız", "km/s"),
+                                    ("battery", "Batarya", "%"), ("signal", "Sinyal", "%"),
+                                    ("roll", "Yatış", "°"), ("pitch", "Yunuslama", "°"),
+                                    ("climb_rate", "Tırmanma", "ft/min")):
+            sparkline = TrendSparkline(channel, name, unit, window=60)
+            set_style_class(sparkline, "text")
+            sparkline.set_history(self.history)
+            sparklines_layout.addWidget(sparkline)
+            self.plot_channel_selector.addItem(name, (channel, unit))
+        self.plot_channel_selector.currentIndexChanged.connect(self.change_plot_channel)
+        
+        # Grafik numpy'ye bağlı; arka plan modülleri yüklenene kadar yer tutucu durur
+        self.telemetry_plot = None
+        self.plot_placeholder = QLabel("Grafik yükleniyor…")
+        self.plot_placeholder.setAlignment(Qt.AlignCenter)
+        self.plot_placeholder.setMinimumHeight(140)
+        set_style_class(self.plot_placeholder, "textSecondary")
+        
+        trends_layout.addLayout(trends_header)
+        trends_layout.addWidget(self.plot_placeholder)
+        trends_layout.addLayout(sparklines_layout)
+        self.plot_layout = trends_layout
+        if self.history is not None:
+            self.add_telemetry_plot()
+        
+        trends_card.add_layout(trends_layout)
+        telemetry_grid.addWidget(trends_card, 2, 0, 1, 6)
+        
         # Grid'i layout'a ekle
         layout.addLayout(telemetry_grid, 1)
         
@@ -1074,62 +1512,50 @@ class UlgenDashboard(QMainWindow):
         back_btn = QPushButton("◀ Ana Sayfaya Dön")
         back_btn.setFont(QFont(self.font_family, 12, QFont.Bold))
         back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {self.bg_color};
-                color: {self.text_color};
-                border: 1px solid {self.card_border};
-                border-radius: {self.radius};
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background: {self.card_border};
-            }}
-        """)
+        set_style_class(back_btn, "outlineButton")
         back_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
         
         takeoff_btn = QPushButton("▲ Kalkış")
         takeoff_btn.setFont(QFont(self.font_family, 12, QFont.Bold))
         takeoff_btn.setCursor(Qt.PointingHandCursor)
-        takeoff_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #66bb6a, stop:1 #43a047);
-                color: white;
-                border: none;
-                border-radius: {self.radius};
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #43a047, stop:1 #2e7d32);
-            }}
-        """)
+        set_style_class(takeoff_btn, "takeoffButton")
+        takeoff_btn.clicked.connect(lambda: self.send_command("takeoff"))
         
         land_btn = QPushButton("▼ İniş")
         land_btn.setFont(QFont(self.font_family, 12, QFont.Bold))
         land_btn.setCursor(Qt.PointingHandCursor)
-        land_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ef5350, stop:1 #e53935);
-                color: white;
-                border: none;
-                border-radius: {self.radius};
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e53935, stop:1 #c62828);
-            }}
-        """)
+        set_style_class(land_btn, "landButton")
+        land_btn.clicked.connect(lambda: self.send_command("land"))
+        
+        # Son komutun sonucu ve yukarı bağlantının gidiş-dönüş süresi
+        self.uplink_label = QLabel()
+        self.uplink_label.setFont(QFont(self.font_family, 12))
+        self.set_uplink_status(*self.uplink_status)
         
         control_layout.addWidget(back_btn)
         control_layout.addStretch()
+        control_layout.addWidget(self.uplink_label)
+        control_layout.addSpacing(12)
         control_layout.addWidget(takeoff_btn)
         control_layout.addWidget(land_btn)
         
         layout.addSpacing(15)
         layout.addLayout(control_layout)
         
+        # Sayfa sonradan oluşturulduysa göstergeler veri yolundaki son değerlerle açılır
+        self.apply_telemetry(self.telemetry_bus.values)
+        
         return page
     
+    def changeEvent(self, event):
+        """Pencere simge durumuna küçültülünce video ve göstergeleri askıya alır"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            for widget in self.findChildren(VideoFeedWidget):
+                widget.update_activity()
+            # Simge durumundayken göstergeler tazelenmez, son değerler veri yolunda bekler
+            self.telemetry_bus.set_active(not self.isMinimized())
+    
     def on_resize(self, event):
         """Pencere boyutlandırıldığında responsive davranış için çağrılır"""
         width = event.size().width()
@@ -1152,14 +1578,12 @@ class UlgenDashboard(QMainWindow):
         # Bu metod geniş ekranlarda arayüz ayarlamaları yapabilir
         pass
     
+    @traced
     def create_side_menu(self):
         """Sol kenar menüsü oluşturur"""
         menu_widget = QWidget()
         menu_widget.setFixedWidth(80)
-        menu_widget.setStyleSheet(f"""
-            background: {self.bg_color}; 
-            border-right: 1px solid {self.card_border};
-        """)
+        set_style_class(menu_widget, "sideMenu")
         
         side_menu = QVBoxLayout(menu_widget)
         side_menu.setContentsMargins(0, 20, 0, 20)
@@ -1167,21 +1591,21 @@ class UlgenDashboard(QMainWindow):
         side_menu.setAlignment(Qt.AlignHCenter)
         
         # Dron butonu - Ana sayfaya yönlendirir
-        drone_btn = make_icon_button("🛸", self.primary_color, self.bg_color)
+        drone_btn = make_icon_button("🛸", "textPrimary")
         drone_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
         
         # Diğer menü butonları
         side_menu.addWidget(drone_btn)
-        side_menu.addWidget(make_icon_button("🟦", self.gray_color, self.bg_color))
-        side_menu.addWidget(make_icon_button("📡", self.accent_color, self.bg_color))
-        side_menu.addWidget(make_icon_button("🛞", self.info_color, self.bg_color))
+        side_menu.addWidget(make_icon_button("🟦", "textGray"))
+        side_menu.addWidget(make_icon_button("📡", "textAccent"))
+        side_menu.addWidget(make_icon_button("🛞", "textInfo"))
         side_menu.addStretch()
         
                 # Alt menü butonları
-        power_btn = make_icon_button("🔋", self.primary_color, self.bg_color)
+        power_btn = make_icon_button("🔋", "textPrimary")
         
         # Tema değiştirme butonu
-        theme_btn = make_icon_button("🎨", self.gray_color, self.bg_color)
+        theme_btn = make_icon_button("🎨", "textGray")
         theme_btn.setContextMenuPolicy(Qt.CustomContextMenu)
         theme_btn.customContextMenuRequested.connect(self.show_theme_menu)
         theme_btn.clicked.connect(self.show_theme_menu_from_click)
@@ -1202,24 +1626,6 @@ class UlgenDashboard(QMainWindow):
     def show_theme_menu(self, position=None):
         """Tema değiştirme menüsünü göster"""
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {self.card_color};
-                color: {self.text_color};
-                border: 1px solid {self.card_border};
-                border-radius: {self.radius};
-                padding: 5px;
-            }}
-            QMenu::item {{
-                padding: 5px 25px 5px 25px;
-                border-radius: 3px;
-                border: none;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.accent_color};
-                color: white;
-            }}
-        """)
         
         # Tema seçenekleri
         system_action = QAction("System Theme", self)
@@ -1258,15 +1664,27 @@ class UlgenDashboard(QMainWindow):
         """Tema değiştirme işlemini yap ve UI'yi güncelle"""
         if self.theme_manager.current_theme != theme:
             self.theme_manager.set_theme(theme)
-            # Temayı uygula
             self.detect_platform()  # Renkleri yeniden çek
-            self.apply_platform_theme()  # Temayı uygula
-            
-            # UI'yi yeniden oluştur
-            self.central_widget.deleteLater()
-            self.scroll_area.deleteLater()
-            self.init_ui()
+            self.apply_theme()
+    
+    def apply_theme(self):
+        """Mevcut widget ağacını yeni renklerle yerinde yeniden stillendirir
+        
+        Sayfalar, kameralar ve göstergeler yeniden oluşturulmaz; sadece
+        derlenmiş uygulama stili değişir.
+        """
+        self.apply_platform_theme()
+        for video in self.findChildren(VideoFeedWidget):
+            video.set_bg_color(self.card_color)
+        self.update_epochs_label()
+    
+    def update_epochs_label(self):
+        if not hasattr(self, 'epochs_label'):
+            return
+        self.epochs_label.setText(
+            f"Epochs Available: <span style='color:{self.accent_color}'><b>false</b></span>")
     
+    @traced
     def create_topbar(self):
         """Üst bilgi çubuğunu oluşturur"""
         top_bar = QHBoxLayout()
@@ -1277,18 +1695,18 @@ class UlgenDashboard(QMainWindow):
         
         cast_icon = QLabel("📡")
         cast_icon.setFont(QFont(self.font_family, 18))
-        cast_icon.setStyleSheet(f"color: {self.gray_color}; border: none;")
+        set_style_class(cast_icon, "textGray")
         
         title_container = QVBoxLayout()
         title_container.setSpacing(2)
         
         logo_label = QLabel("<b>ÜLGEN</b>")
         logo_label.setFont(QFont(self.font_family, 22, QFont.Bold))
-        logo_label.setStyleSheet(f"color: {self.primary_color}; border: none;")
+        set_style_class(logo_label, "textPrimary")
         
         system_label = QLabel(f"Raspberry Pi 5 • {self.platform_name}")
         system_label.setFont(QFont(self.font_family, 10))
-        system_label.setStyleSheet(f"color: {self.text_secondary}; border: none;")
+        set_style_class(system_label, "textSecondary")
         
         title_container.addWidget(logo_label)
         title_container.addWidget(system_label)
@@ -1306,13 +1724,9 @@ class UlgenDashboard(QMainWindow):
         nav_container.setAlignment(Qt.AlignCenter)
         
         # Bilgi kutusu oluşturma fonksiyonu - tema uyumlu, borderlar kaldırıldı
-        def create_info_box(icon, value, label, color):
+        def create_info_box(icon, value, label, color_class):
             frame = QFrame()
-            frame.setStyleSheet(f"""
-                background: {self.card_color};
-                border-radius: {self.radius};
-                border: none;
-            """)
+            set_style_class(frame, "card")
             
             layout = QVBoxLayout(frame)
             layout.setContentsMargins(10, 8, 10, 8)
@@ -1321,16 +1735,15 @@ class UlgenDashboard(QMainWindow):
             icon_label = QLabel(icon)
             icon_label.setFont(QFont(self.font_family, 18))
             icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setStyleSheet("border: none;")
             
             value_label = QLabel(value)
             value_label.setFont(QFont(self.font_family, 14, QFont.Bold))
-            value_label.setStyleSheet(f"color: {color}; border: none;")
+            set_style_class(value_label, color_class)
             value_label.setAlignment(Qt.AlignCenter)
             
             desc_label = QLabel(label)
             desc_label.setFont(QFont(self.font_family, 10))
-            desc_label.setStyleSheet(f"color: {self.text_secondary}; border: none;")
+            set_style_class(desc_label, "textSecondary")
             desc_label.setAlignment(Qt.AlignCenter)
             
             layout.addWidget(icon_label)
@@ -1340,11 +1753,11 @@ class UlgenDashboard(QMainWindow):
             return frame
         
         # Bilgi kutuları - tema uyumlu renklerle
-        temp_box = create_info_box("🌡️", "13%", "Temp", self.primary_color)
-        battery_box = create_info_box("🔋", "73%", "Battery", self.success_color)
-        bearings_box = create_info_box("🔄", "45", "Bearings", self.danger_color)
-        torque_box = create_info_box("🛞", "2500", "Torque", self.accent_color)
-        watt_box = create_info_box("⚡", "10W", "Watt", self.info_color)
+        temp_box = create_info_box("🌡️", "13%", "Temp", "textPrimary")
+        battery_box = create_info_box("🔋", "73%", "Battery", "textSuccess")
+        bearings_box = create_info_box("🔄", "45", "Bearings", "textDanger")
+        torque_box = create_info_box("🛞", "2500", "Torque", "textAccent")
+        watt_box = create_info_box("⚡", "10W", "Watt", "textInfo")
         
         nav_container.addWidget(temp_box)
         nav_container.addWidget(battery_box)
@@ -1357,55 +1770,50 @@ class UlgenDashboard(QMainWindow):
         
         return top_bar
     
+    @traced
     def apply_platform_theme(self):
-        """İşletim sistemine ve seçilen temaya özgü tema ayarlarını uygular"""
-        # Genel stil - tüm border referansları kaldırıldı
-        self.setStyleSheet(f"""
-            QMainWindow {{ 
-                background: {self.bg_color}; 
-            }}
-            QLabel {{ 
-                color: {self.text_color}; 
-                font-family: {self.font_family};
-                border: none;
-            }}
-            QPushButton {{
-                font-family: {self.font_family};
-                font-weight: bold;
-                border: none;
-            }}
-            QScrollArea {{
-                border: none;
-                background: transparent;
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {self.card_border};
-                width: 8px;
-                margin: 0px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {self.gray_color};
-                min-height: 20px;
-                border-radius: 4px;
-            }}
-            QWidget {{
-                font-family: {self.font_family};
-                border: none;
-            }}
-            QFrame {{
-                border: none;
-            }}
-            QLCDNumber {{
-                border: none;
-                color: {self.primary_color};
-            }}
-        """)
+        """İşletim sistemine ve seçilen temaya özgü derlenmiş stili pencereye uygular
+        
+        Widget'lar kendi stil sayfalarını taşımaz, sadece sınıf etiketi (styleClass)
+        taşır; tek bir setStyleSheet tüm ağacı bir kez yeniden cilalar.
+        """
+        self.setStyleSheet(compile_stylesheet(self.theme_values))
 
 # Ana uygulama
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")  # Tutarlı görünüm için
-    window = UlgenDashboard()
-    window.show()
+    parser = argparse.ArgumentParser(description="ÜLGEN kontrol paneli")
+    parser.add_argument("--telemetry-port",
+                        help="Telemetri seri portu veya URL (ör. /dev/ttyAMA0, socket://localhost:5760, "
+                             "ws://localhost:8765)")
+    parser.add_argument("--baudrate", type=int, help="Telemetri seri port hızı (varsayılan 115200)")
+    parser.add_argument("--command-port",
+                        help="Komut bağlantısı seri portu veya URL (ör. /dev/ttyUSB0, socket://localhost:5761)")
+    parser.add_argument("--command-baudrate", type=int, help="Komut seri port hızı (varsayılan 115200)")
+    parser.add_argument("--camera-url", action="append", default=[], metavar="N=URL",
+                        help="Kamera N yerine ağ akışı aç (ör. 0=http://localhost:8080/cam0.mjpg, tekrarlanabilir)")
+    parser.add_argument("--replay", metavar="SESSION",
+                        help="Kayıtlı uçuş oturumunu oynat (ör. ~/.local/share/ULGEN/flights/20250101-120000)")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="Oynatma hızı, 0.25-16 (varsayılan 1)")
+    parser.add_argument(startup_trace.CLI_FLAG, action="store_true",
+                        help=f"Açılış süresini raporla (veya {startup_trace.ENV_VAR}=1)")
+    args, qt_args = parser.parse_known_args()
+    if args.profile_startup:
+        startup_trace.enable()
+    for item in args.camera_url:
+        camera, _, url = item.partition("=")
+        if not camera.isdigit() or not url:
+            parser.error(f"--camera-url N=URL biçiminde olmalı: {item}")
+        CAMERA_URLS[int(camera)] = url
+    
+    configure_opengl()  # QApplication'dan önce çağrılmalı
+    with span("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+        app.setStyle("Fusion")  # Tutarlı görünüm için
+    with span("UlgenDashboard"):
+        window = UlgenDashboard(telemetry_port=args.telemetry_port, baudrate=args.baudrate,
+                                replay_session=args.replay, replay_speed=args.replay_speed,
+                                command_port=args.command_port, command_baudrate=args.command_baudrate)
+    startup_trace.report_after_first_paint(window)
+    with span("show"):
+        window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,403 @@
+"""Araç simülatörü: fiziksel olarak tutarlı telemetri ve sentetik video üreten ayrı süreç
+
+Gerçek aracın kullandığı taşımalarla yayın yapar; panel donanım varmış gibi bağlanır:
+  * telemetri: TCP üzerinden ham 44 baytlık çerçeveler (--telemetry-port socket://HOST:5760)
+    ve istenirse gömülü WebSocket aracısı (--telemetry-port ws://HOST:8765),
+  * komutlar: TCP komut bağlantısı (--command-port socket://HOST:5761); kalkış ve
+    iniş uçuşu yönlendirir,
+  * video: HTTP üzerinden MJPEG (multipart/x-mixed-replace), kamera başına
+    /cam<N>.mjpg (--camera-url N=http://HOST:8080/camN.mjpg).
+
+Kamera ve seri donanımı olmayan bir CI makinesinde paneli yük altında denemek için:
+    python ui/vehicle_simulator.py --rate 1000 --fps 30 --resolution 1280x720
+"""
+import argparse
+import asyncio
+import math
+import random
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from command_uplink import ACK_ACCEPTED, COMMAND_NAMES, Ack, CommandParser, encode_ack
+from telemetry_handler import TelemetryRecord, encode_record
+from telemetry_transport import TELEMETRY_TOPIC, TelemetryBroker, encode_message
+
+G = 9.81
+M_S_TO_FT_MIN = 196.85
+ACK_REJECTED = 1  # Komut bu durumda uygulanamaz (ör. batarya düşükken kalkış)
+MAX_CLIENT_BUFFER = 256 * 1024  # Yavaş istemcinin tamponu bunu aşarsa veri atlanır
+BOUNDARY = b"frame"
+
+
+class VehicleModel:
+    """Basit çok rotorlu dinamiği
+
+    Yükseklik tırmanma hızının integralidir; tırmanma hızı hedef yüksekliğe
+    oransal komutu birinci dereceden gecikmeyle izler. Yatış ve yunuslama,
+    dönüş ve ivmelenme için gereken açıları sönümlü ikinci dereceden sistem
+    olarak izler (yatış = atan(v·ω/g), yunuslama = -atan(a/g)); üzerine
+    Ornstein-Uhlenbeck türbülansı eklenir. Hız ve dönüş hedefleri belli
+    aralıklarla değişir, aracın evden uzaklaşması dönüşle sınırlanır. Batarya
+    güçle, sinyal mesafeyle azalır.
+    """
+    DEFAULT_ALTITUDE = 50.0  # m, parametresiz kalkışta
+    MAX_CLIMB = 3.0  # m/s
+    MAX_DESCENT = 2.0  # m/s
+    CLIMB_GAIN = 0.4  # 1/s, yükseklik hatasından tırmanma komutuna
+    CLIMB_TAU = 0.8  # s
+    MAX_ACCEL = 2.0  # m/s²
+    ATTITUDE_OMEGA = 6.0  # rad/s, yatış/yunuslama doğal frekansı
+    ATTITUDE_ZETA = 0.7
+    TURBULENCE = 1.5  # derece, türbülansın standart sapması
+    HOME_RADIUS = 300.0  # m, bunun dışında eve doğru dönülür
+
+    def __init__(self, seed=0, airborne=True):
+        self.random = random.Random(seed)
+        self.time = 0.0
+        self.altitude = 0.0
+        self.climb = 0.0
+        self.target_altitude = self.DEFAULT_ALTITUDE if airborne else 0.0
+        self.speed = 0.0  # m/s
+        self.heading = 0.0  # rad
+        self.x = self.y = 0.0
+        self.roll = self.pitch = 0.0
+        self.roll_rate = self.pitch_rate = 0.0
+        self.turbulence = [0.0, 0.0]
+        self.battery = 100.0
+        self.signal = 100.0
+        self.target_speed = 0.0
+        self.turn_rate = 0.0  # rad/s
+        self.next_change = 0.0
+
+    @property
+    def airborne(self):
+        return self.altitude > 0.0 or self.target_altitude > 0.0
+
+    def command(self, name, param):
+        """Komutu uygular; onay durumunu döndürür"""
+        if name == "takeoff":
+            if self.battery < 15.0:
+                return ACK_REJECTED
+            self.target_altitude = param if param > 0 else self.DEFAULT_ALTITUDE
+        elif name == "land":
+            self.target_altitude = 0.0
+        return ACK_ACCEPTED
+
+    def step(self, dt):
+        rng = self.random
+        self.time += dt
+        flying = self.altitude > 1.0 and self.target_altitude > 0.0
+
+        # Dikey: hedef yüksekliğe oransal tırmanma komutu, birinci dereceden gecikme
+        command = min(max(self.CLIMB_GAIN * (self.target_altitude - self.altitude), -self.MAX_DESCENT),
+                      self.MAX_CLIMB)
+        self.climb += (command - self.climb) * min(1.0, dt / self.CLIMB_TAU)
+        self.altitude += self.climb * dt
+        if self.altitude <= 0.0:
+            self.altitude = 0.0
+            self.climb = max(self.climb, 0.0)
+
+        # Yatay: hedef hız ve dönüş belli aralıklarla değişir; iniş/yerde hız sıfıra iner
+        if self.time >= self.next_change:
+            self.target_speed = rng.uniform(3.0, 12.0)
+            self.turn_rate = math.radians(rng.uniform(-12.0, 12.0))
+            self.next_change = self.time + rng.uniform(8.0, 20.0)
+        distance = math.hypot(self.x, self.y)
+        turn_rate = self.turn_rate
+        if distance > self.HOME_RADIUS:
+            # Eve dönen yön ile mevcut yön arasındaki farka göre dön
+            error = math.atan2(-self.y, -self.x) - self.heading
+            error = math.atan2(math.sin(error), math.cos(error))
+            turn_rate = min(max(error, -0.3), 0.3)
+        target_speed = self.target_speed if flying else 0.0
+        if not flying:
+            turn_rate = 0.0
+        accel = min(max((target_speed - self.speed) / 1.5, -self.MAX_ACCEL), self.MAX_ACCEL)
+        self.speed = max(0.0, self.speed + accel * dt)
+        self.heading += turn_rate * dt
+        self.x += self.speed * math.cos(self.heading) * dt
+        self.y += self.speed * math.sin(self.heading) * dt
+
+        # Tutum: dönüş ve ivmelenme için gereken açılar, sönümlü ikinci dereceden izleme
+        roll_target = math.degrees(math.atan(self.speed * turn_rate / G))
+        pitch_target = -math.degrees(math.atan(accel / G))
+        omega, zeta = self.ATTITUDE_OMEGA, self.ATTITUDE_ZETA
+        self.roll_rate += (omega * omega * (roll_target - self.roll) - 2 * zeta * omega * self.roll_rate) * dt
+        self.pitch_rate += (omega * omega * (pitch_target - self.pitch) - 2 * zeta * omega * self.pitch_rate) * dt
+        self.roll += self.roll_rate * dt
+        self.pitch += self.pitch_rate * dt
+        if flying:
+            scale = self.TURBULENCE * math.sqrt(2 * dt)  # 1 s zaman sabitli OU süreci
+            self.turbulence = [value - value * dt + scale * rng.gauss(0.0, 1.0) for value in self.turbulence]
+
+        # Batarya güçle, sinyal evden uzaklıkla azalır
+        power = 0.01 + (0.08 + 0.004 * self.speed + 0.03 * max(self.climb, 0.0) if self.airborne else 0.0)
+        self.battery = max(0.0, self.battery - power * dt)
+        self.signal = min(100.0, max(0.0, 100.0 - distance / 8.0 + rng.gauss(0.0, 0.5)))
+
+    def record(self, seq):
+        roll, pitch = self.roll + self.turbulence[0], self.pitch + self.turbulence[1]
+        return TelemetryRecord(seq, self.time, self.altitude, self.speed * 3.6, self.battery, self.signal,
+                               roll, pitch, self.climb * M_S_TO_FT_MIN)
+
+
+class SyntheticCamera(threading.Thread):
+    """Aracın tutumuna göre ufuk, hareketli zemin ve bilgi yazısı çizen kamera
+
+    Kareler kendi thread'inde çizilir ve JPEG'e sıkıştırılır (OpenCV GIL'i
+    bırakır); hazır kare asyncio döngüsüne call_soon_threadsafe ile verilir.
+    """
+    SKY = (235, 206, 135)  # BGR
+    GROUND = (60, 120, 80)
+    STRIPE = (40, 90, 60)
+    FOV = 60.0  # derece, dikey görüş açısı
+
+    def __init__(self, index, simulator, fps, size, quality):
+        super().__init__(name=f"SyntheticCamera-{index}", daemon=True)
+        self.index = index
+        self.simulator = simulator
+        self.fps = fps
+        self.width, self.height = size
+        self.quality = quality
+        self.image = np.empty((self.height, self.width, 3), np.uint8)
+        self.frames = 0
+        self.encode_time = 0.0  # Son karenin çizim + sıkıştırma süresi (s)
+
+    def render(self, record):
+        image, w, h = self.image, self.width, self.height
+        image[:] = self.SKY
+        # Ufuk yunuslamayla kayar, yatışla döner; kamera 1 numaradan itibaren 20° aşağı bakar
+        tilt = 0.0 if self.index == 0 else 20.0
+        center = h / 2 + (record.pitch - tilt) * h / self.FOV
+        slope = math.tan(math.radians(-record.roll))
+        half = w / 2
+        horizon = [(-w, center - slope * (-w - half)), (2 * w, center - slope * (2 * w - half))]
+        polygon = np.array(horizon + [(2 * w, 3 * h), (-w, 3 * h)], np.int32)
+        cv2.fillConvexPoly(image, polygon, self.GROUND)
+
+        # Zemindeki çizgiler alınan yolla akar (hız hissi)
+        travelled = self.simulator.model.speed * self.simulator.model.time
+        for i in range(1, 8):
+            depth = (i - (travelled / 10.0) % 1.0) / 8.0
+            y = int(center + (h - center) * depth * depth)
+            if 0 <= y < h:
+                cv2.line(image, (0, int(y + slope * half)), (w, int(y - slope * half)), self.STRIPE, 2)
+
+        scale = max(0.4, h / 720)
+        text = (f"CAM{self.index}  #{self.frames}  t={record.timestamp:7.2f}s  ALT {record.altitude:5.1f} m  "
+                f"SPD {record.speed:4.1f} km/h")
+        cv2.putText(image, text, (int(16 * scale), int(40 * scale)), cv2.FONT_HERSHEY_SIMPLEX, 0.8 * scale,
+                    (255, 255, 255), max(1, int(2 * scale)), cv2.LINE_AA)
+        return image
+
+    def run(self):
+        interval = 1.0 / self.fps
+        next_time = time.perf_counter()
+        while self.simulator.running:
+            started = time.perf_counter()
+            image = self.render(self.simulator.latest)
+            ok, jpeg = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+            self.encode_time = time.perf_counter() - started
+            if ok:
+                self.simulator.publish_frame(self.index, jpeg.tobytes())
+            self.frames += 1
+            # Mutlak zamanlama: yavaş bir kare sonrakileri kaydırmaz, geride kalınırsa kare atlanır
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()
+
+
+class VehicleSimulator:
+    """Modeli çalıştıran, telemetri/komut/video sunucularını yöneten asyncio süreci"""
+
+    def __init__(self, args):
+        self.args = args
+        self.model = VehicleModel(args.seed, airborne=not args.wait_for_takeoff)
+        self.latest = self.model.record(0)
+        self.running = True
+        self.loop = None
+        self.telemetry_clients = set()
+        self.video_clients = {}  # kamera -> {writer}
+        self.broker = None
+        self.applied = {}  # Komut id'si -> onay durumu (yeniden denemeler bir kez uygulanır)
+        self.sent = 0
+        self.dropped = 0  # Yavaş istemciler için atlanan telemetri grupları
+        self.dropped_frames = 0
+        self.cameras = []
+
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        args = self.args
+        servers = []
+        if args.telemetry_port:
+            servers.append(await asyncio.start_server(self.serve_telemetry, args.host, args.telemetry_port))
+            print(f"Telemetri: --telemetry-port socket://{args.host}:{args.telemetry_port}")
+        if args.ws_port:
+            self.broker = TelemetryBroker(args.host, args.ws_port)
+            await self.broker.start()
+            print(f"Telemetri (WebSocket): --telemetry-port ws://{args.host}:{args.ws_port}")
+        if args.command_port:
+            servers.append(await asyncio.start_server(self.serve_commands, args.host, args.command_port))
+            print(f"Komutlar: --command-port socket://{args.host}:{args.command_port}")
+        if args.video_port and args.cameras:
+            servers.append(await asyncio.start_server(self.serve_video, args.host, args.video_port))
+            width, height = args.resolution
+            print(f"Video ({args.cameras} kamera, {width}x{height} @ {args.fps:g} fps): " + " ".join(
+                f"--camera-url {i}=http://{args.host}:{args.video_port}/cam{i}.mjpg" for i in range(args.cameras)))
+            self.video_clients = {i: set() for i in range(args.cameras)}
+            self.cameras = [SyntheticCamera(i, self, args.fps, args.resolution, args.quality)
+                            for i in range(args.cameras)]
+            for camera in self.cameras:
+                camera.start()
+
+        try:
+            await self.produce_telemetry()
+        finally:
+            self.running = False
+            for server in servers:
+                server.close()
+            if self.broker is not None:
+                await self.broker.close()
+
+    async def produce_telemetry(self):
+        """Modeli --rate adımında ilerletir; birikmiş kayıtları tek grupta yayınlar"""
+        rate, dt = self.args.rate, 1.0 / self.args.rate
+        start = time.perf_counter()
+        seq = 0
+        report = start + 5.0
+        # Uyanma aralığı ~1 ms; daha düşük hızlarda kayıt başına bir uyanma
+        interval = max(dt, 0.001)
+        while not self.args.duration or time.perf_counter() - start < self.args.duration:
+            await asyncio.sleep(interval)
+            due = int((time.perf_counter() - start) * rate)
+            frames = []
+            while seq < due:
+                self.model.step(dt)
+                seq += 1
+                self.latest = self.model.record(seq)
+                frames.append(encode_record(self.latest))
+            if frames:
+                self.publish_telemetry(b"".join(frames))
+                self.sent += len(frames)
+            if time.perf_counter() >= report:
+                report += 5.0
+                self.print_status()
+
+    def print_status(self):
+        record = self.latest
+        encode = " ".join(f"cam{c.index} {c.encode_time * 1e3:.1f} ms" for c in self.cameras)
+        print(f"t={record.timestamp:6.1f}s alt {record.altitude:5.1f} m hız {record.speed:4.1f} km/h "
+              f"yatış {record.roll:5.1f}° bat {record.battery:5.1f}% · {self.sent} kayıt, "
+              f"{len(self.telemetry_clients)} istemci, atlanan grup {self.dropped}, atlanan kare "
+              f"{self.dropped_frames} {encode}", flush=True)
+
+    def publish_telemetry(self, payload):
+        for writer in list(self.telemetry_clients):
+            # Yetişemeyen istemciye veri yığılmaz; en yeni gruplar gitmeye devam eder
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                self.dropped += 1
+            else:
+                writer.write(payload)
+        if self.broker is not None:
+            self.broker.publish(encode_message(TELEMETRY_TOPIC, payload))
+
+    def publish_frame(self, camera, jpeg):
+        """Kamera thread'inden çağrılır; yazma asyncio döngüsünde yapılır"""
+        if self.loop is not None and self.video_clients.get(camera):
+            self.loop.call_soon_threadsafe(self.write_frame, camera, jpeg)
+
+    def write_frame(self, camera, jpeg):
+        part = b"--%s\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % (BOUNDARY, len(jpeg))
+        for writer in list(self.video_clients[camera]):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                self.dropped_frames += 1
+            else:
+                writer.write(part + jpeg + b"\r\n")
+
+    async def serve_telemetry(self, reader, writer):
+        self.telemetry_clients.add(writer)
+        try:
+            await reader.read()  # İstemci kapatana kadar bekle; gelen veri yok sayılır
+        except OSError:
+            pass
+        finally:
+            self.telemetry_clients.discard(writer)
+            writer.close()
+
+    async def serve_commands(self, reader, writer):
+        parser = CommandParser()
+        try:
+            while data := await reader.read(4096):
+                for command in parser.feed(data):
+                    status = self.applied.get(command.id)
+                    if status is None:
+                        status = self.model.command(COMMAND_NAMES.get(command.code), command.param)
+                        self.applied[command.id] = status
+                        print(f"Komut #{command.id}: {COMMAND_NAMES.get(command.code, command.code)} → "
+                              f"{'kabul' if status == ACK_ACCEPTED else 'ret'}", flush=True)
+                    writer.write(encode_ack(Ack(command.id, status)))
+        except OSError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve_video(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+            writer.close()
+            return
+        path = request.split(b" ", 2)[1].decode("latin-1") if request.count(b" ") >= 2 else ""
+        camera = next((i for i in self.video_clients if path == f"/cam{i}.mjpg"), None)
+        if camera is None:
+            writer.write(b"HTTP/1.0 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+        writer.write(b"HTTP/1.0 200 OK\r\nCache-Control: no-cache\r\n"
+                     b"Content-Type: multipart/x-mixed-replace; boundary=%s\r\n\r\n" % BOUNDARY)
+        self.video_clients[camera].add(writer)
+        try:
+            await reader.read()
+        except OSError:
+            pass
+        finally:
+            self.video_clients[camera].discard(writer)
+            writer.close()
+
+
+def resolution(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ÜLGEN araç simülatörü")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--rate", type=float, default=200.0, help="Telemetri hızı (Hz)")
+    parser.add_argument("--telemetry-port", type=int, default=5760, help="Ham çerçeve TCP portu (0 = kapalı)")
+    parser.add_argument("--ws-port", type=int, default=0, help="Gömülü WebSocket aracısının portu (0 = kapalı)")
+    parser.add_argument("--command-port", type=int, default=5761, help="Komut TCP portu (0 = kapalı)")
+    parser.add_argument("--video-port", type=int, default=8080, help="MJPEG HTTP portu (0 = kapalı)")
+    parser.add_argument("--cameras", type=int, default=2)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--resolution", type=resolution, default=(1280, 720), help="GENİŞLİKxYÜKSEKLİK")
+    parser.add_argument("--quality", type=int, default=80, help="JPEG kalitesi")
+    parser.add_argument("--duration", type=float, default=0.0, help="Çalışma süresi (s, 0 = sınırsız)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--wait-for-takeoff", action="store_true", help="Yerde başla, kalkış komutunu bekle")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(VehicleSimulator(args).run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
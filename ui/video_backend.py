@@ -0,0 +1,90 @@
+import os
+import threading
+from importlib import import_module
+
+from PySide6.QtCore import Qt, QCoreApplication, QObject, QSettings, Signal
+
+from startup_trace import span
+
+
+# Komut satırından verilen kamera adresleri (--camera-url); ayarlardaki video/camera<N>_url'den önce gelir
+CAMERA_URLS = {}
+
+
+def camera_address(source):
+    """Kamera numarasının açılacak adresi: ağ akışı tanımlıysa URL, değilse numaranın kendisi
+
+    Kayıt, oynatma ve kamera seçiciler numarayla çalışmaya devam eder.
+    """
+    url = CAMERA_URLS.get(source) or QSettings("ULGEN", "Dashboard").value(f"video/camera{source}_url", "")
+    return url or source
+
+
+def configure_opengl():
+    """QApplication oluşturulmadan önce OpenGL ayarlarını uygular
+
+    "video/software_gl" açıksa GPU olmayan sistemlerde yazılım rasterlayıcı kullanılır.
+    OpenCV'ye bağlı video_engine'i yüklemeden çağrılabilsin diye burada durur.
+    """
+    settings = QSettings("ULGEN", "Dashboard")
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    if settings.value("video/software_gl", False, type=bool):
+        QCoreApplication.setAttribute(Qt.AA_UseSoftwareOpenGL)  # Windows: opengl32sw
+        os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")  # Mesa: llvmpipe
+
+
+class DeferredModules(QObject):
+    """Ağır modülleri (cv2, numpy ve onlara bağlı olanlar) arka planda içe aktarır
+
+    Pencere bu sırada kurulup çizilebilir; yükleme bitince loaded sinyali
+    kuyruklu bağlantı ile GUI iş parçacığında teslim edilir.
+    """
+    loaded = Signal()
+    failed = Signal(str)
+
+    def __init__(self, *names, parent=None):
+        super().__init__(parent)
+        self.names = names
+        self.modules = {}
+        self.error = None
+        self.done = False
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Yüklemeyi bir kez başlatır; tekrar çağrılması zararsızdır"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="DeferredModules", daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            with span(f"import {', '.join(self.names)} (arka plan)"):
+                modules = {name: import_module(name) for name in self.names}
+        except Exception as e:  # ImportError veya modül içindeki kurulum hatası
+            error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                self.error, self.done = error, True
+                self.failed.emit(error)
+            return
+        with self._lock:
+            self.modules, self.done = modules, True
+            self.loaded.emit()
+
+    def when_loaded(self, on_loaded, on_failed=None):
+        """Modüller hazırsa on_loaded'ı hemen çağırır, değilse yüklenince çağırır
+
+        Kilit, yükleme bitişi ile bağlantı kurulması arasındaki yarışı önler.
+        """
+        with self._lock:
+            if not self.done:
+                self.loaded.connect(on_loaded, Qt.QueuedConnection)
+                if on_failed is not None:
+                    self.failed.connect(on_failed, Qt.QueuedConnection)
+                return
+        if self.error is None:
+            on_loaded()
+        elif on_failed is not None:
+            on_failed(self.error)
@@ -0,0 +1,287 @@
+import cv2
+import numpy as np
+from PySide6.QtCore import Qt, QRectF, QSettings
+from PySide6.QtGui import QColor, QImage, QOpenGLContext, QPainter, QPixmap
+from PySide6.QtWidgets import QLabel
+
+try:
+    from PySide6.QtOpenGL import QOpenGLShader, QOpenGLShaderProgram, QOpenGLTexture, QOpenGLPixelTransferOptions
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt OpenGL modülleri olmayan kurulumlar
+    QOpenGLWidget = None
+
+# Video yüzeyi seçenekleri (QSettings "video/renderer")
+RENDERER_LABEL = "label"
+RENDERER_OPENGL = "opengl"
+
+
+def frame_to_image(frame):
+    """BGR numpy karesini kopyalamadan saran bir QImage döndürür
+
+    QImage karenin belleğini paylaşır; kare yaşadığı sürece geçerlidir.
+    """
+    h, w = frame.shape[:2]
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+
+
+def fit_size(frame_width, frame_height, width, height):
+    """En-boy oranını koruyarak hedef alana sığan boyutu döndürür"""
+    scale = min(width / frame_width, height / frame_height)
+    return max(1, int(frame_width * scale)), max(1, int(frame_height * scale))
+
+
+class FramePresenter:
+    """BGR kareleri cvtColor olmadan, tek ölçekleme ile QPixmap'e dönüştürür"""
+
+    def __init__(self):
+        self._buffer = None  # Ölçeklenmiş kare için yeniden kullanılan tampon
+        self.bytes_copied = 0  # Son karede kopyalanan bayt sayısı
+
+    def present(self, frame, width, height, device_pixel_ratio=1.0):
+        """Kareyi widget'ın fiziksel boyutunda bir QPixmap olarak döndürür"""
+        frame_h, frame_w = frame.shape[:2]
+        target_w, target_h = fit_size(
+            frame_w, frame_h,
+            width * device_pixel_ratio, height * device_pixel_ratio)
+
+        if (target_w, target_h) == (frame_w, frame_h):
+            scaled = frame
+            self.bytes_copied = 0
+        else:
+            # Ölçekleme doğrudan önceden ayrılmış tampona yazılır
+            shape = (target_h, target_w, frame.shape[2])
+            if self._buffer is None or self._buffer.shape != shape:
+                self._buffer = np.empty(shape, dtype=np.uint8)
+            cv2.resize(frame, (target_w, target_h), dst=self._buffer,
+                       interpolation=cv2.INTER_LINEAR)
+            scaled = self._buffer
+            self.bytes_copied = scaled.nbytes
+
+        # Tek kopya: ölçeklenmiş BGR888 görüntü piksel haritasına aktarılır
+        pixmap = QPixmap.fromImage(frame_to_image(scaled))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self.bytes_copied += target_w * target_h * pixmap.depth() // 8
+        return pixmap
+
+
+def set_surface_overlay(surface, overlay):
+    """Kaplamayı yüzeye bağlar; kaplama değişince sadece yüzey yeniden çizilir"""
+    if surface.overlay is not None:
+        surface.overlay.changed.disconnect(surface.update)
+    surface.overlay = overlay
+    if overlay is not None:
+        overlay.changed.connect(surface.update)
+    surface.update()
+
+
+class LabelVideoSurface(QLabel):
+    """Kareleri CPU'da ölçekleyip QLabel üzerinde gösteren video yüzeyi"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.presenter = FramePresenter()
+        self.overlay = None
+
+    def show_frame(self, frame):
+        # BGR kare doğrudan sarılır ve widget'ın fiziksel boyutunda bir kez ölçeklenir
+        pixmap = self.presenter.present(
+            frame, self.width(), self.height(), self.devicePixelRatioF())
+        self.setPixmap(pixmap)
+
+    def set_bg_color(self, color):
+        self.setStyleSheet(f"background-color: {color};")
+
+    def set_overlay(self, overlay):
+        set_surface_overlay(self, overlay)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        pixmap = self.pixmap()
+        if self.overlay is None or pixmap.isNull():
+            return
+        # Kaplama ölçeklenmiş görüntünün ortalandığı alana çizilir, piksel haritasına değil
+        size = pixmap.deviceIndependentSize()
+        area = self.contentsRect()
+        rect = QRectF(area.x() + (area.width() - size.width()) / 2,
+                      area.y() + (area.height() - size.height()) / 2,
+                      size.width(), size.height())
+        painter = QPainter(self)
+        self.overlay.paint(painter, rect)
+        painter.end()
+
+
+_VERTEX_SHADER = """
+attribute highp vec2 position;
+attribute highp vec2 tex_coord;
+varying highp vec2 v_tex_coord;
+void main() {
+    v_tex_coord = tex_coord;
+    gl_Position = vec4(position, 0.0, 1.0);
+}
+"""
+
+# Doku ham BGR baytlarla RGB olarak yüklenir, kanal sırası burada düzeltilir
+_FRAGMENT_SHADER = """
+#ifdef GL_ES
+precision mediump float;
+#endif
+uniform sampler2D frame;
+varying highp vec2 v_tex_coord;
+void main() {
+    gl_FragColor = vec4(texture2D(frame, v_tex_coord).bgr, 1.0);
+}
+"""
+
+# Tam ekran dörtgen (triangle strip) ve doku koordinatları (y ekseni ters)
+_QUAD_POSITIONS = [-1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0]
+_QUAD_TEX_COORDS = [0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0]
+
+_GL_COLOR_BUFFER_BIT = 0x4000
+_GL_TRIANGLE_STRIP = 0x0005
+
+
+if QOpenGLWidget is not None:
+    class GLVideoSurface(QOpenGLWidget):
+        """Ham kareleri dokuya yükleyip ölçeklemeyi GPU'ya bırakan video yüzeyi"""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.bg_color = QColor("#FFFFFF")
+            self.text = ""
+            self.frame = None
+            self.frame_dirty = False
+            self.program = None
+            self.texture = None
+            self.transfer_options = None
+            self.position_loc = -1
+            self.tex_coord_loc = -1
+            self.frame_loc = -1
+            self.overlay = None
+
+        def show_frame(self, frame):
+            self.frame = np.ascontiguousarray(frame)
+            self.frame_dirty = True
+            self.text = ""
+            self.update()
+
+        def setText(self, text):
+            self.text = text
+            self.frame = None
+            self.update()
+
+        def set_bg_color(self, color):
+            self.bg_color = QColor(color)
+            self.update()
+
+        def set_overlay(self, overlay):
+            set_surface_overlay(self, overlay)
+
+        def initializeGL(self):
+            self.program = QOpenGLShaderProgram(self)
+            self.program.addShaderFromSourceCode(QOpenGLShader.Vertex, _VERTEX_SHADER)
+            self.program.addShaderFromSourceCode(QOpenGLShader.Fragment, _FRAGMENT_SHADER)
+            self.program.link()
+            self.position_loc = self.program.attributeLocation("position")
+            self.tex_coord_loc = self.program.attributeLocation("tex_coord")
+            self.frame_loc = self.program.uniformLocation("frame")
+
+            # Satırlar 4 bayta hizalı olmayabilir (ör. 3 x 642 piksel)
+            self.transfer_options = QOpenGLPixelTransferOptions()
+            self.transfer_options.setAlignment(1)
+
+            self.context().aboutToBeDestroyed.connect(self.cleanup_gl)
+
+        def cleanup_gl(self):
+            """GL kaynaklarını bağlam yok edilmeden önce serbest bırakır"""
+            self.makeCurrent()
+            if self.texture is not None:
+                self.texture.destroy()
+                self.texture = None
+            self.frame_dirty = self.frame is not None
+            self.doneCurrent()
+
+        def upload_frame(self):
+            """Karenin ham baytlarını dönüştürmeden dokuya yükler"""
+            h, w = self.frame.shape[:2]
+            if self.texture is None or (self.texture.width(), self.texture.height()) != (w, h):
+                if self.texture is not None:
+                    self.texture.destroy()
+                self.texture = QOpenGLTexture(QOpenGLTexture.Target2D)
+                self.texture.setFormat(QOpenGLTexture.RGB8_UNorm)
+                self.texture.setSize(w, h)
+                self.texture.setMinMagFilters(QOpenGLTexture.Linear, QOpenGLTexture.Linear)
+                self.texture.setWrapMode(QOpenGLTexture.ClampToEdge)
+                self.texture.allocateStorage(QOpenGLTexture.RGB, QOpenGLTexture.UInt8)
+
+            self.texture.setData(QOpenGLTexture.RGB, QOpenGLTexture.UInt8,
+                                 self.frame.ctypes.data, self.transfer_options)
+            self.frame_dirty = False
+
+        def paintGL(self):
+            gl = self.context().functions()
+            gl.glClearColor(self.bg_color.redF(), self.bg_color.greenF(), self.bg_color.blueF(), 1.0)
+            gl.glClear(_GL_COLOR_BUFFER_BIT)
+
+            if self.frame is None:
+                if self.text:
+                    painter = QPainter(self)
+                    painter.drawText(self.rect(), Qt.AlignCenter, self.text)
+                    painter.end()
+                return
+
+            if self.frame_dirty:
+                self.upload_frame()
+
+            # En-boy oranı korunarak ortalanmış görüntü alanı (fiziksel piksel)
+            ratio = self.devicePixelRatioF()
+            view_w, view_h = int(self.width() * ratio), int(self.height() * ratio)
+            frame_h, frame_w = self.frame.shape[:2]
+            fit_w, fit_h = fit_size(frame_w, frame_h, view_w, view_h)
+            gl.glViewport((view_w - fit_w) // 2, (view_h - fit_h) // 2, fit_w, fit_h)
+
+            self.program.bind()
+            self.texture.bind(0)
+            self.program.setUniformValue1i(self.frame_loc, 0)
+            self.program.enableAttributeArray(self.position_loc)
+            self.program.enableAttributeArray(self.tex_coord_loc)
+            self.program.setAttributeArray(self.position_loc, _QUAD_POSITIONS, 2)
+            self.program.setAttributeArray(self.tex_coord_loc, _QUAD_TEX_COORDS, 2)
+            gl.glDrawArrays(_GL_TRIANGLE_STRIP, 0, 4)
+            self.program.disableAttributeArray(self.position_loc)
+            self.program.disableAttributeArray(self.tex_coord_loc)
+            self.texture.release()
+            self.program.release()
+
+            if self.overlay is not None:
+                # QPainter GL çiziminin üstüne, mantıksal piksellerle çizer
+                fit_w, fit_h = fit_size(frame_w, frame_h, self.width(), self.height())
+                rect = QRectF((self.width() - fit_w) / 2, (self.height() - fit_h) / 2, fit_w, fit_h)
+                painter = QPainter(self)
+                self.overlay.paint(painter, rect)
+                painter.end()
+else:
+    GLVideoSurface = None
+
+
+_opengl_available = None
+
+
+def opengl_available():
+    """Bu sistemde bir OpenGL bağlamı oluşturulabiliyorsa True döndürür"""
+    global _opengl_available
+    if _opengl_available is None:
+        _opengl_available = GLVideoSurface is not None and QOpenGLContext().create()
+    return _opengl_available
+
+
+def create_video_surface(renderer=None, parent=None):
+    """İstenen ya da ayarlarda seçili video yüzeyini oluşturur
+
+    OpenGL kullanılamıyorsa QLabel yüzeyine geri düşülür.
+    """
+    if renderer is None:
+        renderer = QSettings("ULGEN", "Dashboard").value("video/renderer", RENDERER_LABEL)
+    if renderer == RENDERER_OPENGL and opengl_available():
+        return GLVideoSurface(parent)
+    return LabelVideoSurface(parent)